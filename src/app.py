@@ -1,32 +1,80 @@
 import sys
 
 from PyQt5.QtWidgets import QApplication
-from window import MainWindow, set_main_window
+from window import MainWindow, set_main_window, DEFAULT_WINDOW_CONFIG_FILE
 
-from twitter_management.authorization import authenticator
-from helpers.logger import log_inf
+from twitter_management.authorization import prefetch_oauth_tokens
+from helpers.logger import log_inf, configure_log_rates_from_env, flush_log_summaries
+from helpers.startup import StartupPlan
 from qt_material import apply_stylesheet
+from storage.profile_store import ProfileStore, DEFAULT_PROFILE_DB, DEFAULT_PROFILE_NAME
 from widgets.login_screen import LoginScreen
+from widgets.splash_screen import SplashScreen, assign_splash_screen, add_to_counter, add_finished
+
+
+def open_profile_store():
+    """Opens the store and loads the active profile, both are handed to the main window."""
+    # The connection is only used by the GUI thread once this stage is done
+    store = ProfileStore(DEFAULT_PROFILE_DB, check_same_thread=False)
+    try:
+        store.migrate_from_ini(DEFAULT_WINDOW_CONFIG_FILE)
+        name = store.get_active_profile() or DEFAULT_PROFILE_NAME
+        profile = store.load_profile(name) if name in store.list_profiles() else None
+    except Exception:
+        store.close()
+        raise
+    return store, profile
 
 
 class App:
     def __init__(self):
+        # Read after the authorization import has loaded .env
+        configure_log_rates_from_env()
         self.__app = QApplication(sys.argv)
         self.__screen = self.__app.primaryScreen()
-        self.main_window = MainWindow(self.__screen)
 
-        set_main_window(self.main_window)
-        apply_stylesheet(self.__app, theme="dark_blue.xml")
-        self.login = LoginScreen(self.__screen)
+        self.splash = SplashScreen()
+        assign_splash_screen(self.splash)
+        self.splash.show()
+
+        plan = StartupPlan(pump=self.__app.processEvents)
+        plan.add_stage("oauth", prefetch_oauth_tokens, background=True, required=False)
+        plan.add_stage("profile", open_profile_store, background=True, required=False)
+        plan.add_stage("stylesheet", self.__apply_stylesheet)
+        plan.add_stage("window", self.__create_main_window, depends=("profile",))
+        plan.add_stage("login", self.__create_login_screen, depends=("window", "stylesheet"))
+
+        add_to_counter(plan.stage_count())
+        plan.run(self.__report_progress)
 
     def __del__(self):
         log_inf("Destroyed app")
 
+    def __apply_stylesheet(self):
+        apply_stylesheet(self.__app, theme="dark_blue.xml")
+
+    def __create_main_window(self, loaded):
+        # The window opens the store itself when the profile stage failed
+        store, profile = loaded if loaded else (None, None)
+        self.main_window = MainWindow(self.__screen, store, profile)
+        set_main_window(self.main_window)
+
+    def __create_login_screen(self, *_):
+        self.login = LoginScreen(self.__screen)
+
+    def __report_progress(self, done, total, name):
+        self.splash.set_stage(f"Loaded {name}")
+        add_finished()
+
     def run(self):
         log_inf("Starting app")
         self.login.show()
+        # Scripts may run for long, they are pre-warmed once the login screen is up
+        self.main_window.prewarm_scripts()
 
-        sys.exit(self.__app.exec_())
+        exit_code = self.__app.exec_()
+        flush_log_summaries()
+        sys.exit(exit_code)
 
     def check_if_login_success(self):
         return self.login
@@ -0,0 +1,67 @@
+import os
+import re
+from collections import deque
+
+DEFAULT_MAX_LINES = 100000
+MAX_READ_BYTES = 4 * 1024 * 1024
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+LEVEL_PATTERN = re.compile(r"^T=\S+ (DEBUG|INFO|WARNING|ERROR) ")
+ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def parse_level(line: str):
+    match = LEVEL_PATTERN.match(line)
+    return match.group(1) if match else None
+
+
+def strip_ansi(line: str):
+    return ANSI_PATTERN.sub("", line)
+
+
+class LogTail:
+    """Reads lines appended to a log file since the last poll.
+
+    Only new bytes are read, a partial last line waits for the next poll and
+    the newest max_lines (level, line) pairs are kept in a ring buffer. A file
+    that shrank, e.g. after the logger truncated it, is read from the start.
+    """
+
+    def __init__(self, file_path: str, max_lines: int = DEFAULT_MAX_LINES):
+        self.__file_path = file_path
+        self.__offset = 0
+        self.__partial = b""
+        self.__last_level = None
+        self.lines = deque(maxlen=max_lines)
+
+    def poll(self):
+        """Returns the new (level, line) pairs, they are also added to lines."""
+        try:
+            size = os.path.getsize(self.__file_path)
+        except OSError:
+            return []
+
+        if size < self.__offset:
+            self.__offset = 0
+            self.__partial = b""
+        if size == self.__offset:
+            return []
+
+        with open(self.__file_path, "rb") as file:
+            file.seek(self.__offset)
+            data = file.read(min(size - self.__offset, MAX_READ_BYTES))
+        self.__offset += len(data)
+
+        chunks = (self.__partial + data).split(b"\n")
+        self.__partial = chunks.pop()
+
+        new_lines = []
+        for chunk in chunks:
+            line = strip_ansi(chunk.decode("utf-8", errors="replace").rstrip("\r"))
+            # Continuation lines of a multi line message keep its level
+            level = parse_level(line) or self.__last_level
+            self.__last_level = level
+            new_lines.append((level, line))
+
+        self.lines.extend(new_lines)
+        return new_lines
@@ -1,13 +1,147 @@
+import contextvars
 import logging
 import time
 import sys
 import os
 import pathlib
+import threading
 from typing import List
 
 DEFAULT_LOG_FILE = "logs/app.log"
 DEFAULT_LOG_COLOR = "INFO"
 DEFAULT_LOG_LEVEL = logging.DEBUG
+DEFAULT_SITE_MAX_MESSAGES = 20
+DEFAULT_SITE_WINDOW = 60.0
+MAX_REMEMBERED_ERRORS = 100
+# Quiet call sites are checked this often for summaries still to be logged
+FLUSH_INTERVAL = 5.0
+# Per module limits, e.g. "splash_screen=5/60,window=off"
+LOG_RATE_LIMITS_ENV = "LOG_RATE_LIMITS"
+
+# Set by helpers.tracing while a trace is active
+TRACE_ID = contextvars.ContextVar("trace_id", default=None)
+
+
+class CallSiteLimiter:
+    class Site:
+        def __init__(self, now, module):
+            self.module = module
+            self.last_msg = None
+            self.last_severity = logging.NOTSET
+            self.repeats = 0
+            self.window_start = now
+            self.count = 0
+            self.dropped = 0
+            self.dropped_severity = logging.NOTSET
+            self.seen_errors = []
+
+    def __init__(
+        self,
+        max_messages: int = DEFAULT_SITE_MAX_MESSAGES,
+        window: float = DEFAULT_SITE_WINDOW,
+        clock=time.monotonic,
+    ):
+        self.__default = (max_messages, window)
+        self.__module_limits = {}
+        self.__clock = clock
+        self.__sites = {}
+        self.__lock = threading.Lock()
+        self.__last_flush = clock()
+
+    def configure(self, module: str, max_messages, window: float = DEFAULT_SITE_WINDOW):
+        """max_messages of None turns limiting off for the module."""
+        self.__module_limits[module] = (max_messages, window)
+
+    def check(self, site, module: str, msg: str, severity: int):
+        """Returns whether msg should be logged and (severity, summary) pairs to log before it.
+
+        A summary keeps the highest severity of the messages it stands for.
+        """
+        max_messages, window = self.__module_limits.get(module, self.__default)
+        if max_messages is None:
+            return True, []
+
+        now = self.__clock()
+        with self.__lock:
+            state = self.__sites.get(site)
+            if state is None:
+                state = self.__sites[site] = self.Site(now, module)
+
+            summaries = []
+            window_passed = now - state.window_start >= window
+            if window_passed:
+                if state.dropped:
+                    summaries.append((state.dropped_severity, f"suppressed {state.dropped} messages"))
+                state.window_start = now
+                state.count = 0
+                state.dropped = 0
+                state.dropped_severity = logging.NOTSET
+
+            if msg == state.last_msg:
+                state.repeats += 1
+                state.last_severity = max(state.last_severity, severity)
+                # Long repeats are still summarized once per window
+                if window_passed:
+                    summaries.append(
+                        (state.last_severity, f"last message repeated {state.repeats} times")
+                    )
+                    state.repeats = 0
+                return False, summaries
+
+            if state.repeats:
+                summaries.append((state.last_severity, f"last message repeated {state.repeats} times"))
+            state.repeats = 0
+            state.last_msg = msg
+            state.last_severity = severity
+
+            # First occurrence of every error is always kept
+            if severity >= logging.ERROR and msg not in state.seen_errors:
+                state.seen_errors.append(msg)
+                del state.seen_errors[:-MAX_REMEMBERED_ERRORS]
+                state.count += 1
+                return True, summaries
+
+            if state.count >= max_messages:
+                state.dropped += 1
+                state.dropped_severity = max(state.dropped_severity, severity)
+                return False, summaries
+
+            state.count += 1
+            return True, summaries
+
+    def flush(self, force: bool = False):
+        """Returns (site, severity, summary) for sites gone quiet after a burst.
+
+        Summaries are otherwise only logged when the same site logs again.
+        Without force only sites whose window has passed are flushed, at most
+        every FLUSH_INTERVAL seconds.
+        """
+        now = self.__clock()
+        with self.__lock:
+            if not force and now - self.__last_flush < FLUSH_INTERVAL:
+                return []
+            self.__last_flush = now
+
+            summaries = []
+            for site, state in self.__sites.items():
+                _, window = self.__module_limits.get(state.module, self.__default)
+                if not force and now - state.window_start < window:
+                    continue
+                if state.dropped:
+                    summaries.append(
+                        (site, state.dropped_severity, f"suppressed {state.dropped} messages")
+                    )
+                if state.repeats:
+                    summaries.append(
+                        (site, state.last_severity, f"last message repeated {state.repeats} times")
+                    )
+                state.window_start = now
+                state.count = 0
+                state.dropped = 0
+                state.dropped_severity = logging.NOTSET
+                state.repeats = 0
+
+            return summaries
 
 
 class Logger:
@@ -15,21 +149,27 @@ class Logger:
         "INFO": "\033[0m",
         "DEBUG": "\033[33m",
         "WARN": "\033[35m",
+        "WARNING": "\033[35m",
         "ERROR": "\033[31m",
         "RESET": "\033[0m",
     }
     FORMAT = "%(message)s"
 
     class DefaultFormatter(logging.Formatter):
-        def __init__(self, *args, **kwargs):
+        def __init__(self, *args, use_colors=True, **kwargs):
             logging.Formatter.__init__(self, *args, **kwargs)
             self.__start_time = time.time()
+            self.__use_colors = use_colors
 
         def format(self, record):
-            colorized_msg = self.colorize(record.msg, record.levelname)
+            msg = record.msg
+            if self.__use_colors:
+                msg = self.colorize(msg, record.levelname)
+            trace_id = getattr(record, "trace_id", None)
+            trace = f" trace={trace_id}" if trace_id else ""
 
             return (
-                f"T={self.formatTime(self, record)} -{record.module}-: {colorized_msg}"
+                f"T={self.formatTime(self, record)} {record.levelname} -{record.module}-{trace}: {msg}"
             )
 
         def formatTime(self, record, datefmt=None):
@@ -40,10 +180,33 @@ class Logger:
 
             return f"{color}{msg}{Logger.LOG_COLORS['RESET']}"
 
-    def log_msg(self, msg: str, severity: int):
-        self.__root_logger.log(severity, msg)
+    def log_msg(self, msg: str, severity: int, stacklevel: int = 1):
+        # Frame of the code calling log_inf/log_err, used as the call site
+        caller = sys._getframe(stacklevel)
+        site = (caller.f_code.co_filename, caller.f_lineno)
+        module = os.path.splitext(os.path.basename(caller.f_code.co_filename))[0]
+
+        allowed, summaries = self.limiter.check(site, module, str(msg), severity)
+        extra = {"trace_id": TRACE_ID.get()}
+        for summary_severity, summary in summaries:
+            self.__root_logger.log(
+                summary_severity, summary, stacklevel=stacklevel + 1, extra=extra
+            )
+        if allowed:
+            self.__root_logger.log(severity, msg, stacklevel=stacklevel + 1, extra=extra)
+        self.flush()
+
+    def flush(self, force: bool = False):
+        """Logs summaries of call sites which went quiet, with their file and line."""
+        for (file_name, line), severity, summary in self.limiter.flush(force):
+            self.__root_logger.log(
+                severity,
+                f"{os.path.basename(file_name)}:{line} {summary}",
+                extra={"trace_id": None},
+            )
 
     def __init__(self, file_path: str = DEFAULT_LOG_FILE):
+        self.limiter = CallSiteLimiter()
         try:
             self.__start(file_path)
             self.log_msg(f"Created logger writing to file {file_path}", logging.INFO)
@@ -77,7 +240,8 @@ class Logger:
         file_handle = logging.FileHandler(
             filename=file_path, mode="w", encoding="utf-8"
         )
-        file_handle.setFormatter(self.DefaultFormatter(self.FORMAT))
+        # Colors are for the console only, the file is read by the log viewer
+        file_handle.setFormatter(self.DefaultFormatter(self.FORMAT, use_colors=False))
 
         console_handle = logging.StreamHandler(stream=sys.stdout)
         console_handle.setFormatter(self.DefaultFormatter(self.FORMAT))
@@ -90,17 +254,50 @@ class Logger:
 logger = Logger()
 
 
+def configure_log_rate(module: str, max_messages, window: float = DEFAULT_SITE_WINDOW):
+    logger.limiter.configure(module, max_messages, window)
+
+
+def parse_log_rate_limits(spec: str):
+    """Parses "module=max/window,module=off" into (module, max_messages, window) tuples."""
+    limits = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        module, _, limit = entry.partition("=")
+        limit = limit.strip()
+        try:
+            if limit == "off":
+                limits.append((module.strip(), None, DEFAULT_SITE_WINDOW))
+                continue
+            max_messages, _, window = limit.partition("/")
+            limits.append(
+                (module.strip(), int(max_messages), float(window) if window else DEFAULT_SITE_WINDOW)
+            )
+        except ValueError:
+            log_err(f"Invalid log rate limit {entry!r} in {LOG_RATE_LIMITS_ENV}")
+    return limits
+
+
+def configure_log_rates_from_env():
+    for module, max_messages, window in parse_log_rate_limits(os.getenv(LOG_RATE_LIMITS_ENV, "")):
+        configure_log_rate(module, max_messages, window)
+
+
+def flush_log_summaries():
+    """Logs all pending summaries, called on exit so bursts at the end of a run are reported."""
+    logger.flush(force=True)
+
+
 def log_inf(msg):
-    logger.log_msg(msg, logging.INFO)
+    logger.log_msg(msg, logging.INFO, stacklevel=2)
 
 
 def log_dbg(msg):
-    logger.log_msg(msg, logging.DEBUG)
+    logger.log_msg(msg, logging.DEBUG, stacklevel=2)
 
 
 def log_wrn(msg):
-    logger.log_msg(msg, logging.WARN)
+    logger.log_msg(msg, logging.WARN, stacklevel=2)
 
 
 def log_err(msg):
-    logger.log_msg(msg, logging.ERROR)
+    logger.log_msg(msg, logging.ERROR, stacklevel=2)
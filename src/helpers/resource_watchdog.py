@@ -0,0 +1,161 @@
+import os
+import time
+import tracemalloc
+
+from helpers.logger import log_inf, log_wrn
+
+DEFAULT_TOP_GROWTH = 10
+TRACEMALLOC_FRAMES = 5
+
+RSS_BYTES = "rss_bytes"
+TRACED_BYTES = "traced_bytes"
+OPEN_FDS = "open_fds"
+CHILD_PROCESSES = "child_processes"
+
+DEFAULT_THRESHOLDS = {
+    RSS_BYTES: 1024 * 1024 * 1024,
+    OPEN_FDS: 512,
+    CHILD_PROCESSES: 32,
+}
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def open_fds():
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def child_processes():
+    try:
+        children = 0
+        for task in os.listdir("/proc/self/task"):
+            with open(f"/proc/self/task/{task}/children", "r") as file:
+                children += len(file.read().split())
+        return children
+    except OSError:
+        return None
+
+
+class ResourceSample:
+    def __init__(self, taken_at, metrics, growth):
+        self.taken_at = taken_at
+        self.metrics = metrics
+        self.growth = growth
+
+    def __str__(self):
+        return ", ".join(f"{name}: {value}" for name, value in self.metrics.items())
+
+
+class ResourceWatchdog:
+    """Samples process resources, logs top allocation growth and warns on thresholds.
+
+    probes maps metric names to callables returning a number or None, e.g. live
+    QObjects counted by the window.
+    """
+
+    def __init__(
+        self,
+        probes=None,
+        thresholds=None,
+        top: int = DEFAULT_TOP_GROWTH,
+        clock=time.time,
+    ):
+        self.__probes = {
+            RSS_BYTES: rss_bytes,
+            OPEN_FDS: open_fds,
+            CHILD_PROCESSES: child_processes,
+        }
+        self.__probes.update(probes or {})
+        self.__thresholds = dict(DEFAULT_THRESHOLDS)
+        self.__thresholds.update(thresholds or {})
+        self.__top = top
+        self.__clock = clock
+        self.__started_tracing = False
+        self.__baseline = None
+        self.__previous = None
+        self.__exceeded = set()
+
+    def is_running(self):
+        return self.__baseline is not None
+
+    def start(self):
+        if self.is_running():
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self.__started_tracing = True
+
+        self.__baseline = tracemalloc.take_snapshot()
+        self.__previous = None
+        log_inf("Started resource watchdog")
+
+    def stop(self):
+        if not self.is_running():
+            return
+
+        self.__baseline = None
+        self.__previous = None
+        self.__exceeded.clear()
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+        log_inf("Stopped resource watchdog")
+
+    def sample(self):
+        if not self.is_running():
+            return None
+
+        metrics = {TRACED_BYTES: tracemalloc.get_traced_memory()[0]}
+        for name, probe in self.__probes.items():
+            metrics[name] = probe()
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        growth = [
+            stat
+            for stat in snapshot.compare_to(self.__baseline, "lineno")[: self.__top]
+            if stat.size_diff > 0
+        ]
+
+        sample = ResourceSample(self.__clock(), metrics, growth)
+        self.__report(sample)
+        self.__previous = sample
+        return sample
+
+    def __report(self, sample):
+        change = ""
+        if self.__previous:
+            change = ", ".join(
+                f"{name} {value - self.__previous.metrics[name]:+}"
+                for name, value in sample.metrics.items()
+                if value is not None and self.__previous.metrics.get(name) is not None
+            )
+        log_inf(f"Resources: {sample}" + (f" (change: {change})" if change else ""))
+
+        for stat in sample.growth:
+            frame = stat.traceback[0]
+            log_inf(
+                f"Memory growth {stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+} blocks) at {frame.filename}:{frame.lineno}"
+            )
+
+        for name, limit in self.__thresholds.items():
+            value = sample.metrics.get(name)
+            if value is None:
+                continue
+            if value > limit and name not in self.__exceeded:
+                self.__exceeded.add(name)
+                log_wrn(f"Resource {name} crossed threshold: {value} > {limit}")
+            elif value <= limit and name in self.__exceeded:
+                self.__exceeded.discard(name)
+                log_inf(f"Resource {name} is back under threshold: {value}")
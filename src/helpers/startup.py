@@ -0,0 +1,124 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from helpers.logger import log_inf, log_err
+
+DEFAULT_MAX_WORKERS = 4
+PUMP_INTERVAL_SECONDS = 0.05
+
+
+class StartupException(Exception):
+    pass
+
+
+class StartupStage:
+    def __init__(self, name, fn, depends=(), background=False, required=True):
+        self.name = name
+        self.fn = fn
+        self.depends = tuple(depends)
+        self.background = background
+        self.required = required
+
+
+class StartupPlan:
+    """Declared startup stages run as soon as their dependencies are done.
+
+    Background stages run in a thread pool, the others on the calling thread,
+    which is the only one allowed to create widgets. A stage gets the results
+    of the stages it depends on as arguments. pump() is called while waiting
+    so the splash screen keeps painting.
+    """
+
+    def __init__(self, pump=None, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.__stages = {}
+        self.__pump = pump
+        self.__max_workers = max_workers
+
+    def add_stage(self, name: str, fn, depends=(), background=False, required=True):
+        if name in self.__stages:
+            raise StartupException(f"Startup stage {name} is declared twice!")
+
+        self.__stages[name] = StartupStage(name, fn, depends, background, required)
+
+    def stage_count(self):
+        return len(self.__stages)
+
+    def run(self, progress=None):
+        """Returns results of the stages, progress(done, total, name) follows each stage."""
+        for stage in self.__stages.values():
+            for dependency in stage.depends:
+                if dependency not in self.__stages:
+                    raise StartupException(
+                        f"Startup stage {stage.name} depends on unknown stage {dependency}!"
+                    )
+
+        results = {}
+        timings = {}
+        pending = dict(self.__stages)
+        running = {}
+        started = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as pool:
+            while pending or running:
+                ready = [
+                    stage
+                    for stage in pending.values()
+                    if all(dependency in results for dependency in stage.depends)
+                ]
+                for stage in ready:
+                    del pending[stage.name]
+                    arguments = [results[dependency] for dependency in stage.depends]
+                    if stage.background:
+                        running[pool.submit(self.__timed, stage, arguments)] = stage
+                    else:
+                        self.__finish(stage, self.__call(self.__timed, stage, arguments), results, timings)
+                        self.__report(progress, results, stage)
+
+                if not running:
+                    if pending and not ready:
+                        raise StartupException(
+                            f"Startup stages wait for each other: {sorted(pending)}"
+                        )
+                    continue
+
+                done, _ = wait(running, timeout=PUMP_INTERVAL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    self.__finish(stage, self.__call(future.result), results, timings)
+                    self.__report(progress, results, stage)
+                if self.__pump:
+                    self.__pump()
+
+        log_inf(
+            f"Startup finished in {time.monotonic() - started:.2f}s, stages: "
+            + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+        )
+        return results
+
+    @staticmethod
+    def __timed(stage, arguments):
+        started = time.monotonic()
+        return stage.fn(*arguments), time.monotonic() - started
+
+    @staticmethod
+    def __call(fn, *args):
+        try:
+            return fn(*args), None
+        except Exception as e:
+            return None, e
+
+    @staticmethod
+    def __finish(stage, outcome, results, timings):
+        timed, error = outcome
+        if error is not None:
+            log_err(f"Startup stage {stage.name} failed: {error}")
+            if stage.required:
+                raise StartupException(f"Startup stage {stage.name} failed: {error}")
+            results[stage.name] = None
+            return
+
+        results[stage.name], timings[stage.name] = timed
+
+    def __report(self, progress, results, stage):
+        if progress:
+            progress(len(results), len(self.__stages), stage.name)
@@ -0,0 +1,191 @@
+import contextlib
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+
+from helpers.logger import TRACE_ID, log_err
+
+DEFAULT_TRACE_FILE = "logs/traces.jsonl"
+SERVICE_NAME = "twitter-bot"
+SCOPE_NAME = "twitter_bot.tracing"
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+current_span = contextvars.ContextVar("current_span", default=None)
+
+
+def otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP JSON carries 64 bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    def __init__(self, name, trace_id, parent_span_id=None, start_ns=None, attributes=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns = None
+        self.attributes = dict(attributes or {})
+        self.status = STATUS_UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    def end(self, end_ns=None):
+        self.end_ns = end_ns if end_ns is not None else time.time_ns()
+
+    def to_otlp(self):
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": otlp_value(value)}
+                for key, value in self.attributes.items()
+                if value is not None
+            ],
+            "status": {"code": self.status},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+
+        return span
+
+
+class FileSpanExporter:
+    """Appends finished spans to a file, one OTLP/JSON ExportTraceServiceRequest per line.
+
+    The file is opened on the first span and kept open until close().
+    """
+
+    def __init__(self, file_path: str = DEFAULT_TRACE_FILE):
+        self.__file_path = file_path
+        self.__lock = threading.Lock()
+        self.__file = None
+
+    def export(self, span: Span):
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": otlp_value(SERVICE_NAME)}
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": SCOPE_NAME}, "spans": [span.to_otlp()]}],
+                }
+            ]
+        }
+        line = json.dumps(request) + "\n"
+
+        with self.__lock:
+            try:
+                if self.__file is None:
+                    self.__file = self.__open()
+                self.__file.write(line)
+            except OSError as e:
+                # Opened again on the next span
+                self.__close()
+                log_err(f"Failed to export span {span.name}, error: {e}")
+
+    def close(self):
+        with self.__lock:
+            self.__close()
+
+    def __open(self):
+        directory = os.path.dirname(self.__file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        # Line buffered, so every span is on disk even if the app crashes
+        return open(self.__file_path, "a", encoding="utf-8", buffering=1)
+
+    def __close(self):
+        if self.__file is None:
+            return
+        try:
+            self.__file.close()
+        except OSError:
+            pass
+        self.__file = None
+
+
+class Tracer:
+    def __init__(self, exporter=None):
+        self.exporter = exporter if exporter is not None else FileSpanExporter()
+        self.enabled = True
+
+    @contextlib.contextmanager
+    def trace(self, name: str, **attributes):
+        """Starts a new trace, its ID is added to log lines written inside."""
+        trace_token = TRACE_ID.set(secrets.token_hex(16))
+        try:
+            with self.span(name, **attributes) as span:
+                yield span
+        finally:
+            TRACE_ID.reset(trace_token)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes):
+        parent = current_span.get()
+        trace_id = parent.trace_id if parent else TRACE_ID.get()
+        if not self.enabled or trace_id is None:
+            # Outside of a trace spans are not recorded
+            yield Span(name, trace_id or "0" * 32, attributes=attributes)
+            return
+
+        span = Span(name, trace_id, parent.span_id if parent else None, attributes=attributes)
+        token = current_span.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.set_error(str(e))
+            raise
+        finally:
+            current_span.reset(token)
+            span.end()
+            self.exporter.export(span)
+
+    def record_span(self, name: str, start_ns: int, end_ns: int, **attributes):
+        """Records an already finished span, e.g. time spent waiting in a queue."""
+        parent = current_span.get()
+        if not self.enabled or parent is None:
+            return
+
+        span = Span(name, parent.trace_id, parent.span_id, start_ns, attributes)
+        span.end(end_ns)
+        self.exporter.export(span)
+
+    def close(self):
+        if hasattr(self.exporter, "close"):
+            self.exporter.close()
+
+
+tracer = Tracer()
+
+
+def submit_in_context(pool, fn, *args):
+    """Submits fn to a thread pool so its spans nest under the current one."""
+    return pool.submit(contextvars.copy_context().run, fn, *args)
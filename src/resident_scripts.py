@@ -0,0 +1,165 @@
+import json
+import os
+import subprocess
+import threading
+import time
+
+from helpers.logger import log_inf, log_wrn, log_err
+from script_interpreter import read_script_setting, script_command
+from script_runner import script_env
+
+RESIDENT_VARIABLE = "RESIDENT"
+VALUE_KEY = "value"
+MIN_RESTART_DELAY = 1.0
+MAX_RESTART_DELAY = 60.0
+# A run this long resets the restart delay
+STABLE_RUN_SECONDS = 60.0
+STOP_TIMEOUT = 5.0
+
+
+def is_resident_script(path: str):
+    return read_script_setting(path, RESIDENT_VARIABLE) is True
+
+
+class ResidentScript:
+    """Keeps a streaming script running and remembers the last value it published.
+
+    The script writes one JSON object with a 'value' key per line to stdout.
+    When it exits it is started again after a delay that doubles on every
+    quick crash.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        min_restart_delay: float = MIN_RESTART_DELAY,
+        max_restart_delay: float = MAX_RESTART_DELAY,
+        clock=time.monotonic,
+    ):
+        self.path = path
+        self.restarts = 0
+        self.__min_restart_delay = min_restart_delay
+        self.__max_restart_delay = max_restart_delay
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__value = None
+        self.__updated_at = None
+        self.__process = None
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(
+            target=self.__supervise, name=f"resident-{os.path.basename(path)}", daemon=True
+        )
+
+    def start(self):
+        self.__thread.start()
+        log_inf(f"Started resident script {self.path}")
+
+    def stop(self):
+        self.__stopped.set()
+        with self.__lock:
+            process = self.__process
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self.__thread.is_alive():
+            self.__thread.join(STOP_TIMEOUT)
+        log_inf(f"Stopped resident script {self.path} after {self.restarts} restarts")
+
+    def value(self):
+        with self.__lock:
+            return self.__value
+
+    def updated_at(self):
+        with self.__lock:
+            return self.__updated_at
+
+    def __supervise(self):
+        delay = self.__min_restart_delay
+        while not self.__stopped.is_set():
+            started = self.__clock()
+            try:
+                process = subprocess.Popen(
+                    script_command(self.path), stdout=subprocess.PIPE, env=script_env(self.path), text=True
+                )
+            except OSError as e:
+                log_err(f"Failed to start resident script {self.path}, error: {e}")
+                process = None
+            else:
+                with self.__lock:
+                    self.__process = process
+                for line in process.stdout:
+                    self.__handle_line(line)
+                process.stdout.close()
+                process.wait()
+
+            if self.__stopped.is_set():
+                return
+
+            if self.__clock() - started >= STABLE_RUN_SECONDS:
+                delay = self.__min_restart_delay
+            self.restarts += 1
+            log_wrn(
+                f"Resident script {self.path} exited with {process.returncode if process else None}, restarting in {delay}s"
+            )
+            self.__stopped.wait(delay)
+            delay = min(delay * 2, self.__max_restart_delay)
+
+    def __handle_line(self, line: str):
+        try:
+            message = json.loads(line)
+            value = message[VALUE_KEY]
+        except (ValueError, KeyError, TypeError):
+            # Anything else printed by the script is only logged
+            log_inf(f"Resident script {os.path.basename(self.path)}: {line.rstrip()}")
+            return
+
+        with self.__lock:
+            self.__value = value
+            self.__updated_at = self.__clock()
+
+
+class ResidentScriptManager:
+    def __init__(self, script_factory=ResidentScript):
+        self.__script_factory = script_factory
+        self.__scripts = {}
+
+    def is_running(self, path: str):
+        return path in self.__scripts
+
+    def start(self, path: str):
+        if path in self.__scripts:
+            return
+        script = self.__script_factory(path)
+        self.__scripts[path] = script
+        script.start()
+
+    def stop(self, path: str, wait: bool = True):
+        """Stops a script, without wait it is stopped on a background thread."""
+        script = self.__scripts.pop(path, None)
+        if not script:
+            return None
+
+        if wait:
+            script.stop()
+            return None
+
+        stopper = threading.Thread(target=script.stop, name=f"stop-{os.path.basename(path)}", daemon=True)
+        stopper.start()
+        return stopper
+
+    def restart(self, path: str):
+        self.stop(path, wait=False)
+        self.start(path)
+
+    def stop_all(self):
+        # Scripts are stopped together, so exit waits for the slowest one only
+        stoppers = [self.stop(path, wait=False) for path in list(self.__scripts)]
+        for stopper in stoppers:
+            stopper.join()
+
+    def latest(self, path: str):
+        script = self.__scripts.get(path)
+        return script.value() if script else None
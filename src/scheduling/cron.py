@@ -0,0 +1,155 @@
+import calendar
+import datetime
+
+MONTH_NAMES = {
+    name.upper(): index for index, name in enumerate(calendar.month_abbr) if name
+}
+DAY_NAMES = {"SUN": 0, "MON": 1, "TUE": 2, "WED": 3, "THU": 4, "FRI": 5, "SAT": 6}
+
+# (name, lowest, highest, aliases)
+FIELDS = (
+    ("minute", 0, 59, {}),
+    ("hour", 0, 23, {}),
+    ("day of month", 1, 31, {}),
+    ("month", 1, 12, MONTH_NAMES),
+    ("day of week", 0, 7, DAY_NAMES),
+)
+MAX_SEARCH_YEARS = 5
+
+
+class InvalidCronException(Exception):
+    pass
+
+
+def parse_field(text: str, lowest: int, highest: int, aliases):
+    def value(token):
+        token = token.upper()
+        if token in aliases:
+            return aliases[token]
+        try:
+            number = int(token)
+        except ValueError:
+            raise InvalidCronException(f"Invalid cron value {token}")
+        if number < lowest or number > highest:
+            raise InvalidCronException(
+                f"Cron value {number} out of range {lowest}-{highest}"
+            )
+        return number
+
+    mask = 0
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text) if step_text.isdigit() else 0
+            if step <= 0:
+                raise InvalidCronException(f"Invalid cron step {step_text}")
+
+        if part == "*":
+            start, end = lowest, highest
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = value(start_text), value(end_text)
+            if highest == 7 and end == 0 and start > 0:
+                # Sunday ends a week range as 7, e.g. MON-SUN
+                end = 7
+        else:
+            start = value(part)
+            end = highest if step > 1 else start
+
+        if start > end:
+            raise InvalidCronException(f"Invalid cron range {part}")
+
+        for number in range(start, end + 1, step):
+            mask |= 1 << number
+
+    return mask
+
+
+def next_bit(mask: int, start: int):
+    """Lowest set bit at position >= start, or None."""
+    remaining = mask >> start
+    if not remaining:
+        return None
+
+    return start + (remaining & -remaining).bit_length() - 1
+
+
+class CronExpression:
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        fields = self.expression.split()
+        if len(fields) != len(FIELDS):
+            raise InvalidCronException(
+                f"Cron expression needs {len(FIELDS)} fields, provided: {len(fields)}"
+            )
+
+        masks = [
+            parse_field(text, lowest, highest, aliases)
+            for text, (_, lowest, highest, aliases) in zip(fields, FIELDS)
+        ]
+        self.minutes, self.hours, self.days, self.months, self.weekdays = masks
+        # 7 is another name for Sunday
+        if self.weekdays & (1 << 7):
+            self.weekdays = (self.weekdays | 1) & ~(1 << 7)
+
+        # Like Vixie cron, a day field starting with "*" (e.g. "*/2") is not a
+        # restriction, only when both are restricted either one may match
+        self.days_restricted = not fields[2].startswith("*")
+        self.weekdays_restricted = not fields[4].startswith("*")
+        self.either_day = self.days_restricted and self.weekdays_restricted
+
+    def matches_day(self, date: datetime.date):
+        day_match = bool(self.days >> date.day & 1)
+        weekday_match = bool(self.weekdays >> date.isoweekday() % 7 & 1)
+
+        if self.either_day:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def matches(self, moment: datetime.datetime):
+        return (
+            bool(self.minutes >> moment.minute & 1)
+            and bool(self.hours >> moment.hour & 1)
+            and bool(self.months >> moment.month & 1)
+            and self.matches_day(moment)
+        )
+
+    def next_fire(self, after: datetime.datetime):
+        candidate = after.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        limit = after.year + MAX_SEARCH_YEARS
+
+        while candidate.year <= limit:
+            month = next_bit(self.months, candidate.month)
+            if month is None:
+                candidate = datetime.datetime(candidate.year + 1, 1, 1)
+                continue
+            if month != candidate.month:
+                candidate = datetime.datetime(candidate.year, month, 1)
+
+            if not self.matches_day(candidate):
+                candidate = datetime.datetime.combine(
+                    candidate.date() + datetime.timedelta(days=1), datetime.time()
+                )
+                continue
+
+            hour = next_bit(self.hours, candidate.hour)
+            if hour is None:
+                candidate = datetime.datetime.combine(
+                    candidate.date() + datetime.timedelta(days=1), datetime.time()
+                )
+                continue
+            if hour != candidate.hour:
+                candidate = candidate.replace(hour=hour, minute=0)
+
+            minute = next_bit(self.minutes, candidate.minute)
+            if minute is None:
+                candidate = candidate.replace(minute=0) + datetime.timedelta(hours=1)
+                continue
+
+            return candidate.replace(minute=minute)
+
+        return None
+
+    def __str__(self):
+        return self.expression
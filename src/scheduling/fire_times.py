@@ -0,0 +1,191 @@
+import datetime
+
+import numpy as np
+
+DEFAULT_HORIZON_DAYS = 30
+DEFAULT_PREVIEW_COUNT = 20
+DENSE_POSTS_PER_DAY = 50
+DENSE_MIN_GAP_SECONDS = 60
+
+
+def compute_fire_times(
+    start: datetime.datetime,
+    horizon: datetime.timedelta,
+    seconds=None,
+    minutes=None,
+    hours=None,
+    days=None,
+):
+    """Every second in [start, start + horizon) matching the interval rules.
+
+    Mirrors MainWindow.__check_interval_tweet: each set field must divide the
+    current wall clock field, a missing or zero field matches everything.
+    Times are local and naive, DST shifts inside the horizon are ignored.
+    Matching times of a day are built from the fields, so only fire times
+    are allocated, not every second of the horizon.
+    """
+    first = np.datetime64(start.replace(microsecond=0), "s")
+    end = first + np.timedelta64(int(horizon.total_seconds()), "s")
+    if end <= first:
+        return np.array([], dtype="datetime64[s]")
+
+    first_day = first.astype("datetime64[D]")
+    last_day = (end - np.timedelta64(1, "s")).astype("datetime64[D]")
+    fire_days = first_day + np.arange(int((last_day - first_day).astype(np.int64)) + 1)
+    if days:
+        day_of_month = (
+            fire_days - fire_days.astype("datetime64[M]").astype("datetime64[D]")
+        ).astype(np.int64) + 1
+        fire_days = fire_days[day_of_month % days == 0]
+
+    fire_times = (
+        fire_days.astype("datetime64[s]")[:, None] + day_offsets(seconds, minutes, hours)[None, :]
+    ).ravel()
+    return fire_times[(fire_times >= first) & (fire_times < end)]
+
+
+def day_offsets(seconds=None, minutes=None, hours=None):
+    """Sorted seconds since midnight matching the second, minute and hour rules."""
+
+    def matching(step, limit):
+        return np.arange(0, limit, step or 1, dtype=np.int64)
+
+    return (
+        matching(hours, 24)[:, None, None] * 3600
+        + matching(minutes, 60)[None, :, None] * 60
+        + matching(seconds, 60)[None, None, :]
+    ).ravel()
+
+
+def day_windows(start: datetime.datetime, horizon: datetime.timedelta):
+    """Splits [start, start + horizon) at midnights into (start, length) pairs."""
+    end = start + horizon
+    window_start = start
+    while window_start < end:
+        midnight = datetime.datetime.combine(
+            window_start.date() + datetime.timedelta(days=1), datetime.time()
+        )
+        window_end = min(midnight, end)
+        yield window_start, window_end - window_start
+        window_start = window_end
+
+
+def compute_cron_fire_times(start: datetime.datetime, horizon: datetime.timedelta, cron):
+    """Every minute in [start, start + horizon) matching a CronExpression."""
+    first = np.datetime64(start.replace(second=0, microsecond=0), "m")
+    if first < np.datetime64(start, "s"):
+        first += np.timedelta64(1, "m")
+    grid = first + np.arange(int(horizon.total_seconds() // 60), dtype=np.int64)
+    epoch_minutes = grid.astype(np.int64)
+    epoch_days = grid.astype("datetime64[D]")
+    months = grid.astype("datetime64[M]")
+
+    def bits(mask, values):
+        return (np.uint64(mask) >> values.astype(np.uint64)) & np.uint64(1) == 1
+
+    day_of_month = (epoch_days - months.astype("datetime64[D]")).astype(np.int64) + 1
+    # 1970-01-01 was a Thursday, cron counts days of week from Sunday
+    day_of_week = (epoch_days.astype(np.int64) + 4) % 7
+    day_match = bits(cron.days, day_of_month)
+    weekday_match = bits(cron.weekdays, day_of_week)
+
+    if cron.either_day:
+        mask = day_match | weekday_match
+    else:
+        mask = day_match & weekday_match
+
+    mask &= bits(cron.minutes, epoch_minutes % 60)
+    mask &= bits(cron.hours, epoch_minutes // 60 % 24)
+    mask &= bits(cron.months, months.astype(np.int64) % 12 + 1)
+
+    return grid[mask].astype("datetime64[s]")
+
+
+class FireTimesSummary:
+    """Statistics of sorted fire times, given as one array or as sorted chunks of them."""
+
+    def __init__(self, fire_times, count: int = DEFAULT_PREVIEW_COUNT):
+        chunks = [fire_times] if isinstance(fire_times, np.ndarray) else fire_times
+
+        self.total = 0
+        self.next_fires = []
+        self.posts_per_day = []
+        self.min_gap = None
+        previous = None
+        for chunk in chunks:
+            if not len(chunk):
+                continue
+
+            self.total += len(chunk)
+            self.next_fires.extend(
+                value.astype(datetime.datetime) for value in chunk[: count - len(self.next_fires)]
+            )
+
+            chunk_days = chunk.astype("datetime64[D]")
+            if chunk_days[0] == chunk_days[-1]:
+                fire_days, per_day = chunk_days[:1], [len(chunk)]
+            else:
+                fire_days, per_day = np.unique(chunk_days, return_counts=True)
+            for day, amount in zip(fire_days, per_day):
+                day = day.astype(datetime.date)
+                if self.posts_per_day and self.posts_per_day[-1][0] == day:
+                    self.posts_per_day[-1] = (day, self.posts_per_day[-1][1] + int(amount))
+                else:
+                    self.posts_per_day.append((day, int(amount)))
+
+            epoch = chunk.astype(np.int64)
+            gaps = np.diff(epoch)
+            if previous is not None:
+                gaps = np.append(gaps, epoch[0] - previous)
+            if len(gaps):
+                gap = int(gaps.min())
+                self.min_gap = gap if self.min_gap is None else min(self.min_gap, gap)
+            previous = epoch[-1]
+
+        self.max_per_day = max((amount for _, amount in self.posts_per_day), default=0)
+        self.warnings = self.__find_warnings()
+
+    def __find_warnings(self):
+        warnings = []
+        if self.total == 0:
+            warnings.append("Schedule never posts within chosen horizon!")
+            return warnings
+
+        if self.max_per_day > DENSE_POSTS_PER_DAY:
+            warnings.append(
+                f"Schedule is too dense: up to {self.max_per_day} posts per day"
+            )
+        if self.min_gap is not None and self.min_gap < DENSE_MIN_GAP_SECONDS:
+            warnings.append(
+                f"Posts can follow each other after only {self.min_gap} seconds"
+            )
+
+        return warnings
+
+
+def summarize_interval(
+    seconds=None,
+    minutes=None,
+    hours=None,
+    days=None,
+    horizon_days: int = DEFAULT_HORIZON_DAYS,
+    count: int = DEFAULT_PREVIEW_COUNT,
+    start: datetime.datetime = None,
+    cron=None,
+):
+    if start is None:
+        start = datetime.datetime.now()
+
+    # A day at a time, so long horizons of dense schedules stay small in memory
+    horizon = datetime.timedelta(days=horizon_days)
+    if cron is not None:
+        chunks = (
+            compute_cron_fire_times(window_start, length, cron)
+            for window_start, length in day_windows(start, horizon)
+        )
+    else:
+        chunks = (
+            compute_fire_times(window_start, length, seconds, minutes, hours, days)
+            for window_start, length in day_windows(start, horizon)
+        )
+    return FireTimesSummary(chunks, count)
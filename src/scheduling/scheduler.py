@@ -0,0 +1,182 @@
+import datetime
+import time
+from collections import deque
+
+from helpers.logger import log_inf, log_wrn
+
+FIRE_ONCE = "fire_once"
+FIRE_ALL = "fire_all"
+SKIP = "skip"
+CATCH_UP_POLICIES = (FIRE_ONCE, FIRE_ALL, SKIP)
+
+DEFAULT_TOLERANCE_SECONDS = 1.0
+MAX_CATCH_UP_FIRES = 1000
+LATENESS_HISTORY = 1000
+MAX_TIMER_DELAY_MS = 60 * 1000
+
+
+class SchedulerException(Exception):
+    pass
+
+
+def next_interval_fire(after: datetime.datetime, seconds=None, minutes=None, hours=None, days=None):
+    """First whole second after `after` matching the interval rules.
+
+    A field that doesn't match moves the candidate to the start of the next
+    unit of that field, so the search never walks second by second.
+    """
+    if days and days > 31:
+        # No day of month is divisible by it, schedule never fires
+        return None
+
+    candidate = after.replace(microsecond=0) + datetime.timedelta(seconds=1)
+
+    while True:
+        if days and candidate.day % days != 0:
+            candidate = candidate.replace(hour=0, minute=0, second=0) + datetime.timedelta(days=1)
+            continue
+        if hours and candidate.hour % hours != 0:
+            candidate = candidate.replace(minute=0, second=0) + datetime.timedelta(hours=1)
+            continue
+        if minutes and candidate.minute % minutes != 0:
+            candidate = candidate.replace(second=0) + datetime.timedelta(minutes=1)
+            continue
+        if seconds and candidate.second % seconds != 0:
+            candidate += datetime.timedelta(seconds=1)
+            continue
+
+        return candidate
+
+
+def next_date_fire(date_time: datetime.datetime):
+    def next_fire(after):
+        return date_time if date_time > after else None
+
+    return next_fire
+
+
+def schedule_next_fire(seconds=None, minutes=None, hours=None, days=None, cron=None, date_time=None):
+    if date_time is not None:
+        return next_date_fire(date_time)
+    if cron is not None:
+        return cron.next_fire
+
+    return lambda after: next_interval_fire(after, seconds, minutes, hours, days)
+
+
+class LatenessStats:
+    def __init__(self, history: int = LATENESS_HISTORY):
+        self.__values = deque(maxlen=history)
+        self.fired = 0
+        self.missed = 0
+        self.skipped = 0
+
+    def record(self, lateness: float):
+        self.__values.append(lateness)
+        self.fired += 1
+
+    def last(self):
+        return self.__values[-1] if self.__values else None
+
+    def max(self):
+        return max(self.__values) if self.__values else None
+
+    def mean(self):
+        return sum(self.__values) / len(self.__values) if self.__values else None
+
+    def __str__(self):
+        return f"fired: {self.fired}, missed: {self.missed}, skipped: {self.skipped}, last lateness: {self.last()}, max lateness: {self.max()}"
+
+
+class Scheduler:
+    def __init__(
+        self,
+        next_fire,
+        policy: str = FIRE_ONCE,
+        tolerance: float = DEFAULT_TOLERANCE_SECONDS,
+        wall_clock=time.time,
+        monotonic_clock=time.monotonic,
+    ):
+        if policy not in CATCH_UP_POLICIES:
+            raise SchedulerException(f"Unknown catch up policy {policy}!")
+
+        self.__next_fire = next_fire
+        self.__policy = policy
+        self.__tolerance = tolerance
+        self.__wall_clock = wall_clock
+        self.__monotonic_clock = monotonic_clock
+        # Wall time is advanced with the monotonic clock, so setting the
+        # system clock back can't repeat fires
+        self.__anchor_wall = wall_clock()
+        self.__anchor_monotonic = monotonic_clock()
+        self.__next = self.__next_fire(self.now())
+        self.stats = LatenessStats()
+
+    def now(self):
+        monotonic = self.__monotonic_clock()
+        estimate = self.__anchor_wall + monotonic - self.__anchor_monotonic
+        wall = self.__wall_clock()
+        # The monotonic clock stops while the system is suspended, wall time
+        # ahead of it is time that really passed, fires in it were missed
+        if wall - estimate > self.__tolerance:
+            log_wrn(f"Clock is {wall - estimate:.1f}s ahead of the schedule, system was likely suspended")
+            self.__anchor_wall = wall
+            self.__anchor_monotonic = monotonic
+            estimate = wall
+
+        return datetime.datetime.fromtimestamp(estimate)
+
+    def is_finished(self):
+        return self.__next is None
+
+    def next_fire_time(self):
+        return self.__next
+
+    def milliseconds_until_next(self, lead: float = 0):
+        """Timer delay to the next fire, or to lead seconds before it."""
+        if self.__next is None:
+            return None
+
+        delay = ((self.__next - self.now()).total_seconds() - lead) * 1000
+        return int(min(max(delay, 0), MAX_TIMER_DELAY_MS))
+
+    def poll(self):
+        now = self.now()
+        due = []
+        while self.__next is not None and self.__next <= now:
+            due.append(self.__next)
+            self.__next = self.__next_fire(self.__next)
+            if len(due) >= MAX_CATCH_UP_FIRES:
+                # Too far behind, continue from now instead of replaying more
+                self.__next = self.__next_fire(now)
+                break
+
+        if not due:
+            return []
+
+        on_time = [
+            fire for fire in due if (now - fire).total_seconds() <= self.__tolerance
+        ]
+        missed = len(due) - len(on_time)
+        if missed:
+            self.stats.missed += missed
+            log_wrn(
+                f"Missed {missed} fire times, oldest {due[0]}, applying policy {self.__policy}"
+            )
+
+        if self.__policy == FIRE_ALL or not missed:
+            fires = due
+        elif self.__policy == FIRE_ONCE:
+            fires = [due[-1]]
+        else:
+            fires = on_time
+
+        self.stats.skipped += len(due) - len(fires)
+        result = []
+        for fire in fires:
+            lateness = (now - fire).total_seconds()
+            self.stats.record(lateness)
+            result.append((fire, lateness))
+            log_inf(f"Firing schedule for {fire}, lateness {lateness:.3f}s")
+
+        return result
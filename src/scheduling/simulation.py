@@ -0,0 +1,126 @@
+import datetime
+
+from helpers.logger import log_inf
+from scheduling.scheduler import Scheduler, FIRE_ONCE
+from storage.profile_store import DEFAULT_ACCOUNT
+
+EVENT_RENDER = "render"
+EVENT_POST = "post"
+EVENT_FAILED = "failed"
+
+DRY_RUN_STATUS = 201
+
+
+class VirtualClock:
+    """Clock for Scheduler which only moves when told to."""
+
+    def __init__(self, start: float):
+        self.__now = start
+
+    def __call__(self):
+        return self.__now
+
+    def advance(self, seconds: float):
+        self.__now += seconds
+
+    def set(self, timestamp: float):
+        # Like a monotonic clock it never goes back
+        self.__now = max(self.__now, timestamp)
+
+
+class DryRunResponse:
+    def __init__(self, tweet_id: str, text: str):
+        self.status_code = DRY_RUN_STATUS
+        self.text = text
+        self.__tweet_id = tweet_id
+
+    def json(self):
+        return {"data": {"id": self.__tweet_id, "text": self.text}}
+
+
+class DryRunPoster:
+    """Stands in for post_for_account, remembers posts instead of sending them."""
+
+    def __init__(self, clock):
+        self.__clock = clock
+        self.posts = []
+
+    def __call__(self, account, content, media_paths=()):
+        self.posts.append((self.__clock(), account, content["text"]))
+        return DryRunResponse(str(len(self.posts)), content["text"])
+
+
+class TimelineEvent:
+    def __init__(self, at, kind, account, content, lateness):
+        self.at = at
+        self.kind = kind
+        self.account = account
+        self.content = content
+        self.lateness = lateness
+
+    def __str__(self):
+        return f"{self.at.strftime('%d.%m.%Y %H:%M:%S')} {self.kind} {self.account}: {self.content}"
+
+
+class Timeline:
+    def __init__(self):
+        self.events = []
+
+    def add(self, event: TimelineEvent):
+        self.events.append(event)
+
+    def of_kind(self, kind: str):
+        return [event for event in self.events if event.kind == kind]
+
+    def renders(self):
+        return self.of_kind(EVENT_RENDER)
+
+    def posts(self):
+        return self.of_kind(EVENT_POST)
+
+    def __str__(self):
+        return f"Timeline: renders: {len(self.renders())}, posts: {len(self.posts())}, failed: {len(self.of_kind(EVENT_FAILED))}"
+
+
+def simulate(
+    next_fire,
+    start: datetime.datetime,
+    duration: datetime.timedelta,
+    render,
+    account: str = DEFAULT_ACCOUNT,
+    policy: str = FIRE_ONCE,
+    poster=None,
+    timer_delay: float = 0.0,
+    max_posts: int = None,
+):
+    """Runs a schedule on a virtual clock from start for duration.
+
+    render(fire_time) returns the tweet content, poster defaults to a dry run.
+    timer_delay emulates how late the timer wakes up after each fire time,
+    max_posts stops dense schedules early.
+    """
+    clock = VirtualClock(start.timestamp())
+    scheduler = Scheduler(next_fire, policy, wall_clock=clock, monotonic_clock=clock)
+    if poster is None:
+        poster = DryRunPoster(clock)
+
+    end = start + duration
+    timeline = Timeline()
+    posted = 0
+    while not scheduler.is_finished() and scheduler.next_fire_time() <= end:
+        if max_posts is not None and posted >= max_posts:
+            log_inf(f"Simulation stopped after {posted} posts")
+            break
+
+        clock.set(scheduler.next_fire_time().timestamp() + timer_delay)
+        for fire, lateness in scheduler.poll():
+            content = render(fire)
+            timeline.add(TimelineEvent(scheduler.now(), EVENT_RENDER, account, content, lateness))
+
+            response = poster(account, {"text": content})
+            kind = EVENT_POST if response.status_code == DRY_RUN_STATUS else EVENT_FAILED
+            timeline.add(TimelineEvent(scheduler.now(), kind, account, content, lateness))
+            posted += 1
+
+    log_inf(f"Simulated schedule from {start} to {end}, {timeline}, {scheduler.stats}")
+    return timeline
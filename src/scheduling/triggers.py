@@ -0,0 +1,96 @@
+import time
+
+from helpers.logger import log_inf, log_wrn
+
+TRIGGER_CHANGE = "change"
+TRIGGER_ABOVE = "above"
+TRIGGER_BELOW = "below"
+TRIGGER_MODES = (TRIGGER_CHANGE, TRIGGER_ABOVE, TRIGGER_BELOW)
+
+
+class TriggerException(Exception):
+    pass
+
+
+class ValueTrigger:
+    """Decides from sampled values of a variable when a post should fire.
+
+    In change mode it fires when the value differs from the one at the last
+    fire, in threshold modes when the value crosses the threshold. A new state
+    must hold for debounce seconds and fires are at least cooldown seconds
+    apart. The first sample only sets the baseline.
+    """
+
+    def __init__(
+        self,
+        mode: str = TRIGGER_CHANGE,
+        threshold: float = None,
+        debounce: float = 0,
+        cooldown: float = 0,
+        clock=time.monotonic,
+    ):
+        if mode not in TRIGGER_MODES:
+            raise TriggerException(f"Unknown trigger mode {mode}!")
+        if mode != TRIGGER_CHANGE and threshold is None:
+            raise TriggerException(f"Trigger mode {mode} needs a threshold!")
+
+        self.__mode = mode
+        self.__threshold = threshold
+        self.__debounce = debounce
+        self.__cooldown = cooldown
+        self.__clock = clock
+        self.__has_baseline = False
+        self.__baseline = None
+        self.__candidate = None
+        self.__pending_since = None
+        self.__last_fire = None
+        self.fired = 0
+        self.samples = 0
+
+    def __state(self, value):
+        if self.__mode == TRIGGER_CHANGE:
+            return value
+
+        number = float(value)
+        if self.__mode == TRIGGER_ABOVE:
+            return number > self.__threshold
+        return number < self.__threshold
+
+    def update(self, value):
+        """Feeds a sampled value, returns True when a post should fire."""
+        self.samples += 1
+        try:
+            state = self.__state(value)
+        except (TypeError, ValueError):
+            log_wrn(f"Trigger value {value!r} is not a number, ignoring sample")
+            return False
+
+        now = self.__clock()
+        if not self.__has_baseline:
+            self.__has_baseline = True
+            self.__baseline = state
+            return False
+
+        if state == self.__baseline:
+            self.__pending_since = None
+            return False
+        if self.__mode != TRIGGER_CHANGE and not state:
+            # Back on the quiet side of the threshold, arm for the next crossing
+            self.__baseline = state
+            self.__pending_since = None
+            return False
+
+        if self.__pending_since is None or state != self.__candidate:
+            self.__candidate = state
+            self.__pending_since = now
+        if now - self.__pending_since < self.__debounce:
+            return False
+        if self.__last_fire is not None and now - self.__last_fire < self.__cooldown:
+            return False
+
+        self.__baseline = state
+        self.__pending_since = None
+        self.__last_fire = now
+        self.fired += 1
+        log_inf(f"Trigger fired on value {value!r}, {self.fired} fires in {self.samples} samples")
+        return True
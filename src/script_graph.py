@@ -0,0 +1,135 @@
+import ast
+from concurrent.futures import ThreadPoolExecutor
+
+from helpers.logger import log_inf, log_err
+from helpers.tracing import submit_in_context
+
+CONSUMES_VARIABLE = "CONSUMES"
+DEFAULT_MAX_WORKERS = 4
+
+
+class ScriptGraphException(Exception):
+    pass
+
+
+def read_consumed_variables(path: str):
+    with open(path, "r") as file:
+        tree = ast.parse(file.read(), filename=path)
+
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id == CONSUMES_VARIABLE:
+                try:
+                    consumed = ast.literal_eval(node.value)
+                except ValueError:
+                    consumed = None
+                if not isinstance(consumed, (list, tuple)) or not all(
+                    isinstance(var, str) for var in consumed
+                ):
+                    raise ScriptGraphException(
+                        f"{CONSUMES_VARIABLE} in {path} must be a list of variable names!"
+                    )
+                return list(consumed)
+
+    return []
+
+
+class ScriptGraph:
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.__max_workers = max_workers
+        self.__scripts = {}
+        self.__consumes = {}
+
+    def add_script(self, var: str, path: str, consumes=None):
+        if var in self.__scripts:
+            raise ScriptGraphException(f"Variable {var} is bound to more than one script!")
+
+        if consumes is None:
+            consumes = read_consumed_variables(path)
+
+        self.__scripts[var] = path
+        self.__consumes[var] = list(consumes)
+
+    def get_consumed(self, var: str):
+        return self.__consumes[var]
+
+    def variables(self):
+        return list(self.__scripts)
+
+    def required_closure(self, required, resolved=()):
+        closure = set()
+        pending = list(required)
+        while pending:
+            var = pending.pop()
+            if var in closure:
+                continue
+            if var not in self.__scripts:
+                raise ScriptGraphException(f"Variable {var} is not bound to any script!")
+
+            closure.add(var)
+            # A resolved variable doesn't need its own inputs
+            if var not in resolved:
+                pending.extend(self.__consumes[var])
+
+        return closure
+
+    def levels(self, required=None, resolved=()):
+        selected = self.__scripts if required is None else self.required_closure(required, resolved)
+        selected = [var for var in selected if var not in resolved]
+        for var in selected:
+            for dependency in self.__consumes[var]:
+                if dependency not in self.__scripts:
+                    raise ScriptGraphException(
+                        f"Variable {dependency} consumed by {var} is not bound to any script!"
+                    )
+
+        remaining = {
+            var: set(dep for dep in self.__consumes[var] if dep not in resolved) for var in selected
+        }
+        levels = []
+        while remaining:
+            ready = sorted(var for var, deps in remaining.items() if not deps)
+            if not ready:
+                raise ScriptGraphException(
+                    f"Scripts depend on each other in a cycle: {sorted(remaining)}"
+                )
+
+            for var in ready:
+                del remaining[var]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+            levels.append(ready)
+
+        return levels
+
+    def run(self, run_fn, required=None, resolved=None):
+        """Runs the scripts level by level, variables in resolved are used as they are."""
+        resolved = dict(resolved or {})
+        levels = self.levels(required, resolved)
+        values = dict(resolved)
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as pool:
+            for level in levels:
+                futures = {
+                    var: submit_in_context(
+                        pool,
+                        run_fn,
+                        self.__scripts[var],
+                        {dep: values[dep] for dep in self.__consumes[var]},
+                    )
+                    for var in level
+                }
+
+                for var, future in futures.items():
+                    value = future.result()
+                    if value is None:
+                        log_err(f"Script {self.__scripts[var]} didn't produce value for {var}")
+                        raise ScriptGraphException(
+                            f"Script {self.__scripts[var]} failed, can't evaluate variable {var}!"
+                        )
+                    values[var] = value
+
+        log_inf(f"Evaluated {len(values) - len(resolved)} script variables in {len(levels)} stages")
+        return values
@@ -0,0 +1,159 @@
+import ast
+import functools
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+from helpers.logger import log_inf, log_err
+
+INTERPRETER_VARIABLE = "INTERPRETER"
+DEFAULT_INTERPRETERS = ("python3", "python")
+VENV_INTERPRETERS = (
+    os.path.join("bin", "python3"),
+    os.path.join("bin", "python"),
+    os.path.join("Scripts", "python.exe"),
+)
+COMPILE_TIMEOUT = 30
+
+# Prints the path of the written .pyc, compiled by the interpreter which will run it
+COMPILE_CODE = "import py_compile, sys; print(py_compile.compile(sys.argv[1], doraise=True))"
+# Runs a compiled script as __main__ with __file__ and sys.path of its source,
+# so scripts keep writing their outputs next to the right name
+RUN_COMPILED_CODE = (
+    "import marshal, os, sys\n"
+    "source, compiled = sys.argv[1], sys.argv[2]\n"
+    "with open(compiled, 'rb') as file:\n"
+    "    file.seek(16)\n"
+    "    code = marshal.load(file)\n"
+    "sys.argv = [source]\n"
+    "sys.path[0] = os.path.dirname(os.path.abspath(source))\n"
+    "exec(code, {'__name__': '__main__', '__file__': source, '__builtins__': __builtins__})\n"
+)
+
+compiled_scripts_lock = threading.Lock()
+compiled_scripts = {}
+
+
+def read_script_setting(path: str, name: str, default=None):
+    """Reads a literal module level assignment from a script without running it."""
+    try:
+        with open(path, "r") as file:
+            tree = ast.parse(file.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return default
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == name for target in node.targets
+        ):
+            try:
+                return ast.literal_eval(node.value)
+            except ValueError:
+                return default
+
+    return default
+
+
+@functools.lru_cache(maxsize=None)
+def default_interpreter():
+    for name in DEFAULT_INTERPRETERS:
+        found = shutil.which(name)
+        if found:
+            return found
+
+    # No Python on PATH, the one running the app still works
+    return sys.executable
+
+
+def resolve_interpreter(setting: str, script_dir: str = ""):
+    """Finds the Python executable for an interpreter path, command name or virtualenv directory."""
+    if not setting:
+        return default_interpreter()
+
+    candidate = os.path.expanduser(setting)
+    if not os.path.isabs(candidate) and os.path.exists(os.path.join(script_dir, candidate)):
+        # Relative paths, e.g. "venv", point next to the script
+        candidate = os.path.join(script_dir, candidate)
+
+    if os.path.isdir(candidate):
+        for relative in VENV_INTERPRETERS:
+            executable = os.path.join(candidate, relative)
+            if os.path.isfile(executable):
+                return executable
+    elif os.path.isfile(candidate):
+        return candidate
+    else:
+        found = shutil.which(setting)
+        if found:
+            return found
+
+    log_err(f"Interpreter {setting} not found, using {default_interpreter()}")
+    return default_interpreter()
+
+
+@functools.lru_cache(maxsize=256)
+def cached_interpreter(path: str, mtime: float):
+    setting = read_script_setting(path, INTERPRETER_VARIABLE)
+    return resolve_interpreter(
+        setting if isinstance(setting, str) else "", os.path.dirname(os.path.abspath(path))
+    )
+
+
+def script_interpreter(path: str):
+    """Interpreter for a script, resolved again only when the script changes."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return default_interpreter()
+
+    return cached_interpreter(path, mtime)
+
+
+def precompile_script(path: str):
+    """Byte-compiles a script with its interpreter, returns the .pyc path or None."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError as e:
+        log_err(f"Failed to precompile script {path}, error: {e}")
+        return None
+
+    interpreter = script_interpreter(path)
+    try:
+        result = subprocess.run(
+            [interpreter, "-c", COMPILE_CODE, path],
+            capture_output=True,
+            text=True,
+            timeout=COMPILE_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        log_err(f"Failed to precompile script {path}, error: {e}")
+        return None
+
+    compiled = result.stdout.strip()
+    if result.returncode != 0 or not os.path.isfile(compiled):
+        log_err(f"Failed to precompile script {path}, error: {result.stderr.strip()}")
+        return None
+
+    with compiled_scripts_lock:
+        compiled_scripts[path] = (mtime, interpreter, compiled)
+    log_inf(f"Precompiled script {path} for {interpreter}")
+    return compiled
+
+
+def script_command(path: str):
+    """Command running a script, from its .pyc when it is still up to date."""
+    interpreter = script_interpreter(path)
+    with compiled_scripts_lock:
+        entry = compiled_scripts.get(path)
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+
+    if entry and entry[0] == mtime and entry[1] == interpreter and os.path.isfile(entry[2]):
+        return [interpreter, "-c", RUN_COMPILED_CODE, path, entry[2]]
+
+    return [interpreter, path]
@@ -1,31 +1,134 @@
+import hashlib
 import subprocess
+import json
 import os
+import threading
+
+from helpers.tracing import tracer
+from script_interpreter import script_command
+
+SCRIPT_OUTPUT_PREFIX = "script_outputs"
+SCRIPT_INPUTS_ENV = "SCRIPT_INPUTS"
+SCRIPT_OUTPUT_ENV = "SCRIPT_OUTPUT"
+# Hanging scripts are killed instead of piling up as child processes
+SCRIPT_TIMEOUT = 120
+
+script_locks_guard = threading.Lock()
+script_locks = {}
+
+
+def script_lock(path):
+    with script_locks_guard:
+        return script_locks.setdefault(path, threading.Lock())
+
+
+def output_base(path):
+    """Output file of a script without extension, scripts with the same name in other directories get their own."""
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return f"{SCRIPT_OUTPUT_PREFIX}/{os.path.basename(path)[:-3]}-{digest}"
+
+
+def output_paths(path):
+    base = output_base(path)
+
+    return (f"{base}.txt", f"{base}.json")
+
+
+def legacy_output_paths(path):
+    # Scripts made from an older template ignore SCRIPT_OUTPUT and use their name
+    filename = os.path.basename(path)[:-3]
+
+    return (
+        f"{SCRIPT_OUTPUT_PREFIX}/{filename}.txt",
+        f"{SCRIPT_OUTPUT_PREFIX}/{filename}.json",
+    )
+
+
+def script_env(path, inputs=None):
+    env = dict(os.environ)
+    env[SCRIPT_INPUTS_ENV] = json.dumps(inputs or {})
+    env[SCRIPT_OUTPUT_ENV] = output_base(path)
+    return env
 
-from PyQt5.QtWidgets import QErrorMessage
 
 def load_value_from_script(path):
-    filename = os.path.basename(path)
+    with tracer.span("script.output_read", **{"script.path": path}):
+        return read_script_output(path)
+
+
+def read_script_output(path):
+    text_path, json_path = output_paths(path)
+    if not os.path.exists(text_path) and not os.path.exists(json_path):
+        text_path, json_path = legacy_output_paths(path)
+
+    # Structured output is stored as JSON, the newer file wins in case the
+    # script switched between modes
+    if os.path.exists(json_path) and (
+        not os.path.exists(text_path)
+        or os.path.getmtime(json_path) >= os.path.getmtime(text_path)
+    ):
+        with open(json_path, "r") as file:
+            return json.load(file)
+
+    with open(text_path, "r") as file:
+        return file.read()
+
+
+def run_script_with_inputs(path, inputs):
+    env = script_env(path, inputs)
+    with tracer.span("script.run", **{"script.path": path}) as span:
+        try:
+            result = subprocess.run(script_command(path), env=env, timeout=SCRIPT_TIMEOUT)
+        except:
+            span.set_error("Script couldn't be run")
+            return False
+
+        span.set_attribute("process.exit_code", result.returncode)
+        if result.returncode != 0:
+            span.set_error(f"Script exited with {result.returncode}")
+            return False
 
-def run_script_python3(path):
-    try:
-        subprocess.run(["python3", path])
-    except:
-        return False
-    
     return True
-        
 
-def run_script_python(path):
+
+def validate_script(path):
     try:
-        subprocess.run(['python3', path])
-    except:
-        return False
-    
-    return True
-    
+        with open(path, "r") as file:
+            compile(file.read(), path, "exec")
+    except SyntaxError as e:
+        return f"{os.path.basename(path)}, line {e.lineno}: {e.msg}"
+    except OSError as e:
+        return str(e)
+
+    return None
+
+
+def invalidate_script_value(path):
+    for output_path in output_paths(path) + legacy_output_paths(path):
+        try:
+            os.remove(output_path)
+        except FileNotFoundError:
+            pass
+
+
+def evaluate_script(path, inputs):
+    # Runs of one script share its output file, they must not overlap
+    with script_lock(path):
+        # A failed run must not leave the value of the previous one behind
+        invalidate_script_value(path)
+        if not run_script_with_inputs(path, inputs):
+            return None
+
+        try:
+            return load_value_from_script(path)
+        except (OSError, ValueError):
+            return None
+
+
 def run_script(path):
-    if not run_script_python3(path):
-        if not run_script_python(path):
-            error_dialog = QErrorMessage()
-            error_dialog.showMessage("Provided script contains errors or Python enviroment is not installed! Can't run script.")
-            error_dialog.exec_()
+    try:
+        result = subprocess.run(script_command(path), env=script_env(path), timeout=SCRIPT_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+    return result.returncode == 0
@@ -1,32 +1,90 @@
 import pathlib
+import json
 import os
+import sys
+import time
 
 PATH_PREFIX = "script_outputs/"
 
+# Set to True to keep this script running and publish new values from stream_values instead of
+# being run again for every tweet, resident scripts don't receive inputs
+RESIDENT = False
+
+# Python used to run this script, a path to an interpreter or to a virtualenv directory holding
+# its dependencies, for example "venv" next to this script. Empty uses python3 from PATH
+INTERPRETER = ""
+
+# Names of variables computed by your other scripts that this script needs, for example ["temperature", "city"]
+CONSUMES = []
+
 # This is function that returns value passed to our program, write your code inside and don't forget about return
-def perform_script():
+# Values of variables listed in CONSUMES are available in inputs, for example inputs["city"]
+# Return a text, or a dictionary to fill many places at once, for example returning
+# {"temp": 21.5, "wind": 3} from script named weather lets you use {weather.temp} and {weather.wind:.1f}
+def perform_script(inputs):
     # YOUR CODE GOES HERE
     return "Test"
 
 
+# Used when RESIDENT is True, yield a new value whenever it changes, the latest one is used in tweets
+def stream_values(inputs):
+    # YOUR CODE GOES HERE
+    while True:
+        yield perform_script(inputs)
+        time.sleep(60)
+
+
 # Don't touch this part of code as it may break functionality
-def create_dir_if_not_existing():
-    p = pathlib.Path(PATH_PREFIX)
+def create_dir_if_not_existing(path):
+    p = pathlib.Path(path).parent
     if not p.exists():
-        os.mkdir(f"./{PATH_PREFIX}")
+        os.makedirs(p)
 
 
-def save_to_file():
-    values = perform_script()
+def output_path():
+    # The runner passes a path unique for this script, names alone can repeat
     filename = os.path.basename(__file__)[:-3]
-    create_dir_if_not_existing()
+    return os.environ.get("SCRIPT_OUTPUT", f"{PATH_PREFIX}{filename}")
+
+
+def load_inputs():
+    return json.loads(os.environ.get("SCRIPT_INPUTS", "{}"))
+
+
+def remove_if_existing(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def save_to_file():
+    values = perform_script(load_inputs())
+    path = output_path()
+    create_dir_if_not_existing(path)
+
+    if isinstance(values, str):
+        remove_if_existing(f"{path}.json")
+        with open(f"{path}.txt", "w") as file:
+            file.write(values)
+            file.flush()
+    else:
+        remove_if_existing(f"{path}.txt")
+        with open(f"{path}.json", "w") as file:
+            json.dump(values, file)
+            file.flush()
+
 
-    with open(f"{PATH_PREFIX}{filename}.txt", "w") as file:
-        file.write(values)
-        file.flush()
+def publish_values():
+    for value in stream_values(load_inputs()):
+        sys.stdout.write(json.dumps({"value": value}) + "\n")
+        sys.stdout.flush()
 
 
 try:
-    save_to_file()
+    if RESIDENT:
+        publish_values()
+    else:
+        save_to_file()
 except Exception as e:
-    print(e)
+    # A non-zero exit tells the app this run produced no value
+    print(e, file=sys.stderr)
+    sys.exit(1)
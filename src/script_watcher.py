@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from helpers.logger import log_inf, log_err
+from resident_scripts import is_resident_script
+from script_interpreter import precompile_script
+from script_graph import ScriptGraphException, read_consumed_variables
+from script_runner import validate_script, invalidate_script_value, evaluate_script
+
+DEFAULT_DEBOUNCE_MS = 300
+
+
+def prewarm_script(path: str):
+    """Precompiles a script and runs it when it needs no inputs so its first value is cached."""
+    if validate_script(path):
+        return
+    precompile_script(path)
+    if is_resident_script(path):
+        return
+    try:
+        if not read_consumed_variables(path):
+            evaluate_script(path, {})
+    except (ScriptGraphException, OSError) as e:
+        log_err(f"Failed to pre-warm script {path}, error: {e}")
+
+
+class ScriptWatcher(QObject):
+    scriptReloaded = pyqtSignal(str)
+    scriptBroken = pyqtSignal(str, str)
+
+    def __init__(self, debounce_ms: int = DEFAULT_DEBOUNCE_MS, executor=None):
+        super(ScriptWatcher, self).__init__()
+        self.__debounce_ms = debounce_ms
+        # Pre-warming runs the script, it must not block the GUI thread
+        self.__executor = executor if executor is not None else ThreadPoolExecutor(max_workers=1)
+        self.__pending = set()
+        self.__watcher = QFileSystemWatcher()
+        self.__watcher.fileChanged.connect(self.__on_file_changed)
+
+    def watch(self, path: str):
+        if path not in self.__watcher.files():
+            self.__watcher.addPath(path)
+            log_inf(f"Watching script {path}")
+
+    def unwatch(self, path: str):
+        if path in self.__watcher.files():
+            self.__watcher.removePath(path)
+
+    def __on_file_changed(self, path: str):
+        if path in self.__pending:
+            return
+
+        self.__pending.add(path)
+        QTimer.singleShot(self.__debounce_ms, lambda: self.__reload(path))
+
+    def __reload(self, path: str):
+        self.__pending.discard(path)
+
+        # Editors often save by replacing the file, which drops the watch
+        if not os.path.exists(path):
+            log_err(f"Watched script {path} was removed")
+            self.scriptBroken.emit(path, f"Script {path} was removed!")
+            return
+        self.watch(path)
+
+        invalidate_script_value(path)
+        error = validate_script(path)
+        if error:
+            log_err(f"Script {path} contains errors: {error}")
+            self.scriptBroken.emit(path, error)
+            return
+
+        future = self.__executor.submit(prewarm_script, path)
+        future.add_done_callback(lambda _: self.__finish_reload(path))
+
+    def __finish_reload(self, path: str):
+        # Called on the executor thread, the signal is queued to the GUI thread
+        log_inf(f"Reloaded script {path}")
+        self.scriptReloaded.emit(path)
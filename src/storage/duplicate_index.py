@@ -0,0 +1,96 @@
+import hashlib
+import os
+import sqlite3
+import time
+
+from helpers.logger import log_inf
+from twitter_management.tweet_parsers import MAX_TWEET_LENGTH
+
+DEFAULT_POSTS_DB = "conf/posts.db"
+DEFAULT_MAX_ENTRIES = 1000
+# Twitter compares with recent tweets only, older content may be posted again
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+MAX_VARIATIONS = 100
+
+DUPLICATE_SKIP = "skip"
+DUPLICATE_VARY = "vary"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posted_hashes (
+    account TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    posted_at REAL NOT NULL,
+    PRIMARY KEY (account, hash)
+);
+CREATE INDEX IF NOT EXISTS posted_hashes_age_idx ON posted_hashes (account, posted_at);
+"""
+
+
+def content_hash(content: str):
+    normalized = " ".join(content.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class DuplicateIndex:
+    def __init__(
+        self,
+        file_path: str = DEFAULT_POSTS_DB,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age: float = DEFAULT_MAX_AGE,
+        clock=time.time,
+    ):
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.__max_entries = max_entries
+        self.__max_age = max_age
+        self.__clock = clock
+        self.__connection = sqlite3.connect(file_path)
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.executescript(SCHEMA)
+        self.__connection.commit()
+
+    def close(self):
+        self.__connection.close()
+
+    def is_duplicate(self, account: str, content: str):
+        row = self.__connection.execute(
+            "SELECT 1 FROM posted_hashes WHERE account = ? AND hash = ? AND posted_at > ?",
+            (account, content_hash(content), self.__clock() - self.__max_age),
+        ).fetchone()
+        return row is not None
+
+    def vary(self, account: str, content: str, max_length: int = MAX_TWEET_LENGTH):
+        """Content with a counter not posted yet, the text is cut so the counter fits in max_length."""
+        for variation in range(2, MAX_VARIATIONS):
+            suffix = f" ({variation})"
+            varied = content[: max_length - len(suffix)].rstrip() + suffix
+            if not self.is_duplicate(account, varied):
+                return varied
+
+        return None
+
+    def record(self, account: str, content: str):
+        now = self.__clock()
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO posted_hashes (account, hash, posted_at) VALUES (?, ?, ?)",
+                (account, content_hash(content), now),
+            )
+            self.__prune(account, now)
+
+    def __prune(self, account: str, now: float):
+        self.__connection.execute(
+            "DELETE FROM posted_hashes WHERE account = ? AND posted_at <= ?",
+            (account, now - self.__max_age),
+        )
+        removed = self.__connection.execute(
+            """DELETE FROM posted_hashes WHERE account = ? AND posted_at < (
+                SELECT posted_at FROM posted_hashes WHERE account = ?
+                ORDER BY posted_at DESC LIMIT 1 OFFSET ?
+            )""",
+            (account, account, self.__max_entries - 1),
+        ).rowcount
+        if removed:
+            log_inf(f"Pruned {removed} old content hashes of account {account}")
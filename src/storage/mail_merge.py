@@ -0,0 +1,132 @@
+import csv
+import os
+import time
+
+from helpers.logger import log_inf, log_wrn
+from storage.queue_import import (
+    DEFAULT_BATCH_SIZE,
+    MAX_REPORTED_ERRORS,
+    InvalidRowException,
+    read_jsonl_rows,
+)
+from twitter_management.tweet_parsers import MAX_TWEET_LENGTH, RenderedTweet, compile_template
+
+
+class MergeResult:
+    def __init__(self):
+        self.queued = 0
+        self.too_long = 0
+        self.missing = 0
+        self.rejected = 0
+        self.errors = []
+        self.cancelled = False
+
+    def flag(self, rendered):
+        if rendered.missing:
+            self.missing += 1
+        else:
+            self.too_long += 1
+        self.__add_error(rendered.index + 1, rendered.problem())
+
+    def reject(self, row: int, reason: str):
+        self.rejected += 1
+        self.__add_error(row, reason)
+
+    def __add_error(self, row: int, reason: str):
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((row, reason))
+
+    def __str__(self):
+        return f"Queued: {self.queued}, too long: {self.too_long}, missing variables: {self.missing}, rejected: {self.rejected}, cancelled: {self.cancelled}"
+
+
+def read_variable_rows(path: str, counter):
+    """Yields variable mappings of a CSV or JSONL file, counting read bytes.
+
+    A JSONL line which is not valid JSON is yielded as an InvalidRowException.
+    """
+    with open(path, "rb") as file:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            for _, row in read_jsonl_rows(file, counter):
+                yield row
+            return
+
+        def lines():
+            for raw in file:
+                counter[0] += len(raw)
+                yield raw.decode("utf-8-sig")
+
+        for row in csv.DictReader(lines()):
+            yield {key: value for key, value in row.items() if key}
+
+
+def merge_into_queue(
+    content: str,
+    rows,
+    queue,
+    profile: str,
+    start: float = None,
+    spacing: float = 0,
+    progress=None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+):
+    """Renders content for every row and queues the valid tweets in batches.
+
+    Tweets are scheduled spacing seconds apart from start, progress(queued)
+    is called after each batch and returning False from it cancels the merge.
+    """
+    if start is None:
+        start = time.time()
+
+    template = compile_template(content)
+    result = MergeResult()
+    batch = []
+    for index, values in enumerate(rows):
+        if isinstance(values, InvalidRowException):
+            result.reject(index + 1, str(values))
+            continue
+        if not isinstance(values, dict):
+            result.reject(index + 1, "Row must be an object")
+            continue
+
+        text, missing = template.render(values)
+        rendered = RenderedTweet(index, text, values, missing, len(text) > MAX_TWEET_LENGTH)
+        if not rendered.is_valid():
+            result.flag(rendered)
+            continue
+
+        scheduled_at = start + (result.queued + len(batch)) * spacing
+        batch.append((rendered.text, rendered.values, scheduled_at))
+        if len(batch) >= batch_size:
+            result.queued += queue.add_many(profile, batch)
+            batch = []
+            if progress and progress(result.queued) is False:
+                result.cancelled = True
+                break
+
+    if batch and not result.cancelled:
+        result.queued += queue.add_many(profile, batch)
+
+    if result.errors:
+        log_wrn(f"Flagged {len(result.errors)} merged tweets, first: {result.errors[:3]}")
+    log_inf(f"Merged template into queue of profile {profile}, {result}")
+    return result
+
+
+def merge_file_into_queue(path: str, content: str, queue, profile: str, spacing: float = 0, progress=None):
+    """Like merge_into_queue over a file, progress(queued, bytes_read, total_bytes)."""
+    total_bytes = os.path.getsize(path)
+    counter = [0]
+
+    def file_progress(queued):
+        return progress(queued, counter[0], total_bytes)
+
+    log_inf(f"Merging template with variables from {path}")
+    return merge_into_queue(
+        content,
+        read_variable_rows(path, counter),
+        queue,
+        profile,
+        spacing=spacing,
+        progress=file_progress if progress else None,
+    )
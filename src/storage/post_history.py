@@ -0,0 +1,131 @@
+import json
+import os
+import sqlite3
+import time
+
+DEFAULT_HISTORY_DB = "conf/history.db"
+DEFAULT_PAGE_SIZE = 200
+
+HISTORY_POSTED = "posted"
+HISTORY_FAILED = "failed"
+HISTORY_SKIPPED = "skipped"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS post_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    posted_at REAL NOT NULL,
+    account TEXT NOT NULL,
+    profile TEXT,
+    status TEXT NOT NULL,
+    content TEXT NOT NULL,
+    variables TEXT,
+    tweet_id TEXT,
+    latency REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS post_history_time_idx ON post_history (posted_at, id);
+CREATE INDEX IF NOT EXISTS post_history_account_idx ON post_history (account, posted_at, id);
+CREATE INDEX IF NOT EXISTS post_history_status_idx ON post_history (status, posted_at, id);
+"""
+
+COLUMNS = "id, posted_at, account, profile, status, content, variables, tweet_id, latency, error"
+
+
+class HistoryEntry:
+    def __init__(
+        self, entry_id, posted_at, account, profile, status, content, variables, tweet_id, latency, error
+    ):
+        self.id = entry_id
+        self.posted_at = posted_at
+        self.account = account
+        self.profile = profile
+        self.status = status
+        self.content = content
+        self.variables = json.loads(variables) if variables else {}
+        self.tweet_id = tweet_id
+        self.latency = latency
+        self.error = error
+
+    def __str__(self):
+        return f"History entry {self.id}: {self.status} by {self.account} at {self.posted_at}"
+
+
+class PostHistory:
+    def __init__(self, file_path: str = DEFAULT_HISTORY_DB, clock=time.time):
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.__clock = clock
+        self.__connection = sqlite3.connect(file_path)
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.executescript(SCHEMA)
+        self.__connection.commit()
+
+    def close(self):
+        self.__connection.close()
+
+    def record(
+        self,
+        account: str,
+        status: str,
+        content: str,
+        variables=None,
+        tweet_id=None,
+        latency=None,
+        error=None,
+        profile=None,
+    ):
+        with self.__connection:
+            cursor = self.__connection.execute(
+                f"INSERT INTO post_history ({COLUMNS}) VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.__clock(),
+                    account,
+                    profile,
+                    status,
+                    content,
+                    json.dumps(variables, default=str) if variables else None,
+                    tweet_id,
+                    latency,
+                    error,
+                ),
+            )
+
+        return cursor.lastrowid
+
+    def count(self, account=None, status=None):
+        where, params = self.__filters(account, status)
+        return self.__connection.execute(
+            f"SELECT COUNT(*) FROM post_history {where}", params
+        ).fetchone()[0]
+
+    def fetch(self, before=None, limit: int = DEFAULT_PAGE_SIZE, account=None, status=None):
+        """Returns newest entries first, before is the last entry of the previous page.
+
+        Pages are read by (posted_at, id) key instead of OFFSET, so deep pages
+        cost the same as the first one.
+        """
+        where, params = self.__filters(account, status)
+        if before is not None:
+            where += (" AND " if where else "WHERE ") + "(posted_at, id) < (?, ?)"
+            params += [before.posted_at, before.id]
+
+        rows = self.__connection.execute(
+            f"SELECT {COLUMNS} FROM post_history {where} ORDER BY posted_at DESC, id DESC LIMIT ?",
+            params + [limit],
+        )
+        return [HistoryEntry(*row) for row in rows]
+
+    @staticmethod
+    def __filters(account, status):
+        conditions = []
+        params = []
+        if account is not None:
+            conditions.append("account = ?")
+            params.append(account)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+
+        return ("WHERE " + " AND ".join(conditions) if conditions else ""), params
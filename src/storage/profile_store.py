@@ -0,0 +1,332 @@
+import configparser
+import datetime
+import os
+import sqlite3
+import time
+
+from helpers.logger import log_inf, log_err
+
+DEFAULT_PROFILE_DB = "conf/profiles.db"
+DEFAULT_PROFILE_NAME = "Default"
+DEFAULT_ACCOUNT = "default"
+INI_MIGRATED_KEY = "ini_migrated"
+ACTIVE_PROFILE_KEY = "active_profile"
+
+SCHEDULE_FIELDS = ("seconds", "minutes", "hours", "days", "date", "cron")
+
+# Columns added after the first release, created on older databases on open
+ADDED_PROFILE_COLUMNS = (
+    ("account", f"TEXT NOT NULL DEFAULT '{DEFAULT_ACCOUNT}'"),
+    ("cron", "TEXT"),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    template TEXT NOT NULL DEFAULT '',
+    seconds INTEGER,
+    minutes INTEGER,
+    hours INTEGER,
+    days INTEGER,
+    date TEXT,
+    cron TEXT,
+    account TEXT NOT NULL DEFAULT 'default',
+    updated_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS profiles_name_idx ON profiles (name);
+
+CREATE TABLE IF NOT EXISTS script_bindings (
+    profile_id INTEGER NOT NULL REFERENCES profiles (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    var TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (profile_id, position)
+);
+CREATE INDEX IF NOT EXISTS script_bindings_var_idx ON script_bindings (profile_id, var);
+
+CREATE INDEX IF NOT EXISTS profiles_account_idx ON profiles (account);
+
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS accounts (
+    name TEXT PRIMARY KEY,
+    access_token TEXT NOT NULL,
+    access_secret TEXT NOT NULL
+);
+"""
+
+
+class ProfileStoreException(Exception):
+    pass
+
+
+class Profile:
+    def __init__(self, name):
+        self.name = name
+        self.template = ""
+        self.seconds = None
+        self.minutes = None
+        self.hours = None
+        self.days = None
+        self.date = None
+        self.cron = None
+        self.account = DEFAULT_ACCOUNT
+        self.scripts = []
+
+    def __str__(self):
+        return f"Profile {self.name}: Seconds: {self.seconds}, Minutes: {self.minutes}, Hours: {self.hours}, Days: {self.days}, date: {self.date}, scripts: {self.scripts}"
+
+
+class ProfileStore:
+    def __init__(self, file_path: str = DEFAULT_PROFILE_DB, check_same_thread: bool = True):
+        """Without check_same_thread the store can be opened on one thread and handed to another."""
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.__connection = sqlite3.connect(file_path, check_same_thread=check_same_thread)
+        self.__connection.execute("PRAGMA foreign_keys = ON")
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__upgrade_schema()
+        self.__connection.executescript(SCHEMA)
+        self.__connection.commit()
+        restrict_permissions(file_path)
+        log_inf(f"Opened profile store {file_path}")
+
+    def close(self):
+        self.__connection.close()
+
+    # profiles
+    def list_profiles(self):
+        rows = self.__connection.execute("SELECT name FROM profiles ORDER BY name")
+        return [row[0] for row in rows]
+
+    def create_profile(self, name: str, template: str = ""):
+        try:
+            with self.__connection:
+                self.__connection.execute(
+                    "INSERT INTO profiles (name, template, updated_at) VALUES (?, ?, ?)",
+                    (name, template, time.time()),
+                )
+        except sqlite3.IntegrityError:
+            raise ProfileStoreException(f"Profile {name} already exists!")
+
+        log_inf(f"Created profile {name}")
+        return self.load_profile(name)
+
+    def delete_profile(self, name: str):
+        with self.__connection:
+            self.__connection.execute("DELETE FROM profiles WHERE name = ?", (name,))
+
+    def load_profile(self, name: str):
+        row = self.__connection.execute(
+            "SELECT id, template, seconds, minutes, hours, days, date, cron, account FROM profiles WHERE name = ?",
+            (name,),
+        ).fetchone()
+        if row is None:
+            raise ProfileStoreException(f"Profile {name} doesn't exist!")
+
+        profile = Profile(name)
+        (
+            profile_id,
+            profile.template,
+            profile.seconds,
+            profile.minutes,
+            profile.hours,
+            profile.days,
+            profile.date,
+            profile.cron,
+            profile.account,
+        ) = row
+        profile.scripts = [
+            (var, path)
+            for var, path in self.__connection.execute(
+                "SELECT var, path FROM script_bindings WHERE profile_id = ? ORDER BY position",
+                (profile_id,),
+            )
+        ]
+
+        return profile
+
+    # incremental saves
+    def save_template(self, name: str, template: str):
+        self.__update(name, "template = ?", (template,))
+
+    def save_schedule(self, name: str, **fields):
+        for field in fields:
+            if field not in SCHEDULE_FIELDS:
+                raise ProfileStoreException(f"Unknown schedule field {field}!")
+
+        if not fields:
+            return
+
+        assignments = ", ".join(f"{field} = ?" for field in fields)
+        self.__update(name, assignments, tuple(fields.values()))
+
+    def save_account(self, name: str, account: str):
+        self.__update(name, "account = ?", (account,))
+
+    def save_scripts(self, name: str, scripts):
+        profile_id = self.__profile_id(name)
+        with self.__connection:
+            self.__connection.execute(
+                "DELETE FROM script_bindings WHERE profile_id = ?", (profile_id,)
+            )
+            self.__connection.executemany(
+                "INSERT INTO script_bindings (profile_id, position, var, path) VALUES (?, ?, ?, ?)",
+                [
+                    (profile_id, position, var, path)
+                    for position, (var, path) in enumerate(scripts)
+                ],
+            )
+            self.__connection.execute(
+                "UPDATE profiles SET updated_at = ? WHERE id = ?",
+                (time.time(), profile_id),
+            )
+
+    def __upgrade_schema(self):
+        columns = [
+            row[1] for row in self.__connection.execute("PRAGMA table_info(profiles)")
+        ]
+        if not columns:
+            return
+
+        for column, definition in ADDED_PROFILE_COLUMNS:
+            if column not in columns:
+                self.__connection.execute(
+                    f"ALTER TABLE profiles ADD COLUMN {column} {definition}"
+                )
+
+    def __update(self, name: str, assignments: str, values):
+        with self.__connection:
+            cursor = self.__connection.execute(
+                f"UPDATE profiles SET {assignments}, updated_at = ? WHERE name = ?",
+                (*values, time.time(), name),
+            )
+        if cursor.rowcount == 0:
+            raise ProfileStoreException(f"Profile {name} doesn't exist!")
+
+    def __profile_id(self, name: str):
+        row = self.__connection.execute(
+            "SELECT id FROM profiles WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            raise ProfileStoreException(f"Profile {name} doesn't exist!")
+
+        return row[0]
+
+    # signed in accounts, profiles refer to them by name
+    def save_account_tokens(self, name: str, access_token: str, access_secret: str):
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO accounts (name, access_token, access_secret) VALUES (?, ?, ?)",
+                (name, access_token, access_secret),
+            )
+        log_inf(f"Saved tokens of account {name}")
+
+    def load_account_tokens(self):
+        """Returns (name, access_token, access_secret) of every saved account."""
+        return self.__connection.execute(
+            "SELECT name, access_token, access_secret FROM accounts ORDER BY name"
+        ).fetchall()
+
+    def delete_account_tokens(self, name: str):
+        with self.__connection:
+            self.__connection.execute("DELETE FROM accounts WHERE name = ?", (name,))
+
+    # application settings
+    def get_setting(self, key: str, default=None):
+        row = self.__connection.execute(
+            "SELECT value FROM settings WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row is not None else default
+
+    def set_setting(self, key: str, value):
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                (key, None if value is None else str(value)),
+            )
+
+    def get_active_profile(self):
+        return self.get_setting(ACTIVE_PROFILE_KEY)
+
+    def set_active_profile(self, name: str):
+        self.set_setting(ACTIVE_PROFILE_KEY, name)
+
+    # migration
+    def migrate_from_ini(self, file_name: str):
+        if self.get_setting(INI_MIGRATED_KEY) or not os.path.exists(file_name):
+            return False
+
+        log_inf(f"Migrating config file {file_name} to profile store")
+        config = configparser.ConfigParser()
+        try:
+            config.read(file_name)
+        except configparser.Error as e:
+            log_err(f"Failed to migrate config file {file_name}, error: {e}")
+            return False
+
+        if "Default" in config and "window_name" in config["Default"]:
+            self.set_setting("window_name", config["Default"]["window_name"])
+        if "Dimensions" in config:
+            for key, value in config["Dimensions"].items():
+                self.set_setting(key, value)
+
+        template = ""
+        if "Twitter area" in config:
+            template = config["Twitter area"].get("content", "")
+
+        if DEFAULT_PROFILE_NAME not in self.list_profiles():
+            self.create_profile(DEFAULT_PROFILE_NAME, template)
+
+        if "Parameters" in config:
+            parameters = config["Parameters"]
+            schedule = {}
+            for field in ("seconds", "minutes", "hours", "days"):
+                schedule[field] = read_ini_number(parameters, field)
+            if parameters.get("date"):
+                try:
+                    schedule["date"] = convert_ini_date(parameters["date"])
+                except (ValueError, TypeError) as e:
+                    log_err(f"Skipping invalid date {parameters['date']!r} in config file, error: {e}")
+            if parameters.get("cron"):
+                schedule["cron"] = parameters["cron"]
+            self.save_schedule(DEFAULT_PROFILE_NAME, **schedule)
+
+        if not self.get_active_profile():
+            self.set_active_profile(DEFAULT_PROFILE_NAME)
+        self.set_setting(INI_MIGRATED_KEY, 1)
+        log_inf(f"Migrated config file {file_name}")
+        return True
+
+
+def restrict_permissions(file_path: str):
+    """Account tokens are stored in plain text, only the owner may read the store."""
+    for path in (file_path, f"{file_path}-wal", f"{file_path}-shm"):
+        try:
+            if os.path.exists(path):
+                os.chmod(path, 0o600)
+        except OSError as e:
+            log_err(f"Failed to restrict permissions of {path}, error: {e}")
+
+
+def read_ini_number(parameters, field: str):
+    """Zero, empty and invalid values are not set, invalid ones are logged."""
+    value = parameters.get(field, "").strip()
+    if not value:
+        return None
+
+    try:
+        return int(value) or None
+    except ValueError:
+        log_err(f"Skipping invalid {field} value {value!r} in config file")
+        return None
+
+
+def convert_ini_date(value: str):
+    return datetime.datetime(*map(int, value.split(","))).isoformat()
@@ -0,0 +1,150 @@
+import csv
+import datetime
+import json
+import os
+
+from helpers.logger import log_inf, log_wrn
+from twitter_management.tweet_parsers import MAX_TWEET_LENGTH
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+TEXT_COLUMN = "text"
+SCHEDULE_COLUMN = "scheduled_at"
+VARIABLES_COLUMN = "variables"
+
+
+class InvalidRowException(Exception):
+    pass
+
+
+class ImportResult:
+    def __init__(self):
+        self.imported = 0
+        self.rejected = 0
+        self.errors = []
+        self.cancelled = False
+
+    def reject(self, line: int, reason: str):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, reason))
+
+    def __str__(self):
+        return f"Imported: {self.imported}, rejected: {self.rejected}, cancelled: {self.cancelled}"
+
+
+def read_jsonl_rows(file, counter):
+    for line_number, raw in enumerate(file, start=1):
+        counter[0] += len(raw)
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, InvalidRowException(f"Invalid JSON: {e}")
+            continue
+        yield line_number, row
+
+
+def read_csv_rows(file, counter):
+    def lines():
+        for raw in file:
+            counter[0] += len(raw)
+            yield raw.decode("utf-8-sig")
+
+    reader = csv.DictReader(lines())
+    for row in reader:
+        # Extra columns are variables, a 'variables' column may hold JSON
+        variables = {
+            key: value
+            for key, value in row.items()
+            if key not in (TEXT_COLUMN, SCHEDULE_COLUMN, VARIABLES_COLUMN) and key and value
+        }
+        if row.get(VARIABLES_COLUMN):
+            try:
+                variables.update(json.loads(row[VARIABLES_COLUMN]))
+            except ValueError as e:
+                yield reader.line_num, InvalidRowException(f"Invalid variables JSON: {e}")
+                continue
+
+        yield reader.line_num, {
+            TEXT_COLUMN: row.get(TEXT_COLUMN),
+            SCHEDULE_COLUMN: row.get(SCHEDULE_COLUMN),
+            VARIABLES_COLUMN: variables,
+        }
+
+
+def parse_schedule(value):
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    try:
+        return datetime.datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        raise InvalidRowException(f"Invalid schedule date {value}")
+
+
+def validate_row(row):
+    if not isinstance(row, dict):
+        raise InvalidRowException("Row must be an object")
+
+    text = row.get(TEXT_COLUMN)
+    if not isinstance(text, str) or not text.strip():
+        raise InvalidRowException("Tweet text is empty")
+    if len(text) > MAX_TWEET_LENGTH and "{" not in text:
+        raise InvalidRowException(f"Tweet is longer than {MAX_TWEET_LENGTH} characters")
+
+    variables = row.get(VARIABLES_COLUMN) or {}
+    if not isinstance(variables, dict):
+        raise InvalidRowException("Variables must be an object")
+
+    return (
+        text,
+        {str(key): str(value) for key, value in variables.items()},
+        parse_schedule(row.get(SCHEDULE_COLUMN)),
+    )
+
+
+def import_queue(path: str, queue, profile: str, progress=None, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Streams rows of a CSV or JSONL file into the tweet queue in batches.
+
+    progress(imported, bytes_read, total_bytes) is called after each batch,
+    returning False from it cancels the import after that batch.
+    """
+    total_bytes = os.path.getsize(path)
+    reader = read_jsonl_rows if path.lower().endswith((".jsonl", ".ndjson")) else read_csv_rows
+    counter = [0]
+    result = ImportResult()
+    batch = []
+
+    log_inf(f"Importing tweet queue from {path}")
+    with open(path, "rb") as file:
+        for line_number, row in reader(file, counter):
+            try:
+                if isinstance(row, InvalidRowException):
+                    raise row
+                batch.append(validate_row(row))
+            except InvalidRowException as e:
+                result.reject(line_number, str(e))
+                continue
+
+            if len(batch) >= batch_size:
+                result.imported += queue.add_many(profile, batch)
+                batch = []
+                if progress and progress(result.imported, counter[0], total_bytes) is False:
+                    result.cancelled = True
+                    break
+
+        if batch and not result.cancelled:
+            result.imported += queue.add_many(profile, batch)
+
+    if progress and not result.cancelled:
+        progress(result.imported, total_bytes, total_bytes)
+    if result.rejected:
+        log_wrn(f"Rejected {result.rejected} rows of {path}, first: {result.errors[:3]}")
+    log_inf(f"Imported tweet queue from {path}, {result}")
+    return result
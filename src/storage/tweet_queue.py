@@ -0,0 +1,119 @@
+import json
+import os
+import sqlite3
+import time
+
+from helpers.logger import log_inf
+
+DEFAULT_QUEUE_DB = "conf/queue.db"
+
+STATUS_PENDING = "pending"
+STATUS_POSTING = "posting"
+STATUS_POSTED = "posted"
+STATUS_FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queued_tweets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    profile TEXT NOT NULL,
+    text TEXT NOT NULL,
+    variables TEXT,
+    scheduled_at REAL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS queued_tweets_due_idx ON queued_tweets (profile, status, scheduled_at);
+"""
+
+
+class QueuedTweet:
+    def __init__(self, tweet_id, profile, text, variables, scheduled_at):
+        self.id = tweet_id
+        self.profile = profile
+        self.text = text
+        self.variables = variables
+        self.scheduled_at = scheduled_at
+
+    def __str__(self):
+        return f"Queued tweet {self.id} of {self.profile} at {self.scheduled_at}"
+
+
+class TweetQueue:
+    def __init__(self, file_path: str = DEFAULT_QUEUE_DB):
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.__connection = sqlite3.connect(file_path)
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.executescript(SCHEMA)
+        self.__connection.commit()
+        self.__requeue_in_flight()
+
+    def __requeue_in_flight(self):
+        # Tweets still posting when the app stopped never got a result
+        with self.__connection:
+            requeued = self.__connection.execute(
+                "UPDATE queued_tweets SET status = ? WHERE status = ?",
+                (STATUS_PENDING, STATUS_POSTING),
+            ).rowcount
+        if requeued:
+            log_inf(f"Moved {requeued} tweets which were posting back to pending")
+
+    def close(self):
+        self.__connection.close()
+
+    def add_many(self, profile: str, tweets):
+        """Inserts (text, variables, scheduled_at) tuples in one transaction."""
+        now = time.time()
+        with self.__connection:
+            cursor = self.__connection.executemany(
+                "INSERT INTO queued_tweets (profile, text, variables, scheduled_at, created_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        profile,
+                        text,
+                        json.dumps(variables) if variables else None,
+                        scheduled_at,
+                        now,
+                    )
+                    for text, variables, scheduled_at in tweets
+                ),
+            )
+
+        return cursor.rowcount
+
+    def due(self, profile: str, now: float, limit: int = 10):
+        rows = self.__connection.execute(
+            """SELECT id, profile, text, variables, scheduled_at FROM queued_tweets
+            WHERE profile = ? AND status = ? AND (scheduled_at IS NULL OR scheduled_at <= ?)
+            ORDER BY scheduled_at IS NOT NULL, scheduled_at, id LIMIT ?""",
+            (profile, STATUS_PENDING, now, limit),
+        )
+        return [
+            QueuedTweet(
+                tweet_id, profile, text, json.loads(variables) if variables else {}, scheduled_at
+            )
+            for tweet_id, profile, text, variables, scheduled_at in rows
+        ]
+
+    def mark(self, tweet_id: int, status: str):
+        with self.__connection:
+            self.__connection.execute(
+                "UPDATE queued_tweets SET status = ? WHERE id = ?", (status, tweet_id)
+            )
+
+    def count(self, profile: str, status: str = STATUS_PENDING):
+        return self.__connection.execute(
+            "SELECT COUNT(*) FROM queued_tweets WHERE profile = ? AND status = ?",
+            (profile, status),
+        ).fetchone()[0]
+
+    def clear_pending(self, profile: str):
+        with self.__connection:
+            removed = self.__connection.execute(
+                "DELETE FROM queued_tweets WHERE profile = ? AND status = ?",
+                (profile, STATUS_PENDING),
+            ).rowcount
+        log_inf(f"Removed {removed} pending tweets of profile {profile}")
+        return removed
@@ -0,0 +1,63 @@
+import threading
+
+from helpers.logger import log_inf
+from twitter_management.authorization import Authenticator, authenticator
+
+DEFAULT_ACCOUNT = "default"
+
+
+class AccountException(Exception):
+    pass
+
+
+class AccountManager:
+    def __init__(self, default_authenticator):
+        self.__lock = threading.Lock()
+        self.__authenticators = {DEFAULT_ACCOUNT: default_authenticator}
+
+    def add_account(self, name: str):
+        with self.__lock:
+            if name in self.__authenticators:
+                raise AccountException(f"Account {name} already exists!")
+
+            new_authenticator = Authenticator()
+            if not new_authenticator.fetch_api_oauth_tokens():
+                raise AccountException(f"Couldn't fetch OAuth tokens for account {name}!")
+
+            self.__authenticators[name] = new_authenticator
+
+        log_inf(f"Added account {name}")
+        return new_authenticator
+
+    def restore_account(self, name: str, access_token: str, access_secret: str):
+        """Adds an account signed in earlier, its PIN flow doesn't have to be repeated."""
+        restored = Authenticator()
+        restored.set_access_tokens(access_token, access_secret)
+        with self.__lock:
+            if name == DEFAULT_ACCOUNT:
+                raise AccountException("Default account signs in on start!")
+            self.__authenticators[name] = restored
+
+        log_inf(f"Restored account {name}")
+        return restored
+
+    def remove_account(self, name: str):
+        if name == DEFAULT_ACCOUNT:
+            raise AccountException("Default account can't be removed!")
+
+        with self.__lock:
+            self.__authenticators.pop(name, None)
+
+    def get(self, name: str):
+        with self.__lock:
+            if name not in self.__authenticators:
+                raise AccountException(f"Account {name} doesn't exist!")
+
+            return self.__authenticators[name]
+
+    def names(self):
+        with self.__lock:
+            return list(self.__authenticators)
+
+
+account_manager = AccountManager(authenticator)
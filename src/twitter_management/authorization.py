@@ -41,6 +41,9 @@ class Authenticator:
         self.__oauth_secret = fetch_response.get("oauth_token_secret")
         return True
 
+    def has_request_token(self):
+        return self.__oauth is not None and self.__oauth_token is not None
+
     def get_authorization_url(self):
         return self.__oauth.authorization_url(BASE_AUTHORIZATION_URL)
 
@@ -50,6 +53,14 @@ class Authenticator:
     def get_access_token_secret(self):
         return self.__access_secret
 
+    def set_access_tokens(self, access_token: str, access_secret: str):
+        """Signs in with tokens saved from an earlier PIN sign in."""
+        self.__access_token = access_token
+        self.__access_secret = access_secret
+
+    def is_signed_in(self):
+        return self.__access_token is not None and self.__access_secret is not None
+
     def sign_in_with_pin(self, pin: str):
         oauth = OAuth1Session(
             self.__api_key,
@@ -67,14 +78,22 @@ class Authenticator:
 
         self.__access_token = oauth_tokens["oauth_token"]
         self.__access_secret = oauth_tokens["oauth_token_secret"]
-
-        log_inf(self.__access_token)
-        log_inf(self.__access_secret)
+        log_inf("Signed in with PIN")
 
 
 authenticator = Authenticator()
-fetch_output = authenticator.fetch_api_oauth_tokens()
+# Request tokens are fetched by a startup stage instead of on import
+fetch_output = None
+
+
+def prefetch_oauth_tokens():
+    global fetch_output
+    fetch_output = authenticator.fetch_api_oauth_tokens()
+    return fetch_output
+
 
 def get_fetch_output():
     global fetch_output
+    if fetch_output is None:
+        prefetch_oauth_tokens()
     return fetch_output
\ No newline at end of file
@@ -0,0 +1,201 @@
+import mimetypes
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from helpers.logger import log_inf, log_err
+from helpers.tracing import tracer, submit_in_context
+
+UPLOAD_URL = "https://upload.twitter.com/1.1/media/upload.json"
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+# Used when FINALIZE doesn't tell how long the media id stays valid
+DEFAULT_MEDIA_VALIDITY = 24 * 60 * 60
+# Cached ids are dropped a bit before Twitter forgets them
+VALIDITY_MARGIN = 60
+MAX_STATUS_CHECKS = 60
+
+
+class MediaNotUploadedException(Exception):
+    pass
+
+
+def media_category(media_type: str):
+    if media_type == "image/gif":
+        return "tweet_gif"
+    if media_type.startswith("video/"):
+        return "tweet_video"
+    return "tweet_image"
+
+
+class MediaCache:
+    def __init__(self, clock=time.time):
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__entries = {}
+
+    @staticmethod
+    def key(account: str, path: str):
+        stat = os.stat(path)
+        return (account, os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    def get(self, key):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+
+            media_id, expires_at = entry
+            if expires_at <= self.__clock():
+                del self.__entries[key]
+                return None
+
+            return media_id
+
+    def put(self, key, media_id: str, valid_for: float):
+        with self.__lock:
+            self.__entries[key] = (
+                media_id,
+                self.__clock() + max(valid_for - VALIDITY_MARGIN, 0),
+            )
+
+
+class MediaUploader:
+    def __init__(
+        self,
+        session_factory,
+        upload_url: str = UPLOAD_URL,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: MediaCache = None,
+        sleep=time.sleep,
+    ):
+        self.__session_factory = session_factory
+        self.__upload_url = upload_url
+        self.__chunk_size = chunk_size
+        self.__pool = ThreadPoolExecutor(max_workers=max_workers)
+        self.__cache = cache if cache is not None else MediaCache()
+        self.__sleep = sleep
+        self.__local = threading.local()
+
+    def upload(self, path: str, account: str):
+        with tracer.span("media.upload", **{"media.path": path}):
+            return self.__upload(path, account)
+
+    def __upload(self, path: str, account: str):
+        key = MediaCache.key(account, path)
+        with tracer.span("media.cache_lookup", **{"media.path": path}) as span:
+            media_id = self.__cache.get(key)
+            span.set_attribute("cache.hit", media_id is not None)
+        if media_id:
+            log_inf(f"Reusing media id {media_id} for {path}")
+            return media_id
+
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        size = os.path.getsize(path)
+        if size == 0:
+            raise MediaNotUploadedException(f"Media file {path} is empty!")
+
+        media_id = self.__command(
+            account,
+            {
+                "command": "INIT",
+                "total_bytes": size,
+                "media_type": media_type,
+                "media_category": media_category(media_type),
+            },
+        )["media_id_string"]
+
+        self.__append_chunks(path, account, media_id)
+
+        response = self.__command(account, {"command": "FINALIZE", "media_id": media_id})
+        response = self.__wait_for_processing(account, media_id, response)
+
+        self.__cache.put(
+            key, media_id, response.get("expires_after_secs", DEFAULT_MEDIA_VALIDITY)
+        )
+        log_inf(f"Uploaded {path} as media {media_id}")
+        return media_id
+
+    def shutdown(self):
+        self.__pool.shutdown()
+
+    def __append_chunks(self, path: str, account: str, media_id: str):
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            futures = [
+                submit_in_context(
+                    self.__pool, self.__append, account, media_id, index, mapped, offset
+                )
+                for index, offset in enumerate(range(0, len(mapped), self.__chunk_size))
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            finally:
+                # Every chunk view must be released before the mapping is closed
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+
+    def __append(self, account: str, media_id: str, index: int, mapped, offset: int):
+        with memoryview(mapped) as view, view[offset : offset + self.__chunk_size] as chunk:
+            response = self.__session(account).post(
+                self.__upload_url,
+                data={"command": "APPEND", "media_id": media_id, "segment_index": index},
+                files={"media": ("chunk", chunk)},
+            )
+
+        if response.status_code // 100 != 2:
+            raise MediaNotUploadedException(
+                f"Chunk {index} of media {media_id} returned an error: {response.status_code}, {response.text}"
+            )
+
+    def __wait_for_processing(self, account: str, media_id: str, response):
+        for _ in range(MAX_STATUS_CHECKS):
+            processing = response.get("processing_info")
+            if not processing or processing.get("state") == "succeeded":
+                return response
+            if processing.get("state") == "failed":
+                raise MediaNotUploadedException(
+                    f"Processing of media {media_id} failed: {processing.get('error')}"
+                )
+
+            self.__sleep(processing.get("check_after_secs", 1))
+            response = self.__command(
+                account, {"command": "STATUS", "media_id": media_id}, method="get"
+            )
+
+        raise MediaNotUploadedException(f"Processing of media {media_id} timed out!")
+
+    def __command(self, account: str, params, method: str = "post"):
+        session = self.__session(account)
+        with tracer.span(
+            "http.request",
+            **{"http.method": method.upper(), "http.url": self.__upload_url, "media.command": params["command"]},
+        ) as span:
+            if method == "get":
+                response = session.get(self.__upload_url, params=params)
+            else:
+                response = session.post(self.__upload_url, data=params)
+            span.set_attribute("http.status_code", response.status_code)
+
+        if response.status_code // 100 != 2:
+            log_err(f"Media {params['command']} failed: {response.status_code}")
+            raise MediaNotUploadedException(
+                f"Media {params['command']} returned an error: {response.status_code}, {response.text}"
+            )
+
+        return response.json()
+
+    def __session(self, account: str):
+        sessions = getattr(self.__local, "sessions", None)
+        if sessions is None:
+            sessions = self.__local.sessions = {}
+        if account not in sessions:
+            sessions[account] = self.__session_factory(account)
+
+        return sessions[account]
@@ -1,7 +1,10 @@
 import os
 
 from requests_oauthlib import OAuth1Session
+from helpers.tracing import tracer
 from twitter_management.authorization import authenticator
+from twitter_management.accounts import account_manager
+from twitter_management.media_upload import MediaUploader
 
 POST_URL = "https://api.twitter.com/2/tweets"
 
@@ -17,18 +20,27 @@ def get_api_keys():
     return api_key, api_secret
 
 
-def post(content):
+def create_session(account_authenticator=authenticator):
     keys = get_api_keys()
-    access_token = authenticator.get_access_token()
-    access_token_secret = authenticator.get_access_token_secret()
-    oauth = OAuth1Session(
+    access_token = account_authenticator.get_access_token()
+    access_token_secret = account_authenticator.get_access_token_secret()
+
+    return OAuth1Session(
         keys[0],
         client_secret=keys[1],
         resource_owner_key=access_token,
         resource_owner_secret=access_token_secret,
     )
 
-    return oauth.post(POST_URL, json=content)
+
+def post(content, account_authenticator=authenticator):
+    oauth = create_session(account_authenticator)
+
+    with tracer.span("http.request", **{"http.method": "POST", "http.url": POST_URL}) as span:
+        response = oauth.post(POST_URL, json=content)
+        span.set_attribute("http.status_code", response.status_code)
+
+    return response
 
 
 def check_return_code(response):
@@ -36,3 +48,33 @@ def check_return_code(response):
         raise TweetNotPostedException(
             f"Request returned an error: {response.status_code}, {response.text}"
         )
+
+
+def get_tweet_id(response):
+    try:
+        return response.json().get("data", {}).get("id")
+    except ValueError:
+        return None
+
+
+def read_post_result(future):
+    """Returns (tweet_id, error) of a finished post, any failure is returned as the error."""
+    try:
+        response = future.result()
+        check_return_code(response)
+        return get_tweet_id(response), None
+    except Exception as e:
+        return None, e
+
+
+media_uploader = MediaUploader(
+    lambda account: create_session(account_manager.get(account))
+)
+
+
+def post_for_account(account, content, media_paths=()):
+    if media_paths:
+        media_ids = [media_uploader.upload(path, account) for path in media_paths]
+        content = dict(content, media={"media_ids": media_ids})
+
+    return post(content, account_manager.get(account))
@@ -0,0 +1,158 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from helpers.logger import log_inf, log_err, log_wrn
+from helpers.tracing import tracer
+
+DEFAULT_MAX_WORKERS = 4
+# Twitter API v2 allows 200 tweets per user in a 15 minutes window
+DEFAULT_RATE_CAPACITY = 200
+DEFAULT_RATE_PERIOD = 15 * 60
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        capacity: int = DEFAULT_RATE_CAPACITY,
+        period: float = DEFAULT_RATE_PERIOD,
+        clock=time.monotonic,
+    ):
+        self.__capacity = capacity
+        self.__refill_rate = capacity / period
+        self.__clock = clock
+        self.__tokens = float(capacity)
+        self.__last = clock()
+
+    def try_acquire(self):
+        now = self.__clock()
+        self.__tokens = min(
+            self.__capacity, self.__tokens + (now - self.__last) * self.__refill_rate
+        )
+        self.__last = now
+
+        if self.__tokens >= 1:
+            self.__tokens -= 1
+            return 0
+
+        return (1 - self.__tokens) / self.__refill_rate
+
+
+class PostingPool:
+    def __init__(self, post_fn, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.__post_fn = post_fn
+        self.__condition = threading.Condition()
+        self.__queues = {}
+        self.__order = deque()
+        self.__limiters = {}
+        self.__in_flight = set()
+        self.__stopped = False
+        self.__workers = [
+            threading.Thread(target=self.__work, name=f"poster-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self.__workers:
+            worker.start()
+
+    def set_rate_limit(self, account: str, capacity: int, period: float):
+        with self.__condition:
+            self.__limiters[account] = RateLimiter(capacity, period)
+
+    def submit(self, account: str, content, *args):
+        future = Future()
+        with self.__condition:
+            if self.__stopped:
+                raise RuntimeError("Posting pool is stopped!")
+
+            if account not in self.__queues:
+                self.__queues[account] = deque()
+                self.__order.append(account)
+            if account not in self.__limiters:
+                self.__limiters[account] = RateLimiter()
+
+            # Posts run in the submitter's context so they join its trace
+            self.__queues[account].append(
+                (content, args, future, contextvars.copy_context(), time.time_ns())
+            )
+            self.__condition.notify()
+
+        return future
+
+    def pending(self, account: str):
+        with self.__condition:
+            return len(self.__queues.get(account, ()))
+
+    def shutdown(self):
+        """Waits for posts in flight, posts still queued are cancelled."""
+        with self.__condition:
+            self.__stopped = True
+            queued = [job for queue in self.__queues.values() for job in queue]
+            for queue in self.__queues.values():
+                queue.clear()
+            self.__condition.notify_all()
+
+        for _, _, future, _, _ in queued:
+            # Notified like a job skipped by a worker, so wait() sees it too
+            if future.cancel():
+                future.set_running_or_notify_cancel()
+        if queued:
+            log_wrn(f"Cancelled {len(queued)} queued posts on shutdown")
+
+        for worker in self.__workers:
+            worker.join()
+
+    # Accounts are visited round robin, each one has at most one post in
+    # flight, so a busy account can't starve the others
+    def __next_job(self):
+        wait = None
+        for _ in range(len(self.__order)):
+            account = self.__order[0]
+            self.__order.rotate(-1)
+
+            queue = self.__queues[account]
+            if not queue or account in self.__in_flight:
+                continue
+
+            delay = self.__limiters[account].try_acquire()
+            if delay:
+                wait = delay if wait is None else min(wait, delay)
+                continue
+
+            self.__in_flight.add(account)
+            content, args, future, context, submitted_ns = queue.popleft()
+            return (account, content, args, future, context, submitted_ns), None
+
+        return None, wait
+
+    def __work(self):
+        while True:
+            with self.__condition:
+                job = None
+                while job is None:
+                    if self.__stopped:
+                        return
+                    job, wait = self.__next_job()
+                    if job is None:
+                        self.__condition.wait(wait)
+
+            account, content, args, future, context, submitted_ns = job
+            try:
+                context.run(self.__run_job, account, content, args, future, submitted_ns)
+            finally:
+                with self.__condition:
+                    self.__in_flight.discard(account)
+                    self.__condition.notify_all()
+
+    def __run_job(self, account, content, args, future, submitted_ns):
+        tracer.record_span(
+            "posting.rate_limit_wait", submitted_ns, time.time_ns(), **{"account": account}
+        )
+        try:
+            if future.set_running_or_notify_cancel():
+                future.set_result(self.__post_fn(account, content, *args))
+                log_inf(f"Posted for account {account}")
+        except Exception as e:
+            log_err(f"Failed to post for account {account}, error: {e}")
+            future.set_exception(e)
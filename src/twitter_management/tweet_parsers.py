@@ -1,12 +1,146 @@
+import functools
+import re
+
+# Variable names may contain any character but braces, e.g. {my var}
+PLACEHOLDER_PATTERN = re.compile(r"\{([^{}]+)\}")
+MAX_TWEET_LENGTH = 280
+
+
+class UnresolvedPlaceholderException(Exception):
+    pass
+
+
+@functools.lru_cache(maxsize=32)
+def find_placeholders(content: str):
+    return frozenset(PLACEHOLDER_PATTERN.findall(content))
+
+
+def placeholder_variable(placeholder: str, names=()):
+    """Name of the script variable behind {name.field:format}.
+
+    A placeholder which is a whole name from names is that variable, so
+    names containing dots or colons still work.
+    """
+    if placeholder in names:
+        return placeholder
+    return placeholder.partition(":")[0].split(".")[0]
+
+
+def split_variables(content: str, bound_vars):
+    bound = set(bound_vars)
+    used = {
+        placeholder_variable(placeholder, bound) for placeholder in find_placeholders(content)
+    }
+
+    return used & bound, bound - used, used - bound
+
+
+def resolve_placeholder(placeholder: str, values):
+    if placeholder in values:
+        return str(values[placeholder])
+
+    name, _, format_spec = placeholder.partition(":")
+    variable, *fields = name.split(".")
+    value = values[variable]
+
+    for field in fields:
+        try:
+            if isinstance(value, list):
+                value = value[int(field)]
+            else:
+                value = value[field]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise UnresolvedPlaceholderException(
+                f"Variable {variable} has no field {name[len(variable) + 1:]}"
+            )
+
+    try:
+        return format(value, format_spec) if format_spec else str(value)
+    except (ValueError, TypeError) as e:
+        raise UnresolvedPlaceholderException(f"Can't format {name} with {format_spec}: {e}")
+
+
 def parse_tweet(content: str, val_script_dict):
+    """Fills {name}, {name.field} and {name.field:format} placeholders.
+
+    Returns the content and the list of variables that couldn't be used,
+    either because the content doesn't reference them or because a
+    referenced field of their value is missing.
+    """
+    used = set()
     not_found = []
-    for key, val in val_script_dict.items():
-        val_to_search = "{" + str(key) + "}"
+    for placeholder in find_placeholders(content):
+        variable = placeholder_variable(placeholder, val_script_dict)
+        if variable not in val_script_dict:
+            continue
 
-        new_content = content.replace(val_to_search, val)
-        if new_content == content:
-            not_found.append(key)
+        try:
+            value = resolve_placeholder(placeholder, val_script_dict)
+        except UnresolvedPlaceholderException:
+            not_found.append(placeholder)
+            continue
 
-        content = new_content
+        content = content.replace("{" + placeholder + "}", value)
+        used.add(variable)
+
+    not_found.extend(key for key in val_script_dict if key not in used)
 
     return content, not_found
+
+
+class CompiledTemplate:
+    """Template split once into literal text and placeholders."""
+
+    def __init__(self, content: str):
+        parts = PLACEHOLDER_PATTERN.split(content)
+        self.literals = parts[0::2]
+        self.placeholders = parts[1::2]
+        self.variables = frozenset(placeholder_variable(p) for p in self.placeholders)
+
+    def render(self, values):
+        """Returns the text and placeholders which couldn't be filled, those stay as they are."""
+        output = [self.literals[0]]
+        missing = []
+        for placeholder, literal in zip(self.placeholders, self.literals[1:]):
+            try:
+                if placeholder_variable(placeholder, values) not in values:
+                    raise UnresolvedPlaceholderException(placeholder)
+                output.append(resolve_placeholder(placeholder, values))
+            except UnresolvedPlaceholderException:
+                missing.append(placeholder)
+                output.append("{" + placeholder + "}")
+            output.append(literal)
+
+        return "".join(output), missing
+
+
+@functools.lru_cache(maxsize=32)
+def compile_template(content: str):
+    return CompiledTemplate(content)
+
+
+class RenderedTweet:
+    def __init__(self, index, text, values, missing, too_long):
+        self.index = index
+        self.text = text
+        self.values = values
+        self.missing = missing
+        self.too_long = too_long
+
+    def is_valid(self):
+        return not self.missing and not self.too_long
+
+    def problem(self):
+        if self.missing:
+            return f"Missing variables: {self.missing}"
+        if self.too_long:
+            return f"Tweet is longer than {MAX_TWEET_LENGTH} characters"
+        return None
+
+
+def render_many(content: str, rows, max_length: int = MAX_TWEET_LENGTH):
+    """Renders one template for every mapping of rows, lazily and in order."""
+    template = compile_template(content)
+    for index, values in enumerate(rows):
+        text, missing = template.render(values)
+        yield RenderedTweet(index, text, values, missing, len(text) > max_length)
@@ -0,0 +1,61 @@
+import datetime
+from collections import deque
+
+from PyQt5 import QtGui
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+
+DEFAULT_MAX_ENTRIES = 500
+
+ACTIVITY_INFO = "info"
+ACTIVITY_ERROR = "error"
+
+ACTIVITY_COLORS = {
+    ACTIVITY_INFO: "#000000",
+    ACTIVITY_ERROR: "#d32f2f",
+}
+
+
+class ActivityEntry:
+    def __init__(self, message, level, created_at):
+        self.message = message
+        self.level = level
+        self.created_at = created_at
+
+    def __str__(self):
+        return f"{self.created_at.strftime('%d.%m.%Y %H:%M:%S')}  {self.message}"
+
+
+class ActivityFeed(QWidget):
+    """Non-modal list of recent posting results, oldest entries are dropped."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super(ActivityFeed, self).__init__()
+        self.__entries = deque(maxlen=max_entries)
+        self.initUI()
+
+    def initUI(self):
+        title_label = QLabel()
+        title_label.setText("<font color=#2798f5>ACTIVITY</font>")
+        title_label.setFont(QtGui.QFont("Open sans", weight=QtGui.QFont.Bold))
+
+        self.__list = QListWidget()
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(title_label)
+        layout.addWidget(self.__list)
+        self.setLayout(layout)
+
+    def entries(self):
+        return list(self.__entries)
+
+    def add(self, message: str, level: str = ACTIVITY_INFO):
+        entry = ActivityEntry(message, level, datetime.datetime.now())
+        if len(self.__entries) == self.__entries.maxlen:
+            self.__list.takeItem(self.__list.count() - 1)
+        self.__entries.append(entry)
+
+        item = QListWidgetItem(str(entry))
+        item.setForeground(QtGui.QColor(ACTIVITY_COLORS[level]))
+        self.__list.insertItem(0, item)
+        return entry
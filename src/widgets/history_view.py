@@ -0,0 +1,149 @@
+import datetime
+
+from PyQt5 import QtCore, QtGui
+from PyQt5.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QLabel,
+    QComboBox,
+    QPushButton,
+    QTableView,
+    QHeaderView,
+)
+
+from helpers.logger import log_inf
+from storage.post_history import (
+    DEFAULT_PAGE_SIZE,
+    HISTORY_POSTED,
+    HISTORY_FAILED,
+    HISTORY_SKIPPED,
+)
+
+HISTORY_COLUMNS = ("Time", "Account", "Status", "Tweet ID", "Latency", "Content")
+
+
+class HistoryModel(QtCore.QAbstractTableModel):
+    """Table over the post history which reads rows page by page while scrolling."""
+
+    def __init__(self, history, page_size: int = DEFAULT_PAGE_SIZE):
+        super(HistoryModel, self).__init__()
+        self.__history = history
+        self.__page_size = page_size
+        self.__entries = []
+        self.__exhausted = False
+        self.__status = None
+
+    def set_status_filter(self, status):
+        self.__status = status
+        self.reload()
+
+    def reload(self):
+        self.beginResetModel()
+        self.__entries = []
+        self.__exhausted = False
+        self.endResetModel()
+
+    def entry(self, row: int):
+        return self.__entries[row]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.__entries)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(HISTORY_COLUMNS)
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and not self.__exhausted
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        before = self.__entries[-1] if self.__entries else None
+        page = self.__history.fetch(before=before, limit=self.__page_size, status=self.__status)
+        if len(page) < self.__page_size:
+            self.__exhausted = True
+        if not page:
+            return
+
+        self.beginInsertRows(
+            QtCore.QModelIndex(), len(self.__entries), len(self.__entries) + len(page) - 1
+        )
+        self.__entries.extend(page)
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return HISTORY_COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        entry = self.__entries[index.row()]
+        if role == QtCore.Qt.ToolTipRole:
+            return entry.error or entry.content
+        if role != QtCore.Qt.DisplayRole:
+            return None
+
+        column = index.column()
+        if column == 0:
+            return datetime.datetime.fromtimestamp(entry.posted_at).strftime("%d.%m.%Y %H:%M:%S")
+        if column == 1:
+            return entry.account
+        if column == 2:
+            return entry.status
+        if column == 3:
+            return entry.tweet_id or ""
+        if column == 4:
+            return f"{entry.latency:.2f} s" if entry.latency is not None else ""
+        return entry.content
+
+
+class HistoryView(QWidget):
+    def __init__(self, history):
+        super(HistoryView, self).__init__()
+        self.__history = history
+        self.setWindowTitle("Post history")
+        self.resize(900, 600)
+        self.initUI()
+
+    def initUI(self):
+        title_label = QLabel()
+        title_label.setText("<font color=#2798f5>POST HISTORY</font>")
+        title_label.setFont(QtGui.QFont("Open sans", weight=QtGui.QFont.Bold))
+
+        self.__status_box = QComboBox()
+        self.__status_box.addItem("All", None)
+        for status in (HISTORY_POSTED, HISTORY_FAILED, HISTORY_SKIPPED):
+            self.__status_box.addItem(status.capitalize(), status)
+        self.__status_box.currentIndexChanged.connect(self.__change_status_filter)
+
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+
+        self.__count_label = QLabel()
+
+        self.__model = HistoryModel(self.__history)
+        self.__table = QTableView()
+        self.__table.setModel(self.__model)
+        self.__table.setSelectionBehavior(QTableView.SelectRows)
+        self.__table.horizontalHeader().setSectionResizeMode(
+            len(HISTORY_COLUMNS) - 1, QHeaderView.Stretch
+        )
+
+        layout = QGridLayout()
+        layout.addWidget(title_label, 0, 0, 1, 3)
+        layout.addWidget(QLabel("Status"), 1, 0)
+        layout.addWidget(self.__status_box, 1, 1)
+        layout.addWidget(refresh_button, 1, 2)
+        layout.addWidget(self.__count_label, 2, 0, 1, 3)
+        layout.addWidget(self.__table, 3, 0, 1, 3)
+        self.setLayout(layout)
+
+    def refresh(self):
+        status = self.__status_box.currentData()
+        self.__model.set_status_filter(status)
+        self.__count_label.setText(f"{self.__history.count(status=status)} posts")
+        log_inf("Refreshed post history view")
+
+    def __change_status_filter(self):
+        self.refresh()
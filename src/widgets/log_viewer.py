@@ -0,0 +1,148 @@
+from collections import deque
+
+from PyQt5 import QtCore, QtGui
+from PyQt5.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QLabel,
+    QComboBox,
+    QLineEdit,
+    QListView,
+    QCheckBox,
+)
+
+from helpers.log_tail import LogTail, LEVELS, DEFAULT_MAX_LINES
+from helpers.logger import DEFAULT_LOG_FILE
+
+TAIL_INTERVAL_MS = 500
+
+LEVEL_COLORS = {
+    "DEBUG": "#b8860b",
+    "WARNING": "#8e24aa",
+    "ERROR": "#d32f2f",
+}
+
+
+class LogModel(QtCore.QAbstractListModel):
+    """Lines of the log matching the level and search filters, bounded like the tail."""
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES):
+        super(LogModel, self).__init__()
+        self.__max_lines = max_lines
+        self.__rows = deque()
+        self.__min_level = 0
+        self.__search = ""
+
+    def __matches(self, level, line):
+        if level in LEVELS and LEVELS.index(level) < self.__min_level:
+            return False
+        return not self.__search or self.__search in line.lower()
+
+    def set_filters(self, min_level: str, search: str, lines):
+        self.beginResetModel()
+        self.__min_level = LEVELS.index(min_level)
+        self.__search = search.lower()
+        self.__rows = deque(
+            (entry for entry in lines if self.__matches(*entry)), maxlen=self.__max_lines
+        )
+        self.endResetModel()
+
+    def append(self, lines):
+        matching = [entry for entry in lines if self.__matches(*entry)][-self.__max_lines :]
+        if not matching:
+            return
+
+        overflow = len(self.__rows) + len(matching) - self.__max_lines
+        if overflow > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.__rows.popleft()
+            self.endRemoveRows()
+
+        self.beginInsertRows(
+            QtCore.QModelIndex(), len(self.__rows), len(self.__rows) + len(matching) - 1
+        )
+        self.__rows.extend(matching)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.__rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        level, line = self.__rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return line
+        if role == QtCore.Qt.ForegroundRole and level in LEVEL_COLORS:
+            return QtGui.QColor(LEVEL_COLORS[level])
+        return None
+
+
+class LogViewer(QWidget):
+    def __init__(self, file_path: str = DEFAULT_LOG_FILE):
+        super(LogViewer, self).__init__()
+        self.__tail = LogTail(file_path)
+        self.setWindowTitle("Logs")
+        self.resize(900, 600)
+        self.initUI()
+
+        self.__timer = QtCore.QTimer()
+        self.__timer.timeout.connect(self.refresh)
+
+    def initUI(self):
+        title_label = QLabel()
+        title_label.setText("<font color=#2798f5>LOGS</font>")
+        title_label.setFont(QtGui.QFont("Open sans", weight=QtGui.QFont.Bold))
+
+        self.__level_box = QComboBox()
+        for level in LEVELS:
+            self.__level_box.addItem(level.capitalize(), level)
+        self.__level_box.currentIndexChanged.connect(self.__apply_filters)
+
+        self.__search_line = QLineEdit()
+        self.__search_line.setPlaceholderText("Search")
+        self.__search_line.textChanged.connect(self.__apply_filters)
+
+        self.__follow_box = QCheckBox("Follow")
+        self.__follow_box.setChecked(True)
+
+        self.__model = LogModel()
+        self.__view = QListView()
+        self.__view.setModel(self.__model)
+        # Every row has the same height, so only visible rows are measured
+        self.__view.setUniformItemSizes(True)
+        self.__view.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+
+        layout = QGridLayout()
+        layout.addWidget(title_label, 0, 0, 1, 4)
+        layout.addWidget(QLabel("Level"), 1, 0)
+        layout.addWidget(self.__level_box, 1, 1)
+        layout.addWidget(self.__search_line, 1, 2)
+        layout.addWidget(self.__follow_box, 1, 3)
+        layout.addWidget(self.__view, 2, 0, 1, 4)
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.__timer.start(TAIL_INTERVAL_MS)
+        super(LogViewer, self).showEvent(event)
+
+    def hideEvent(self, event):
+        self.__timer.stop()
+        super(LogViewer, self).hideEvent(event)
+
+    def refresh(self):
+        new_lines = self.__tail.poll()
+        if new_lines:
+            self.__model.append(new_lines)
+            if self.__follow_box.isChecked():
+                self.__view.scrollToBottom()
+
+    def __apply_filters(self):
+        self.__model.set_filters(
+            self.__level_box.currentData(), self.__search_line.text(), self.__tail.lines
+        )
+        if self.__follow_box.isChecked():
+            self.__view.scrollToBottom()
@@ -11,6 +11,7 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QIcon, QFont
 from PyQt5.QtCore import pyqtSignal, QObject
 
+from helpers.logger import log_err
 from twitter_management.authorization import InvalidPinException, authenticator
 from window import get_main_window
 
@@ -22,8 +23,10 @@ class Communicate(QObject):
 
 
 class LoginScreen(QWidget):
-    def __init__(self, screen):
+    def __init__(self, screen, account_authenticator=authenticator, on_success=None):
         super(LoginScreen, self).__init__()
+        self.__authenticator = account_authenticator
+        self.__on_success = on_success
         self.__screen_width = screen.size().width()
         self.__screen_height = screen.size().height()
         self.initUI()
@@ -79,15 +82,35 @@ class LoginScreen(QWidget):
         self.resize(width, height)
 
     def go_to_authorization_page(self):
-        open(authenticator.get_authorization_url())
+        # The request token is fetched at startup, it is missing when that failed
+        if not self.__authenticator.has_request_token() and not self.__fetch_request_token():
+            self.__show_error(
+                "Couldn't connect to Twitter to start authorization!\nCheck your connection and API keys, then try again."
+            )
+            return
+
+        open(self.__authenticator.get_authorization_url())
+
+    def __fetch_request_token(self):
+        try:
+            return self.__authenticator.fetch_api_oauth_tokens()
+        except Exception as e:
+            log_err(f"Failed to fetch OAuth request token, error: {e}")
+            return False
+
+    def __show_error(self, message):
+        msg = QErrorMessage()
+        msg.showMessage(message)
+        msg.exec_()
 
     def submit_pin(self):
         text = self.__pin_text_area.text()
         try:
-            authenticator.sign_in_with_pin(text)
+            self.__authenticator.sign_in_with_pin(text)
             self.hide()
-            get_main_window().show()
+            if self.__on_success:
+                self.__on_success()
+            else:
+                get_main_window().show()
         except InvalidPinException as e:
-            msg = QErrorMessage()
-            msg.showMessage(str(e))
-            msg.exec_()
+            self.__show_error(str(e))
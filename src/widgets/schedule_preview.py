@@ -0,0 +1,142 @@
+import datetime
+
+from PyQt5 import QtGui
+from PyQt5.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QLabel,
+    QListWidget,
+    QPushButton,
+    QSpinBox,
+)
+
+from helpers.logger import log_inf
+from scheduling.scheduler import schedule_next_fire
+from scheduling.simulation import simulate
+from scheduling.fire_times import (
+    DEFAULT_HORIZON_DAYS,
+    DEFAULT_PREVIEW_COUNT,
+    summarize_interval,
+)
+from twitter_management.tweet_parsers import parse_tweet
+
+MAX_SIMULATED_POSTS = 10000
+
+
+class SchedulePreview(QWidget):
+    def __init__(self, get_interval, get_template=None, get_variables=None):
+        super(SchedulePreview, self).__init__()
+        self.__get_interval = get_interval
+        self.__get_template = get_template
+        self.__get_variables = get_variables
+        self.setWindowTitle("Schedule preview")
+        self.resize(500, 600)
+        self.initUI()
+
+    def initUI(self):
+        title_label = QLabel()
+        title_label.setText("<font color=#2798f5>UPCOMING POSTS</font>")
+        title_label.setFont(QtGui.QFont("Open sans", weight=QtGui.QFont.Bold))
+
+        self.__horizon_box = QSpinBox()
+        self.__horizon_box.setRange(1, 365)
+        self.__horizon_box.setValue(DEFAULT_HORIZON_DAYS)
+        self.__horizon_box.setSuffix(" days")
+
+        self.__count_box = QSpinBox()
+        self.__count_box.setRange(1, 1000)
+        self.__count_box.setValue(DEFAULT_PREVIEW_COUNT)
+
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+
+        simulate_button = QPushButton("Simulate")
+        simulate_button.setToolTip("Run the schedule over the horizon on a virtual clock without posting")
+        simulate_button.clicked.connect(self.simulate)
+
+        self.__summary_label = QLabel()
+        self.__warnings_label = QLabel()
+        self.__next_list = QListWidget()
+        self.__per_day_list = QListWidget()
+
+        layout = QGridLayout()
+        layout.addWidget(title_label, 0, 0, 1, 2)
+        layout.addWidget(QLabel("Horizon"), 1, 0)
+        layout.addWidget(self.__horizon_box, 1, 1)
+        layout.addWidget(QLabel("Next posts"), 2, 0)
+        layout.addWidget(self.__count_box, 2, 1)
+        layout.addWidget(refresh_button, 3, 0)
+        layout.addWidget(simulate_button, 3, 1)
+        layout.addWidget(self.__summary_label, 4, 0, 1, 2)
+        layout.addWidget(self.__warnings_label, 5, 0, 1, 2)
+        layout.addWidget(QLabel("Next posts"), 6, 0)
+        layout.addWidget(QLabel("Posts per day"), 6, 1)
+        layout.addWidget(self.__next_list, 7, 0)
+        layout.addWidget(self.__per_day_list, 7, 1)
+        self.setLayout(layout)
+
+    def refresh(self):
+        settings = self.__get_interval()
+        if not settings:
+            return
+
+        summary = summarize_interval(
+            settings.seconds,
+            settings.minutes,
+            settings.hours,
+            settings.days,
+            horizon_days=self.__horizon_box.value(),
+            count=self.__count_box.value(),
+            cron=settings.cron,
+        )
+        log_inf(f"Previewed schedule, {summary.total} posts in {self.__horizon_box.value()} days")
+
+        self.__summary_label.setText(
+            f"Total posts: {summary.total}, at most {summary.max_per_day} per day"
+        )
+        self.__warnings_label.setText(
+            "".join(f"<font color=#f55427>{warning}</font><br>" for warning in summary.warnings)
+        )
+
+        self.__next_list.clear()
+        self.__next_list.addItems(
+            [fire.strftime("%d.%m.%Y %H:%M:%S") for fire in summary.next_fires]
+        )
+        self.__per_day_list.clear()
+        self.__per_day_list.addItems(
+            [f"{day.strftime('%d.%m.%Y')}: {amount}" for day, amount in summary.posts_per_day]
+        )
+
+    def simulate(self):
+        settings = self.__get_interval()
+        if not settings:
+            return
+
+        template = self.__get_template() if self.__get_template else ""
+        # Scripts are not run, posts show their last known values
+        variables = self.__get_variables() if self.__get_variables else {}
+        content, missing = parse_tweet(template, variables)
+        next_fire = schedule_next_fire(
+            settings.seconds,
+            settings.minutes,
+            settings.hours,
+            settings.days,
+            cron=settings.cron,
+            date_time=settings.date_time.toPyDateTime() if settings.is_scheduled else None,
+        )
+        timeline = simulate(
+            next_fire,
+            datetime.datetime.now(),
+            datetime.timedelta(days=self.__horizon_box.value()),
+            lambda fire: content,
+            max_posts=MAX_SIMULATED_POSTS,
+        )
+
+        self.__summary_label.setText(f"Simulated {self.__horizon_box.value()} days, {timeline}")
+        self.__warnings_label.setText(
+            f"<font color=#f55427>Variables without known values: {missing}</font>"
+            if missing
+            else ""
+        )
+        self.__next_list.clear()
+        self.__next_list.addItems([str(event) for event in timeline.events[: self.__count_box.value()]])
@@ -1,6 +1,6 @@
 from helpers.logger import log_inf
 from PyQt5.QtWidgets import QWidget, QProgressBar, QVBoxLayout, QLabel, QFrame
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
 
 
 class SplashScreen(QWidget):
@@ -11,10 +11,6 @@ class SplashScreen(QWidget):
         self.__setup_window()
         self.initUI()
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.start_loading)
-        self.timer.start(5000)
-
     def initUI(self):
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -100,12 +96,14 @@ class SplashScreen(QWidget):
     def start_loading(self):
         self.progressBar.setValue(self.__counter)
 
-        log_inf(f"Progress: {self.__counter}")
+        log_inf(f"Progress: {self.__counter}/{self.__counter_max}")
         if self.__counter >= self.__counter_max:
-            self.timer.stop()
             self.close()
             self.__is_finished = True
 
+    def set_stage(self, text):
+        self.labelLoading.setText(text)
+
     def is_finished(self):
         return self.__is_finished
 
@@ -120,9 +118,11 @@ class SplashScreen(QWidget):
 
     def add(self, amount=1):
         self.__counter_max += amount
+        self.progressBar.setRange(0, self.__counter_max)
 
     def add_finished(self):
         self.__counter += 1
+        self.start_loading()
 
 
 splash_screen = None
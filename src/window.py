@@ -1,8 +1,12 @@
-import configparser
-import time
+import csv
+import gc
+import json
 import os
+import time
 import pyperclip
 
+from concurrent.futures import ThreadPoolExecutor
+
 from PyQt5 import QtCore, QtGui
 from PyQt5.QtWidgets import (
     QMainWindow,
@@ -23,21 +27,99 @@ from PyQt5.QtWidgets import (
     qApp,
     QAction,
     QDesktopWidget,
+    QComboBox,
+    QInputDialog,
+    QProgressDialog,
+    QSpinBox,
 )
 from PyQt5.QtGui import QIcon
 
-from twitter_management.tweet_parsers import parse_tweet
-from script_runner import run_script
-from helpers.logger import log_inf, log_err
+from twitter_management.tweet_parsers import (
+    parse_tweet,
+    split_variables,
+    find_placeholders,
+)
+from script_runner import run_script, evaluate_script, validate_script, read_script_output
+from script_watcher import ScriptWatcher, prewarm_script
+from script_interpreter import precompile_script
+from resident_scripts import ResidentScriptManager, is_resident_script
+from storage.profile_store import (
+    ProfileStore,
+    ProfileStoreException,
+    DEFAULT_PROFILE_DB,
+    DEFAULT_PROFILE_NAME,
+)
+from storage.tweet_queue import (
+    TweetQueue,
+    DEFAULT_QUEUE_DB,
+    STATUS_POSTING,
+    STATUS_POSTED,
+    STATUS_FAILED,
+)
+from storage.queue_import import import_queue
+from storage.mail_merge import merge_file_into_queue
+from storage.post_history import (
+    PostHistory,
+    DEFAULT_HISTORY_DB,
+    HISTORY_POSTED,
+    HISTORY_FAILED,
+    HISTORY_SKIPPED,
+)
+from storage.duplicate_index import (
+    DuplicateIndex,
+    DEFAULT_POSTS_DB,
+    DUPLICATE_SKIP,
+    DUPLICATE_VARY,
+)
+from script_graph import ScriptGraph, ScriptGraphException
+from helpers.logger import log_inf, log_err, log_wrn
+from helpers.resource_watchdog import ResourceWatchdog
+from helpers.tracing import tracer
 from twitter_management.post_tweet import (
     TweetNotPostedException,
-    post,
-    check_return_code,
+    post_for_account,
+    read_post_result,
+)
+from twitter_management.accounts import (
+    AccountException,
+    DEFAULT_ACCOUNT,
+    account_manager,
+)
+from twitter_management.posting_pool import PostingPool
+from widgets.schedule_preview import SchedulePreview
+from widgets.history_view import HistoryView
+from widgets.log_viewer import LogViewer
+from widgets.activity_feed import ActivityFeed, ACTIVITY_INFO, ACTIVITY_ERROR
+from scheduling.cron import CronExpression, InvalidCronException
+from scheduling.triggers import (
+    ValueTrigger,
+    TriggerException,
+    TRIGGER_CHANGE,
+    TRIGGER_ABOVE,
+    TRIGGER_BELOW,
+)
+from scheduling.scheduler import (
+    Scheduler,
+    schedule_next_fire,
+    FIRE_ONCE,
+    FIRE_ALL,
+    SKIP,
 )
 
-SCRIPT_PATH_PREFIX = "script_outputs"
 DEFAULT_WINDOW_CONFIG_FILE = "conf/window.ini"
 DEFAULT_TEMPLATE_SCRIPT_PATH = "src/script_template.py"
+TEMPLATE_SAVE_DELAY_MS = 500
+CATCH_UP_POLICY_KEY = "catch_up_policy"
+DUPLICATE_POLICY_KEY = "duplicate_policy"
+PRERENDER_LEAD_KEY = "prerender_lead"
+TRIGGER_KEY = "trigger"
+DEFAULT_TRIGGER_SAMPLE_SECONDS = 60
+MAX_PRERENDER_LEAD_SECONDS = 600
+MAX_MEDIA_ATTACHMENTS = 4
+QUEUE_CHECK_INTERVAL_MS = 5000
+WATCHDOG_KEY = "resource_watchdog"
+WATCHDOG_INTERVAL_MS = 10 * 60 * 1000
+NOTIFICATION_TIMEOUT_MS = 10000
 
 
 class InvalidSettingException(Exception):
@@ -45,6 +127,11 @@ class InvalidSettingException(Exception):
 
 
 class MainWindow(QMainWindow):
+    # Emitted from posting threads, delivered on the GUI thread
+    postFinished = QtCore.pyqtSignal(object, object, float)
+    triggerSampled = QtCore.pyqtSignal(object)
+    scriptChecked = QtCore.pyqtSignal(str, bool)
+
     class Settings:
         def __init__(self):
             self.seconds = None
@@ -52,6 +139,7 @@ class MainWindow(QMainWindow):
             self.hours = None
             self.days = None
             self.date_time = None
+            self.cron = None
             self.scripts = None
             self.is_scheduled = False
             self.is_interval = False
@@ -100,6 +188,18 @@ class MainWindow(QMainWindow):
 
             return self
 
+        def add_cron(self, expression):
+            if expression:
+                try:
+                    self.cron = CronExpression(expression)
+                    self.is_interval = True
+                except InvalidCronException as e:
+                    raise InvalidSettingException(
+                        f"Invalid cron expression {expression}: {e}"
+                    )
+
+            return self
+
         def add_date_time(self, datetime):
             current_date = QtCore.QDateTime.currentDateTime()
 
@@ -123,6 +223,8 @@ class MainWindow(QMainWindow):
                 out_str.append(f"\n   Hours: {self.hours} ")
             if self.days:
                 out_str.append(f"\n   Days: {self.days}")
+            if self.cron:
+                out_str.append(f"\n   Cron: {self.cron}")
             
             return "".join(out_str)                
 
@@ -130,160 +232,367 @@ class MainWindow(QMainWindow):
             self.scripts = scripts
 
         def __str__(self):
-            return f"Seconds: {self.seconds}, Minutes: {self.minutes}, Hours: {self.hours}, Days: {self.days}, datetime: {self.date_time}"
+            return f"Seconds: {self.seconds}, Minutes: {self.minutes}, Hours: {self.hours}, Days: {self.days}, Cron: {self.cron}, datetime: {self.date_time}"
+
+    class ScheduleRun:
+        """A started schedule, it keeps posting what was set up when it started.
+
+        Account, template, scripts and media are copied at start, so switching
+        or editing profiles does not change a running schedule.
+        """
 
-    def __init__(self, screen):
+        def __init__(self, profile, account, template, scripts, media_paths, settings, scheduler):
+            self.profile = profile
+            self.account = account
+            self.template = template
+            self.scripts = scripts
+            self.media_paths = media_paths
+            self.settings = settings
+            self.scheduler = scheduler
+            self.prerendered = None
+            self.timer = QtCore.QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+            self.prerender_timer = QtCore.QTimer()
+            self.prerender_timer.setSingleShot(True)
+
+        def script_paths(self):
+            return {path for _, path in self.scripts if path}
+
+        def stop(self):
+            self.timer.stop()
+            self.prerender_timer.stop()
+            self.prerendered = None
+
+    def __init__(self, screen, profile_store=None, profile=None):
+        """profile_store and profile are loaded by a startup stage, without them they are loaded here."""
         log_inf("Initializing MainWindow")
 
         super(MainWindow, self).__init__()
+        self.__screen = screen
+        self.__account = DEFAULT_ACCOUNT
+        self.__account_login = None
+        self.__schedule_preview = None
+        self.__history_view = None
+        self.__log_viewer = None
+        self.__posting_pool = PostingPool(post_for_account)
+        if profile_store is None:
+            profile_store = ProfileStore(DEFAULT_PROFILE_DB)
+            profile_store.migrate_from_ini(DEFAULT_WINDOW_CONFIG_FILE)
+        self.__profile_store = profile_store
+        self.__duplicate_index = DuplicateIndex(DEFAULT_POSTS_DB)
+        self.__tweet_queue = TweetQueue(DEFAULT_QUEUE_DB)
+        self.__post_history = PostHistory(DEFAULT_HISTORY_DB)
+        self.__queue_timer = QtCore.QTimer()
+        self.__queue_timer.timeout.connect(self.__check_queue)
+        self.__profile = None
+        self.__loading_profile = False
+        self.__template_save_timer = QtCore.QTimer()
+        self.__template_save_timer.setSingleShot(True)
+        self.__template_save_timer.timeout.connect(self.__save_twitter_area)
+        self.__error_dialog = QErrorMessage(self)
+        self.__unattended = False
+        self.postFinished.connect(self.__handle_post_result)
+        self.__watchdog = ResourceWatchdog(probes={"live_qobjects": count_live_qobjects})
+        self.__watchdog_timer = QtCore.QTimer()
+        self.__watchdog_timer.timeout.connect(self.__watchdog.sample)
         self.initUI()
         self.resize(1000, 500)
-        self.__timer = None
+        # Running schedules by profile, each keeps the account and tweet it started with
+        self.__schedules = {}
+        self.__trigger = None
+        self.__trigger_source = None
+        self.__trigger_variable = None
+        self.__trigger_sample = None
+        self.__script_pool = ThreadPoolExecutor(max_workers=1)
+        self.__trigger_timer = QtCore.QTimer()
+        self.__trigger_timer.timeout.connect(self.__sample_trigger)
+        self.triggerSampled.connect(self.__handle_trigger_sample)
         self.__settings = self.Settings()
         self.has_script = False
-        self.__load_config(DEFAULT_WINDOW_CONFIG_FILE)
+        self.__unused_vars = []
+        self.__rendered_vars = {}
+        self.__resident_scripts = ResidentScriptManager()
+        self.__script_watcher = ScriptWatcher(executor=self.__script_pool)
+        self.__script_watcher.scriptBroken.connect(self.__handle_broken_script)
+        self.scriptChecked.connect(self.__handle_checked_script)
+        self.__script_watcher.scriptReloaded.connect(self.__handle_reloaded_script)
+        self.__load_config(profile)
 
         log_inf("Successfully MainWindow")
 
+    def prewarm_scripts(self):
+        """Caches first values of the profile scripts in the background."""
+        for path in dict.fromkeys(path for path in self.__paths_list if path):
+            self.__script_pool.submit(prewarm_script, path)
+
     # config stuff
-    def __load_config(self, file_name: str):
-        log_inf(f"Loading config file {file_name}")
-        self.__config = configparser.ConfigParser()
-        self.__config.read(DEFAULT_WINDOW_CONFIG_FILE)
+    def __load_config(self, profile=None):
+        log_inf(f"Loading config from profile store")
+        self.__load_watchdog_conf()
 
         try:
             self.__load_window_title_conf()
             self.__load_window_size_conf()
             self.__load_window_pos_conf()
 
-            self.__load_interval_values_conf()
-            self.__load_schedule_values_conf()
-
-            self.__load_twitter_area_conf()
-            log_inf(f"Loaded config file {file_name}")
+            self.__load_catch_up_policy_conf()
+            self.__load_prerender_lead_conf()
+            self.__load_trigger_conf()
+            self.__load_duplicate_policy_conf()
+            self.__load_accounts_conf()
+            self.__load_profiles_conf(profile)
+            log_inf(f"Loaded config from profile store")
         except Exception as e:
-            log_err(f"Failed to load config file {file_name}, error: {e}")
+            log_err(f"Failed to load config from profile store, error: {e}")
             self.__show_error_dialog(str(e))
 
-    def __save_config(self, file_name: str):
-        log_inf(f"Loading config {file_name}")
-        config = configparser.ConfigParser()
-
-        config["Default"] = {}
-        config["Default"]["window_name"] = self.windowTitle()
-
-        config = self.__save_window_values(config)
-        config = self.__save_parameters_values(config)
-        config = self.__save_twitter_area(config)
-
+    def __save_config(self):
+        log_inf(f"Saving window config")
         try:
-            with open(file_name, "w") as configfile:
-                config.write(configfile)
-            log_inf(f"Saved config file {file_name}")
+            self.__profile_store.set_setting("window_name", self.windowTitle())
+            self.__save_window_values()
+            log_inf(f"Saved window config")
         except Exception as e:
-            log_err(f"Failed to save config file {file_name}, error: {e}")
+            log_err(f"Failed to save window config, error: {e}")
+
+    def __save_window_values(self):
+        self.__profile_store.set_setting("window_width", self.size().width())
+        self.__profile_store.set_setting("window_height", self.size().height())
+        self.__profile_store.set_setting("window_x_pos", self.pos().x())
+        self.__profile_store.set_setting("window_y_pos", self.pos().y())
+
+    # Incremental profile saving functions
+    def __schedule_template_save(self):
+        if not self.__loading_profile:
+            self.__template_save_timer.start(TEMPLATE_SAVE_DELAY_MS)
+
+    def __save_twitter_area(self):
+        self.__profile_store.save_template(
+            self.__profile, self.__tweet_text.toPlainText()
+        )
 
-    def __save_window_values(self, config):
-        config["Dimensions"] = {}
-        config["Dimensions"]["window_width"] = str(self.size().width())
-        config["Dimensions"]["window_height"] = str(self.size().height())
-        config["Dimensions"]["window_x_pos"] = str(self.pos().x())
-        config["Dimensions"]["window_y_pos"] = str(self.pos().y())
+    def __save_interval_value(self, field, line):
+        if self.__loading_profile:
+            return
 
-        return config
+        value = self.__convert_val(line.text())
+        self.__profile_store.save_schedule(self.__profile, **{field: value or None})
 
-    def __save_parameters_values(self, config):
-        config["Parameters"] = {}
-        settings = self.__gather_settings()
+    def __save_cron_value(self):
+        if not self.__loading_profile:
+            self.__profile_store.save_schedule(
+                self.__profile, cron=self.__cron_line.text().strip() or None
+            )
 
-        if not settings:
-            log_err("Failed to save parameters settings")
+    def __save_schedule_value(self):
+        if self.__loading_profile:
             return
 
-        if settings.seconds:
-            config["Parameters"]["seconds"] = str(settings.seconds)
-        else:
-            config["Parameters"]["seconds"] = "0"
-        if settings.minutes:
-            config["Parameters"]["minutes"] = str(settings.minutes)
-        else:
-            config["Parameters"]["minutes"] = "0"
-        if settings.hours:
-            config["Parameters"]["hours"] = str(settings.hours)
-        else:
-            config["Parameters"]["hours"] = "0"
-        if settings.days:
-            config["Parameters"]["days"] = str(settings.days)
-        else:
-            config["Parameters"]["days"] = "0"
-        if settings.date_time:
-            config["Parameters"]["date"] = str(
-                settings.date_time.toString("yyyy,M,d,h,m,s")
+        self.__profile_store.save_schedule(
+            self.__profile,
+            date=self.__date_time.dateTime().toString(QtCore.Qt.ISODate),
+        )
+
+    def __save_catch_up_policy(self):
+        if not self.__loading_profile:
+            self.__profile_store.set_setting(
+                CATCH_UP_POLICY_KEY, self.__catch_up_box.currentData()
             )
 
-        return config
+    def __save_prerender_lead(self):
+        if not self.__loading_profile:
+            self.__profile_store.set_setting(PRERENDER_LEAD_KEY, self.__prerender_box.value())
+
+    def __save_duplicate_policy(self):
+        if not self.__loading_profile:
+            self.__profile_store.set_setting(
+                DUPLICATE_POLICY_KEY, self.__duplicate_box.currentData()
+            )
 
-    def __save_twitter_area(self, config):
-        config["Twitter area"] = {}
-        config["Twitter area"]["content"] = self.__tweet_text.toPlainText()
+    def __save_scripts(self):
+        if self.__loading_profile:
+            return
 
-        return config
+        scripts = [
+            (var_line.text(), path)
+            for var_line, path in zip(self.__scripts_val_list, self.__paths_list)
+            if path
+        ]
+        self.__profile_store.save_scripts(self.__profile, scripts)
 
     # Window config loading functions
     def __load_window_title_conf(self):
-        if "Default" in self.__config:
-            if "window_name" in self.__config["Default"]:
-                self.setWindowTitle(self.__config["Default"]["window_name"])
+        window_name = self.__profile_store.get_setting("window_name")
+        if window_name:
+            self.setWindowTitle(window_name)
 
     def __load_window_size_conf(self):
-        if "Dimensions" in self.__config:
-            if "window_width" in self.__config["Dimensions"]:
-                self.setFixedWidth(int(self.__config["Dimensions"]["window_width"]))
-            if "window_height" in self.__config["Dimensions"]:
-                self.setFixedHeight(int(self.__config["Dimensions"]["window_height"]))
+        width = self.__profile_store.get_setting("window_width")
+        height = self.__profile_store.get_setting("window_height")
+        if width:
+            self.setFixedWidth(int(width))
+        if height:
+            self.setFixedHeight(int(height))
 
     def __load_window_pos_conf(self):
         screen = QDesktopWidget().screenGeometry()
-        if "Dimensions" in self.__config:
-            if (
-                "window_x_pos" in self.__config["Dimensions"]
-                and "window_y_pos" in self.__config["Dimensions"]
-            ):
-                x = int(self.__config["Dimensions"]["window_x_pos"])
-                y = int(self.__config["Dimensions"]["window_y_pos"])
-                self.move(screen.width() - x, screen.height() - y)
+        x = self.__profile_store.get_setting("window_x_pos")
+        y = self.__profile_store.get_setting("window_y_pos")
+        if x is not None and y is not None:
+            self.move(screen.width() - int(x), screen.height() - int(y))
+
+    def __load_watchdog_conf(self):
+        self.__watchdog_act.setChecked(self.__profile_store.get_setting(WATCHDOG_KEY) == "1")
+
+    def __load_catch_up_policy_conf(self):
+        policy = self.__profile_store.get_setting(CATCH_UP_POLICY_KEY, FIRE_ONCE)
+        index = self.__catch_up_box.findData(policy)
+        if index >= 0:
+            self.__catch_up_box.setCurrentIndex(index)
+
+    def __load_prerender_lead_conf(self):
+        self.__prerender_box.setValue(int(self.__profile_store.get_setting(PRERENDER_LEAD_KEY, 0)))
+
+    def __load_duplicate_policy_conf(self):
+        policy = self.__profile_store.get_setting(DUPLICATE_POLICY_KEY, DUPLICATE_SKIP)
+        index = self.__duplicate_box.findData(policy)
+        if index >= 0:
+            self.__duplicate_box.setCurrentIndex(index)
+
+    # Profile loading functions
+    def __load_profiles_conf(self, loaded=None):
+        profiles = self.__profile_store.list_profiles()
+        if not profiles:
+            self.__profile_store.create_profile(DEFAULT_PROFILE_NAME)
+            profiles = [DEFAULT_PROFILE_NAME]
+
+        if loaded is not None and loaded.name in profiles:
+            active = loaded.name
+        else:
+            loaded = None
+            active = self.__profile_store.get_active_profile()
+            if active not in profiles:
+                active = profiles[0]
+
+        self.__profiles_box.blockSignals(True)
+        self.__profiles_box.clear()
+        self.__profiles_box.addItems(profiles)
+        self.__profiles_box.setCurrentText(active)
+        self.__profiles_box.blockSignals(False)
+        self.__switch_profile(active, loaded)
+
+    def __switch_profile(self, name, profile=None):
+        if not name:
+            return
+
+        if self.__profile and self.__template_save_timer.isActive():
+            self.__template_save_timer.stop()
+            self.__save_twitter_area()
+
+        log_inf(f"Switching to profile {name}")
+        if profile is None:
+            profile = self.__profile_store.load_profile(name)
+        self.__loading_profile = True
+        try:
+            self.__profile = name
+            self.__load_interval_values_conf(profile)
+            self.__load_schedule_values_conf(profile)
+            self.__load_scripts_conf(profile)
+            self.__load_twitter_area_conf(profile)
+            self.__load_account_conf(profile)
+        finally:
+            self.__loading_profile = False
+
+        self.__profile_store.set_active_profile(name)
+
+    def __create_profile(self):
+        name, ok = QInputDialog.getText(self, "New profile", "Profile name:")
+        if not ok or not name:
+            return
+
+        try:
+            self.__profile_store.create_profile(name)
+        except ProfileStoreException as e:
+            self.__show_error_dialog(str(e))
+            return
+
+        self.__profiles_box.addItem(name)
+        self.__profiles_box.setCurrentText(name)
+
+    def __load_accounts_conf(self):
+        for name, access_token, access_secret in self.__profile_store.load_account_tokens():
+            try:
+                account_manager.restore_account(name, access_token, access_secret)
+            except AccountException as e:
+                log_err(f"Failed to restore account {name}, error: {e}")
+                continue
+            if self.__accounts_box.findText(name) < 0:
+                self.__accounts_box.addItem(name)
+
+    def __load_account_conf(self, profile):
+        self.__account = profile.account
+        if self.__accounts_box.findText(profile.account) < 0:
+            self.__accounts_box.addItem(profile.account)
+        self.__accounts_box.setCurrentText(profile.account)
+
+    def __change_account(self, account):
+        if self.__loading_profile or not account:
+            return
+
+        self.__account = account
+        self.__profile_store.save_account(self.__profile, account)
+
+    def __add_account(self):
+        # login_screen imports this module, so it can't be imported at the top
+        from widgets.login_screen import LoginScreen
+
+        name, ok = QInputDialog.getText(self, "New account", "Account name:")
+        if not ok or not name:
+            return
+
+        try:
+            new_authenticator = account_manager.add_account(name)
+        except AccountException as e:
+            self.__show_error_dialog(str(e))
+            return
+
+        def on_success():
+            # Saved so profiles bound to the account keep working after a restart
+            self.__profile_store.save_account_tokens(
+                name, new_authenticator.get_access_token(), new_authenticator.get_access_token_secret()
+            )
+            self.__accounts_box.addItem(name)
+            self.__show_info_dialog(f"Success! Signed in account {name}.")
+
+        self.__account_login = LoginScreen(
+            self.__screen, new_authenticator, on_success=on_success
+        )
+        self.__account_login.show()
 
     # Settings config loading functions
-    def __load_interval_values_conf(self):
-        if "Parameters" in self.__config:
-            if "seconds" in self.__config["Parameters"]:
-                self.__seconds_line.setText(self.__config["Parameters"]["seconds"])
-            if "minutes" in self.__config["Parameters"]:
-                self.__minutes_line.setText(self.__config["Parameters"]["minutes"])
-            if "hours" in self.__config["Parameters"]:
-                self.__hours_line.setText(self.__config["Parameters"]["hours"])
-            if "days" in self.__config["Parameters"]:
-                self.__days_line.setText(self.__config["Parameters"]["days"])
-
-    def __load_schedule_values_conf(self):
-        if "Parameters" in self.__config:
-            if "date" in self.__config["Parameters"]:
-                date = self.__config["Parameters"]["date"].split(",")
-                date_time = QtCore.QDateTime(
-                    int(date[0]),
-                    int(date[1]),
-                    int(date[2]),
-                    int(date[3]),
-                    int(date[4]),
-                    int(date[5]),
-                )
-                self.__date_time.setDateTime(date_time)
+    def __load_interval_values_conf(self, profile):
+        self.__seconds_line.setText(str(profile.seconds or 0))
+        self.__minutes_line.setText(str(profile.minutes or 0))
+        self.__hours_line.setText(str(profile.hours or 0))
+        self.__days_line.setText(str(profile.days or 0))
+        self.__cron_line.setText(profile.cron or "")
+
+    def __load_schedule_values_conf(self, profile):
+        if profile.date:
+            date_time = QtCore.QDateTime.fromString(profile.date, QtCore.Qt.ISODate)
+            self.__date_time.setDateTime(date_time)
+
+    def __load_scripts_conf(self, profile):
+        self.__clear_scripts()
+        for var, path in profile.scripts:
+            self.__add_new_script(var, path)
+            self.__script_watcher.watch(path)
+            self.__start_resident_script(path)
 
     # Twitter post loading functions
-    def __load_twitter_area_conf(self):
-        if "Twitter area" in self.__config:
-            if "content" in self.__config["Twitter area"]:
-                self.__tweet_text.setPlainText(self.__config["Twitter area"]["content"])
+    def __load_twitter_area_conf(self, profile):
+        self.__tweet_text.setPlainText(profile.template)
 
     # UI creation
     def initUI(self):
@@ -295,7 +604,15 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         if self.__show_exit_prompt() == QMessageBox.Yes:
-            self.__save_config(DEFAULT_WINDOW_CONFIG_FILE)
+            if self.__template_save_timer.isActive():
+                self.__save_twitter_area()
+            self.__save_config()
+            for run in self.__schedules.values():
+                run.stop()
+            self.__posting_pool.shutdown()
+            self.__script_pool.shutdown(wait=False)
+            self.__resident_scripts.stop_all()
+            tracer.close()
             event.accept()
         else:
             event.ignore()
@@ -333,6 +650,7 @@ class MainWindow(QMainWindow):
     def __create_menu(self):
         self.__create_file_menu()
         self.__create_edit_menu()
+        self.__create_queue_menu()
         self.__create_help_menu()
 
     def __create_file_menu(self):
@@ -346,6 +664,22 @@ class MainWindow(QMainWindow):
         save_tweet_act.setStatusTip("Save your tweet to file!")
         save_tweet_act.triggered.connect(self.__save_tweet)
         
+        add_account_act = QAction("Add account", self)
+        add_account_act.setStatusTip("Sign in another Twitter account")
+        add_account_act.triggered.connect(self.__add_account)
+
+        history_act = QAction("Post history", self)
+        history_act.setStatusTip("Browse posted tweets")
+        history_act.triggered.connect(self.__show_post_history)
+
+        logs_act = QAction("Logs", self)
+        logs_act.setStatusTip("Follow the application log")
+        logs_act.triggered.connect(self.__show_logs)
+
+        self.__watchdog_act = QAction("Resource watchdog", self, checkable=True)
+        self.__watchdog_act.setStatusTip("Periodically log memory, file and process usage")
+        self.__watchdog_act.toggled.connect(self.__toggle_watchdog)
+
         exit_act = QAction("Exit", self)
         exit_act.setShortcut("Ctrl+Q")
         exit_act.setStatusTip("Exit application")
@@ -354,6 +688,10 @@ class MainWindow(QMainWindow):
         file_menu = self.menuBar().addMenu("File")
         file_menu.addAction(load_tweet_act)
         file_menu.addAction(save_tweet_act)
+        file_menu.addAction(add_account_act)
+        file_menu.addAction(history_act)
+        file_menu.addAction(logs_act)
+        file_menu.addAction(self.__watchdog_act)
         file_menu.addAction(exit_act)
         file_menu.setMinimumWidth(200)
         
@@ -385,6 +723,35 @@ class MainWindow(QMainWindow):
         edit_menu.addAction(cut_clear_area_act)
         edit_menu.setMinimumWidth(200)
 
+    def __create_queue_menu(self):
+        import_queue_act = QAction("Import queue", self)
+        import_queue_act.setStatusTip("Import tweets from CSV or JSONL file")
+        import_queue_act.triggered.connect(self.__import_queue)
+
+        mail_merge_act = QAction("Mail merge", self)
+        mail_merge_act.setStatusTip("Fill tweet template from every row of CSV or JSONL file")
+        mail_merge_act.triggered.connect(self.__mail_merge)
+
+        start_queue_act = QAction("Start queue", self)
+        start_queue_act.setStatusTip("Post queued tweets when they are due")
+        start_queue_act.triggered.connect(self.__start_queue)
+
+        stop_queue_act = QAction("Stop queue", self)
+        stop_queue_act.setStatusTip("Stop posting queued tweets")
+        stop_queue_act.triggered.connect(self.__stop_queue)
+
+        clear_queue_act = QAction("Clear queue", self)
+        clear_queue_act.setStatusTip("Remove pending tweets of current profile")
+        clear_queue_act.triggered.connect(self.__clear_queue)
+
+        queue_menu = self.menuBar().addMenu("Queue")
+        queue_menu.addAction(import_queue_act)
+        queue_menu.addAction(mail_merge_act)
+        queue_menu.addAction(start_queue_act)
+        queue_menu.addAction(stop_queue_act)
+        queue_menu.addAction(clear_queue_act)
+        queue_menu.setMinimumWidth(200)
+
     def __create_help_menu(self):
         interval_act = QAction("Intervals", self)
         interval_act.setStatusTip("Help about intervals section")
@@ -412,7 +779,9 @@ class MainWindow(QMainWindow):
     def __show_intervals_help(self):
         msg = """Intervals consists of 4 main areas, each specifying the time to post new Tweet\n
 Example of filled areas: Seconds 20 Days 4 \n   This means, bot will post new Tweet every day which is divisble by 4 and second divisble by 20\n
-Notice that both requirements must be fullfiled!\n\nPossible values:\n   Seconds: 0-59\n   Minutes: 0-59\n   Hours: 0-23\n   Days: 1-365"""
+Notice that both requirements must be fullfiled!\n\nPossible values:\n   Seconds: 0-59\n   Minutes: 0-59\n   Hours: 0-23\n   Days: 1-365\n
+Cron takes a standard cron expression: minute hour day month weekday, for example '30 8,17 * * MON-FRI' posts on weekdays at 08:30 and 17:00.
+When cron is checked it replaces other interval areas."""
         QMessageBox.information(self, "Intervals help", msg)
 
     def __show_schedule_help(self):
@@ -426,6 +795,7 @@ Warning - date can't be in the past!"""
 Inside the file there's instruction how to write your own script.\nWhen you're ready it's time to use it in the bot!\n\nFirst - import the script by pressing 'Add new script' button.
 Next, name your variable in the area to the left, it can be whatever you want!\n\nLast step is to use it in actual Tweet:\nFind a place where you want to put your variable.
 Then simply write it's name inside curly braces {}, it's that simple!\nFor example if you choose to name your variable 'cat', then inside your Tweet insert {cat}.\n
+If your script returns a dictionary, one run fills many places: use {cat.name} or {cat.weight:.1f} for its fields.\n
 If you're not sure if everything works, simply click 'Check' button, in case of errors, help will be provided."""
         reply = QMessageBox.information(
             self, "Intervals help", msg, QMessageBox.Ok, QMessageBox.Save
@@ -465,9 +835,11 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         parameters = QWidget()
         scroll.setWidget(parameters)
         vlay = QVBoxLayout(parameters)
+        vlay.addWidget(self.__create_profiles_box())
         vlay.addWidget(self.__create_schedule_intervals_box())
         vlay.addWidget(self.__create_schedule_date())
         vlay.addWidget(self.__create_script_box())
+        vlay.addWidget(self.__create_trigger_box())
 
         docklayout = QVBoxLayout(self.__dock)
         docklayout.addWidget(scroll)
@@ -477,6 +849,7 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
 
         layout = QGridLayout()
         self.__tweet_text = QPlainTextEdit()
+        self.__tweet_text.textChanged.connect(self.__schedule_template_save)
         self.__test_tweet_text = QPlainTextEdit()
 
         self.__submit_button = QPushButton("Submit")
@@ -491,6 +864,13 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         self.__test_output_button.setIcon(QIcon('res/icons/okay_icon.png'))
         self.__test_output_button.clicked.connect(self.__handle_test_tweet_area)
 
+        self.__media_paths = []
+        self.__media_label = QLabel("No media attached")
+        attach_media_button = QPushButton("Attach media")
+        attach_media_button.clicked.connect(self.__attach_media)
+        clear_media_button = QPushButton("Clear media")
+        clear_media_button.clicked.connect(self.__clear_media)
+
         layout.addWidget(QLabel("Write your tweet here!"), 0, 0, 1, 3)
         layout.addWidget(self.__tweet_text, 1, 0, 1, 3)
         layout.addWidget(QLabel("Check output here!"), 2, 0, 1, 3)
@@ -498,9 +878,39 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         layout.addWidget(self.__submit_button, 4, 0)
         layout.addWidget(self.__stop_button, 4, 1)
         layout.addWidget(self.__test_output_button, 4, 2)
+        layout.addWidget(self.__media_label, 5, 0)
+        layout.addWidget(attach_media_button, 5, 1)
+        layout.addWidget(clear_media_button, 5, 2)
+        self.__activity_feed = ActivityFeed()
+        layout.addWidget(self.__activity_feed, 6, 0, 1, 3)
         self.__tweet_area.setMinimumWidth(int(self.size().width() / 5 * 3))
         self.__tweet_area.setLayout(layout)
 
+    def __attach_media(self):
+        if len(self.__media_paths) >= MAX_MEDIA_ATTACHMENTS:
+            self.__show_error_dialog(f"Tweet can have at most {MAX_MEDIA_ATTACHMENTS} media attached!")
+            return
+
+        file, _ = QFileDialog.getOpenFileName(
+            self, "Choose media", "", "Media Files (*.png *.jpg *.jpeg *.gif *.webp *.mp4 *.mov)"
+        )
+        if file:
+            self.__media_paths.append(file)
+            self.__update_media_label()
+            log_inf(f"Attached media {file}")
+
+    def __clear_media(self):
+        self.__media_paths = []
+        self.__update_media_label()
+
+    def __update_media_label(self):
+        if self.__media_paths:
+            self.__media_label.setText(
+                ", ".join(os.path.basename(path) for path in self.__media_paths)
+            )
+        else:
+            self.__media_label.setText("No media attached")
+
     def __create_schedule_intervals_box(self):
         widget = QWidget()
 
@@ -515,6 +925,8 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         hours_checkbox.stateChanged.connect(self.__change_hours_state)
         days_checkbox = QCheckBox("Days")
         days_checkbox.stateChanged.connect(self.__change_days_state)
+        cron_checkbox = QCheckBox("Cron")
+        cron_checkbox.stateChanged.connect(self.__change_cron_state)
 
         self.__seconds_line = QLineEdit()
         self.__seconds_line.setEnabled(False)
@@ -524,6 +936,23 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         self.__hours_line.setEnabled(False)
         self.__days_line = QLineEdit()
         self.__days_line.setEnabled(False)
+        self.__cron_line = QLineEdit()
+        self.__cron_line.setPlaceholderText("30 8,17 * * MON-FRI")
+        self.__cron_line.setEnabled(False)
+        self.__cron_line.editingFinished.connect(self.__save_cron_value)
+
+        preview_button = QPushButton("Preview schedule")
+        preview_button.clicked.connect(self.__show_schedule_preview)
+
+        for field, line in (
+            ("seconds", self.__seconds_line),
+            ("minutes", self.__minutes_line),
+            ("hours", self.__hours_line),
+            ("days", self.__days_line),
+        ):
+            line.editingFinished.connect(
+                lambda field=field, line=line: self.__save_interval_value(field, line)
+            )
 
         layout = QGridLayout()
         layout.addWidget(interval_label, 0, 0)
@@ -535,11 +964,55 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         layout.addWidget(self.__minutes_line, 2, 1)
         layout.addWidget(self.__hours_line, 3, 1)
         layout.addWidget(self.__days_line, 4, 1)
+        layout.addWidget(cron_checkbox, 5, 0)
+        layout.addWidget(self.__cron_line, 5, 1)
+        layout.addWidget(preview_button, 6, 0, 1, 2)
         layout.setSpacing(10)
 
         widget.setLayout(layout)
         return widget
 
+    def __show_schedule_preview(self):
+        if self.__schedule_preview is None:
+            self.__schedule_preview = SchedulePreview(
+                self.__gather_settings, self.__tweet_text.toPlainText, self.__known_script_values
+            )
+        self.__schedule_preview.show()
+        self.__schedule_preview.refresh()
+
+    def __show_post_history(self):
+        if self.__history_view is None:
+            self.__history_view = HistoryView(self.__post_history)
+        self.__history_view.show()
+        self.__history_view.refresh()
+
+    def __show_logs(self):
+        if self.__log_viewer is None:
+            self.__log_viewer = LogViewer()
+        self.__log_viewer.show()
+
+    def __create_profiles_box(self):
+        widget = QWidget()
+        profiles_label = QLabel()
+        profiles_label.setText("<font color=#2798f5>PROFILE</font>")
+        profiles_label.setFont(QtGui.QFont("Open sans", weight=QtGui.QFont.Bold))
+        self.__profiles_box = QComboBox()
+        self.__profiles_box.currentTextChanged.connect(self.__switch_profile)
+        new_profile_button = QPushButton("New profile")
+        new_profile_button.clicked.connect(self.__create_profile)
+        self.__accounts_box = QComboBox()
+        self.__accounts_box.addItems(account_manager.names())
+        self.__accounts_box.currentTextChanged.connect(self.__change_account)
+
+        layout = QGridLayout()
+        layout.addWidget(profiles_label, 0, 0)
+        layout.addWidget(self.__profiles_box, 1, 0)
+        layout.addWidget(new_profile_button, 1, 1)
+        layout.addWidget(QLabel("Account"), 2, 0)
+        layout.addWidget(self.__accounts_box, 2, 1)
+        widget.setLayout(layout)
+        return widget
+
     def __create_schedule_date(self):
         widget = QWidget()
         schedule_label = QLabel()
@@ -549,11 +1022,36 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         schedule_switch.stateChanged.connect(self.__change_date_time_state)
         self.__date_time = QDateTimeEdit(QtCore.QDateTime.currentDateTime())
         self.__date_time.setEnabled(False)
+        self.__date_time.dateTimeChanged.connect(self.__save_schedule_value)
+
+        self.__catch_up_box = QComboBox()
+        self.__catch_up_box.addItem("Fire once late", FIRE_ONCE)
+        self.__catch_up_box.addItem("Fire all missed", FIRE_ALL)
+        self.__catch_up_box.addItem("Skip missed", SKIP)
+        self.__catch_up_box.currentIndexChanged.connect(self.__save_catch_up_policy)
+
+        self.__duplicate_box = QComboBox()
+        self.__duplicate_box.addItem("Skip duplicates", DUPLICATE_SKIP)
+        self.__duplicate_box.addItem("Vary duplicates", DUPLICATE_VARY)
+        self.__duplicate_box.currentIndexChanged.connect(self.__save_duplicate_policy)
+
+        self.__prerender_box = QSpinBox()
+        self.__prerender_box.setRange(0, MAX_PRERENDER_LEAD_SECONDS)
+        self.__prerender_box.setSuffix(" s")
+        self.__prerender_box.setSpecialValueText("Off")
+        self.__prerender_box.setToolTip("Run scripts and render the tweet this long before posting")
+        self.__prerender_box.valueChanged.connect(self.__save_prerender_lead)
 
         layout = QGridLayout()
         layout.addWidget(schedule_label, 0, 0)
         layout.addWidget(schedule_switch, 1, 0)
         layout.addWidget(self.__date_time, 1, 1)
+        layout.addWidget(QLabel("Missed posts"), 2, 0)
+        layout.addWidget(self.__catch_up_box, 2, 1)
+        layout.addWidget(QLabel("Same content"), 3, 0)
+        layout.addWidget(self.__duplicate_box, 3, 1)
+        layout.addWidget(QLabel("Render ahead"), 4, 0)
+        layout.addWidget(self.__prerender_box, 4, 1)
         widget.setLayout(layout)
         return widget
 
@@ -569,7 +1067,7 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         self.__paths_list = []
         self.__scripts_val_list = []
         add_script_button = QPushButton("Add new script")
-        add_script_button.clicked.connect(self.__add_new_script)
+        add_script_button.clicked.connect(lambda: self.__add_new_script())
 
         self.__scripts_layout.addWidget(scripts_label)
         self.__scripts_layout.addWidget(
@@ -581,18 +1079,23 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         self.__scripts_widget.setLayout(self.__scripts_widget_layout)
         return widget
 
-    def __add_new_script(self):
+    def __add_new_script(self, var="", path=None):
         log_inf("Adding new script")
         widget = QWidget()
         layout = QHBoxLayout()
         label = QLabel("Name")
+        index = len(self.__scripts_val_list)
 
-        text_area = QLineEdit()
+        text_area = QLineEdit(var)
         text_area.setMinimumWidth(int(self.size().width() / 6))
+        text_area.editingFinished.connect(self.__save_scripts)
         self.__scripts_val_list.append(text_area)
+        self.__paths_list.append(path)
 
-        button = QPushButton("Add new script")
-        button.clicked.connect(self.__choose_script_path)
+        button = QPushButton(os.path.basename(path) if path else "Add new script")
+        button.clicked.connect(
+            lambda _, index=index, button=button: self.__choose_script_path(index, button)
+        )
 
         layout.addWidget(label)
         layout.addWidget(text_area)
@@ -602,17 +1105,287 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         self.has_script = True
         self.__scripts_widget_layout.addWidget(widget)
 
-    def __choose_script_path(self):
+    def __clear_scripts(self):
+        while self.__scripts_widget_layout.count():
+            item = self.__scripts_widget_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+
+        paths = [path for path in self.__paths_list if path]
+        self.__paths_list = []
+        for path in paths:
+            # Running schedules of other profiles may still use the script
+            if not self.__script_in_use(path):
+                self.__script_watcher.unwatch(path)
+                self.__resident_scripts.stop(path, wait=False)
+
+        self.__scripts_val_list = []
+        self.has_script = False
+
+    def __choose_script_path(self, index, button):
         file, _ = QFileDialog.getOpenFileName(
             self, "Choose script", "", "Python Files (*.py)"
         )
         if file:
-            sender = self.sender()
-            sender.setText(os.path.basename(file))
-            self.__paths_list.append(file)
+            error = validate_script(file)
+            if error:
+                self.__show_error_dialog(f"Script contains errors, can't add it!\n{error}")
+                return
+
+            previous = self.__paths_list[index]
+            button.setText(os.path.basename(file))
+            self.__paths_list[index] = file
+            if previous and not self.__script_in_use(previous):
+                self.__script_watcher.unwatch(previous)
+                self.__resident_scripts.stop(previous, wait=False)
+
+            self.__script_watcher.watch(file)
+            self.__save_scripts()
             log_inf(f"Added new script path {file}")
             self.__show_info_dialog(f"Success! Added new script {file}.")
-            run_script(file)
+            if self.__start_resident_script(file):
+                self.__script_pool.submit(precompile_script, file)
+                return
+
+            # Compiling and the first run may take long, they run off the GUI thread
+            future = self.__script_pool.submit(precompile_and_run_script, file)
+            future.add_done_callback(
+                lambda future: self.scriptChecked.emit(
+                    file, future.exception() is None and future.result()
+                )
+            )
+
+    def __start_resident_script(self, path):
+        if not path or not is_resident_script(path):
+            return False
+
+        self.__resident_scripts.start(path)
+        return True
+
+    def __handle_reloaded_script(self, path):
+        # The old process is stopped in the background, stopping may take seconds
+        if self.__resident_scripts.is_running(path):
+            self.__resident_scripts.stop(path, wait=False)
+        self.__start_resident_script(path)
+
+    def __known_script_values(self):
+        """Values of bound scripts from the last render or their cached outputs, without running them."""
+        values = {}
+        for var_line, path in zip(self.__scripts_val_list, self.__paths_list):
+            var = var_line.text()
+            if not var or not path:
+                continue
+            if self.__resident_scripts.is_running(path):
+                value = self.__resident_scripts.latest(path)
+            else:
+                try:
+                    value = read_script_output(path)
+                except (OSError, ValueError):
+                    value = None
+            if value is not None:
+                values[var] = value
+
+        values.update(self.__rendered_vars)
+        return values
+
+    def __evaluate_script(self, path, inputs):
+        # Resident scripts keep running, their latest published value is used
+        if self.__resident_scripts.is_running(path):
+            return self.__resident_scripts.latest(path)
+        return evaluate_script(path, inputs)
+
+    def __create_trigger_box(self):
+        widget = QWidget()
+        trigger_label = QLabel()
+        trigger_label.setText("<font color=#2798f5>TRIGGER</font>")
+        trigger_label.setFont(QtGui.QFont("Open sans", weight=QtGui.QFont.Bold))
+
+        self.__trigger_var_line = QLineEdit()
+        self.__trigger_var_line.setPlaceholderText("Script variable")
+        self.__trigger_file = None
+        self.__trigger_file_button = QPushButton("Watch file")
+        self.__trigger_file_button.clicked.connect(self.__choose_trigger_file)
+
+        self.__trigger_mode_box = QComboBox()
+        self.__trigger_mode_box.addItem("Value changes", TRIGGER_CHANGE)
+        self.__trigger_mode_box.addItem("Rises above", TRIGGER_ABOVE)
+        self.__trigger_mode_box.addItem("Falls below", TRIGGER_BELOW)
+        self.__trigger_threshold_line = QLineEdit()
+        self.__trigger_threshold_line.setPlaceholderText("Threshold")
+
+        self.__trigger_sample_box = QSpinBox()
+        self.__trigger_sample_box.setRange(1, 24 * 60 * 60)
+        self.__trigger_sample_box.setValue(DEFAULT_TRIGGER_SAMPLE_SECONDS)
+        self.__trigger_sample_box.setSuffix(" s")
+        self.__trigger_debounce_box = QSpinBox()
+        self.__trigger_debounce_box.setRange(0, 24 * 60 * 60)
+        self.__trigger_debounce_box.setSuffix(" s")
+        self.__trigger_cooldown_box = QSpinBox()
+        self.__trigger_cooldown_box.setRange(0, 7 * 24 * 60 * 60)
+        self.__trigger_cooldown_box.setSuffix(" s")
+
+        start_button = QPushButton("Start trigger")
+        start_button.clicked.connect(self.__start_trigger)
+        stop_button = QPushButton("Stop trigger")
+        stop_button.clicked.connect(self.__stop_trigger)
+
+        layout = QGridLayout()
+        layout.addWidget(trigger_label, 0, 0)
+        layout.addWidget(self.__trigger_var_line, 1, 0)
+        layout.addWidget(self.__trigger_file_button, 1, 1)
+        layout.addWidget(self.__trigger_mode_box, 2, 0)
+        layout.addWidget(self.__trigger_threshold_line, 2, 1)
+        layout.addWidget(QLabel("Sample every"), 3, 0)
+        layout.addWidget(self.__trigger_sample_box, 3, 1)
+        layout.addWidget(QLabel("Debounce"), 4, 0)
+        layout.addWidget(self.__trigger_debounce_box, 4, 1)
+        layout.addWidget(QLabel("Cool-down"), 5, 0)
+        layout.addWidget(self.__trigger_cooldown_box, 5, 1)
+        layout.addWidget(start_button, 6, 0)
+        layout.addWidget(stop_button, 6, 1)
+        widget.setLayout(layout)
+        return widget
+
+    def __choose_trigger_file(self):
+        file, _ = QFileDialog.getOpenFileName(self, "Choose file to watch", "", "All Files (*.*)")
+        self.__trigger_file = file or None
+        self.__trigger_file_button.setText(os.path.basename(file) if file else "Watch file")
+
+    def __load_trigger_conf(self):
+        conf = self.__profile_store.get_setting(TRIGGER_KEY)
+        if not conf:
+            return
+
+        conf = json.loads(conf)
+        self.__trigger_var_line.setText(conf.get("variable", ""))
+        self.__trigger_file = conf.get("file")
+        if self.__trigger_file:
+            self.__trigger_file_button.setText(os.path.basename(self.__trigger_file))
+        index = self.__trigger_mode_box.findData(conf.get("mode"))
+        if index >= 0:
+            self.__trigger_mode_box.setCurrentIndex(index)
+        self.__trigger_threshold_line.setText(conf.get("threshold", ""))
+        self.__trigger_sample_box.setValue(conf.get("sample", DEFAULT_TRIGGER_SAMPLE_SECONDS))
+        self.__trigger_debounce_box.setValue(conf.get("debounce", 0))
+        self.__trigger_cooldown_box.setValue(conf.get("cooldown", 0))
+
+    def __save_trigger_conf(self):
+        self.__profile_store.set_setting(
+            TRIGGER_KEY,
+            json.dumps(
+                {
+                    "variable": self.__trigger_var_line.text(),
+                    "file": self.__trigger_file,
+                    "mode": self.__trigger_mode_box.currentData(),
+                    "threshold": self.__trigger_threshold_line.text(),
+                    "sample": self.__trigger_sample_box.value(),
+                    "debounce": self.__trigger_debounce_box.value(),
+                    "cooldown": self.__trigger_cooldown_box.value(),
+                }
+            ),
+        )
+
+    def __trigger_script_path(self, variable):
+        for var_line, path in zip(self.__scripts_val_list, self.__paths_list):
+            if var_line.text() == variable and path:
+                return path
+        return None
+
+    def __start_trigger(self):
+        variable = self.__trigger_var_line.text().strip()
+        if variable:
+            source = self.__trigger_script_path(variable)
+            if not source:
+                self.__show_error_dialog(f"Variable {variable} is not bound to any script!")
+                return
+        elif self.__trigger_file:
+            source = self.__trigger_file
+        else:
+            self.__show_error_dialog("Choose a script variable or a file to watch!")
+            return
+
+        threshold = self.__trigger_threshold_line.text().strip()
+        try:
+            self.__trigger = ValueTrigger(
+                self.__trigger_mode_box.currentData(),
+                float(threshold) if threshold else None,
+                self.__trigger_debounce_box.value(),
+                self.__trigger_cooldown_box.value(),
+            )
+        except (TriggerException, ValueError) as e:
+            self.__show_error_dialog(f"Invalid trigger settings: {e}")
+            return
+
+        self.__trigger_source = source
+        self.__trigger_variable = variable or None
+        self.__save_trigger_conf()
+        self.__trigger_timer.start(self.__trigger_sample_box.value() * 1000)
+        self.__sample_trigger()
+        self.__show_info_dialog(f"Trigger started, sampling {os.path.basename(source)}.")
+
+    def __stop_trigger(self):
+        if not self.__trigger_timer.isActive():
+            self.__show_error_dialog("Trigger is not started!")
+            return
+
+        self.__trigger_timer.stop()
+        log_inf(f"Trigger stopped after {self.__trigger.fired} fires in {self.__trigger.samples} samples")
+        self.__trigger = None
+        self.__show_info_dialog("Trigger has been stopped!")
+
+    def __sample_trigger(self):
+        # A slow script is not sampled again before it finishes
+        if self.__trigger_sample is not None and not self.__trigger_sample.done():
+            return
+
+        graph = None
+        if self.__trigger_variable:
+            # Sampled like a render, so the script gets its inputs
+            try:
+                graph = self.__build_script_graph()
+            except ScriptGraphException as e:
+                log_err(f"Failed to sample trigger {self.__trigger_variable}, error: {e}")
+                return
+
+        self.__trigger_sample = self.__script_pool.submit(self.__read_trigger_value, graph)
+        self.__trigger_sample.add_done_callback(self.triggerSampled.emit)
+
+    def __read_trigger_value(self, graph):
+        if graph is None:
+            return read_trigger_value(self.__trigger_source)
+
+        variable = self.__trigger_variable
+        return graph.run(self.__evaluate_script, required=[variable])[variable]
+
+    def __handle_trigger_sample(self, future):
+        if self.__trigger is None:
+            return
+
+        try:
+            value = future.result()
+        except (OSError, UnicodeDecodeError, ScriptGraphException) as e:
+            log_err(f"Failed to sample trigger {self.__trigger_source}, error: {e}")
+            return
+        if value is None or not self.__trigger.update(value):
+            return
+
+        # The sampled value is posted as it is, its script doesn't run again
+        resolved = {self.__trigger_variable: value} if self.__trigger_variable else None
+        self.__unattended = True
+        try:
+            with tracer.trace("trigger.fire", **{"trigger.source": self.__trigger_source}):
+                self.__post_single_tweet(scheduled=True, resolved=resolved)
+        finally:
+            self.__unattended = False
+
+    def __handle_checked_script(self, path, succeeded):
+        if not succeeded:
+            self.__show_error_dialog(
+                f"Script {os.path.basename(path)} contains errors or Python enviroment is not installed! Can't run script."
+            )
+
+    def __handle_broken_script(self, path, error):
+        self.__show_error_dialog(f"Script {os.path.basename(path)} was changed and contains errors!\n{error}")
 
     def __change_seconds_state(self):
         self.__seconds_line.setEnabled(not self.__seconds_line.isEnabled())
@@ -626,6 +1399,9 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
     def __change_days_state(self):
         self.__days_line.setEnabled(not self.__days_line.isEnabled())
 
+    def __change_cron_state(self):
+        self.__cron_line.setEnabled(not self.__cron_line.isEnabled())
+
     def __change_date_time_state(self):
         self.__date_time.setEnabled(not self.__date_time.isEnabled())
 
@@ -638,42 +1414,120 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
         if self.__settings.is_scheduled or self.__settings.is_interval:
             self.__start_timer()
         else:
-            self.__post_single_tweet()
+            with tracer.trace("manual.post"):
+                self.__post_single_tweet()
 
-    def __post_single_tweet(self):
+    def __post_single_tweet(self, scheduled=False, resolved=None):
         log_inf("Posting single tweet")
-        content = self.__tweet_text.toPlainText()
-        if self.has_script:
-            var_script_pair = self.__convert_scripts()
-            if not var_script_pair:
-                return
-
-            content = self.__handle_tweet_vals_replacement(content, var_script_pair)
-            if not content:
-                return
+        content = self.__gather__all_tweet_data(resolved)
         if not content:
-            self.__show_error_dialog("Tweet area is empty!")
             return
 
-        return_code = post({"text": content})
+        self.__post_content(
+            content, scheduled, tuple(self.__media_paths), variables=self.__rendered_vars
+        )
+
+    def __post_content(
+        self, content, scheduled, media_paths=(), on_done=None, variables=None, account=None, profile=None
+    ):
+        """Posts in the background, on_done(posted) is called on the GUI thread.
+
+        Without account and profile the ones selected in the window are used.
+        """
+        account = account or self.__account
+        profile = profile or self.__profile
+        deduplicated = self.__handle_duplicate_content(content, scheduled, account)
+        if not deduplicated:
+            self.__post_history.record(
+                account, HISTORY_SKIPPED, content, variables, profile=profile
+            )
+            if on_done:
+                on_done(False)
+            return False
+
+        request = (account, profile, deduplicated, variables, on_done)
+        started = time.monotonic()
+        future = self.__posting_pool.submit(account, {"text": deduplicated}, media_paths)
+        future.add_done_callback(
+            lambda future: self.postFinished.emit(request, future, time.monotonic() - started)
+        )
+        return True
+
+    def __handle_post_result(self, request, future, latency):
+        account, profile, content, variables, on_done = request
+        if future.cancelled():
+            # Cancelled on exit, queued tweets still in flight are pending again on the next start
+            log_wrn(f"Post for account {account} was cancelled")
+            return
 
+        posted = False
+        # Exceptions must not escape a Qt slot and on_done always has to run,
+        # otherwise a queued tweet stays in flight forever
         try:
-            check_return_code(return_code)
-            self.__show_info_dialog("Your tweet has been posted successfully!")
-            log_inf(f"Posted successfully")
-        except TweetNotPostedException as e:
-            self.__show_error_dialog(
-                "There was a problem with posting your tweet! Check if content is not same as last tweet!"
+            tweet_id, error = read_post_result(future)
+            posted = error is None
+            if posted:
+                self.__duplicate_index.record(account, content)
+                self.__notify(f"Posted tweet from account {account}")
+                log_inf(f"Posted successfully")
+            elif isinstance(error, TweetNotPostedException):
+                self.__notify(
+                    f"Twitter rejected tweet from account {account}, check if content is not same as last tweet!",
+                    ACTIVITY_ERROR,
+                )
+                log_err(error)
+            else:
+                self.__notify(f"Failed to post from account {account}: {error}", ACTIVITY_ERROR)
+                log_err(error)
+
+            self.__post_history.record(
+                account,
+                HISTORY_POSTED if posted else HISTORY_FAILED,
+                content,
+                variables,
+                tweet_id=tweet_id,
+                latency=latency,
+                error=str(error) if error else None,
+                profile=profile,
             )
-            log_err(e)
+        except Exception as e:
+            log_err(f"Failed to handle post result of account {account}, error: {e}")
+        finally:
+            if on_done:
+                on_done(posted)
+
+    def __notify(self, text, level=ACTIVITY_INFO):
+        self.__activity_feed.add(text, level)
+        self.statusBar().showMessage(text, NOTIFICATION_TIMEOUT_MS)
+
+    def __handle_duplicate_content(self, content, scheduled, account):
+        if not self.__duplicate_index.is_duplicate(account, content):
+            return content
+
+        if self.__duplicate_box.currentData() == DUPLICATE_VARY:
+            varied = self.__duplicate_index.vary(account, content)
+            if varied:
+                log_inf(f"Content was already posted, posting variation instead")
+                return varied
+
+        log_wrn(f"Skipping post, same content was already posted by account {account}")
+        if scheduled:
+            self.__notify("Skipped post, same content was posted recently", ACTIVITY_ERROR)
+        else:
+            self.__show_error_dialog("Same content was posted recently, Twitter would reject it!")
+        return None
 
-    def __gather__all_tweet_data(self):
+    def __gather__all_tweet_data(self, resolved=None, template=None, scripts=None):
+        """Renders the tweet, a running schedule passes the template and scripts it was started with."""
         log_inf("Gathering tweet data")
-        content = self.__tweet_text.toPlainText()
-        if self.has_script:
-            var_script_pair = self.__convert_scripts()
-            if not var_script_pair:
+        content = self.__tweet_text.toPlainText() if template is None else template
+        scripts = self.__script_bindings() if scripts is None else scripts
+        self.__rendered_vars = {}
+        if scripts:
+            var_script_pair = self.__convert_scripts(content, resolved, scripts)
+            if var_script_pair is None:
                 return None
+            self.__rendered_vars = var_script_pair
 
             content = self.__handle_tweet_vals_replacement(content, var_script_pair)
             if not content:
@@ -684,6 +1538,119 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
 
         return content
 
+    # tweet queue
+    def __import_queue(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Choose queue to import", "", "Queue Files (*.csv *.jsonl *.ndjson)"
+        )
+        if not filename:
+            return
+
+        progress_dialog = QProgressDialog("Importing tweets...", "Cancel", 0, 100, self)
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+
+        def progress(imported, bytes_read, total_bytes):
+            progress_dialog.setValue(int(bytes_read * 100 / max(total_bytes, 1)))
+            progress_dialog.setLabelText(f"Imported {imported} tweets...")
+            qApp.processEvents()
+            return not progress_dialog.wasCanceled()
+
+        try:
+            result = import_queue(filename, self.__tweet_queue, self.__profile, progress)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            progress_dialog.close()
+            self.__show_error_dialog(f"Failed to import {filename}, error: {e}")
+            return
+
+        progress_dialog.close()
+        msg = f"Imported {result.imported} tweets to profile {self.__profile}."
+        if result.cancelled:
+            msg += "\nImport was cancelled."
+        if result.rejected:
+            errors = "\n".join(f"   Line {line}: {reason}" for line, reason in result.errors[:10])
+            msg += f"\nRejected {result.rejected} rows:\n{errors}"
+        self.__show_info_dialog(msg)
+
+    def __mail_merge(self):
+        content = self.__tweet_text.toPlainText()
+        if not content:
+            self.__show_error_dialog("Tweet area is empty!")
+            return
+
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Choose variables to merge", "", "Variable Files (*.csv *.jsonl *.ndjson)"
+        )
+        if not filename:
+            return
+
+        spacing, ok = QInputDialog.getInt(
+            self, "Mail merge", "Minutes between tweets:", 60, 0, 60 * 24 * 7
+        )
+        if not ok:
+            return
+
+        progress_dialog = QProgressDialog("Rendering tweets...", "Cancel", 0, 100, self)
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+
+        def progress(queued, bytes_read, total_bytes):
+            progress_dialog.setValue(int(bytes_read * 100 / max(total_bytes, 1)))
+            progress_dialog.setLabelText(f"Queued {queued} tweets...")
+            qApp.processEvents()
+            return not progress_dialog.wasCanceled()
+
+        try:
+            result = merge_file_into_queue(
+                filename, content, self.__tweet_queue, self.__profile, spacing * 60, progress
+            )
+        except (OSError, UnicodeDecodeError, ValueError, csv.Error) as e:
+            progress_dialog.close()
+            self.__show_error_dialog(f"Failed to merge {filename}, error: {e}")
+            return
+
+        progress_dialog.close()
+        msg = f"Queued {result.queued} tweets to profile {self.__profile}."
+        if result.cancelled:
+            msg += "\nMail merge was cancelled."
+        if result.errors:
+            errors = "\n".join(f"   Row {row}: {reason}" for row, reason in result.errors[:10])
+            msg += f"\nFlagged {result.too_long + result.missing} rows, rejected {result.rejected} rows:\n{errors}"
+        self.__show_info_dialog(msg)
+
+    def __start_queue(self):
+        if not self.__queue_timer.isActive():
+            self.__queue_timer.start(QUEUE_CHECK_INTERVAL_MS)
+        pending = self.__tweet_queue.count(self.__profile)
+        self.__show_info_dialog(f"Queue started, {pending} tweets are waiting.")
+
+    def __stop_queue(self):
+        self.__queue_timer.stop()
+        self.__show_info_dialog("Queue has been stopped!")
+
+    def __clear_queue(self):
+        removed = self.__tweet_queue.clear_pending(self.__profile)
+        self.__show_info_dialog(f"Removed {removed} pending tweets.")
+
+    def __check_queue(self):
+        for tweet in self.__tweet_queue.due(self.__profile, time.time()):
+            content, _ = parse_tweet(tweet.text, tweet.variables)
+            unbound = find_placeholders(content)
+            if unbound:
+                log_wrn(f"{tweet} has text in braces without values, posting it as text: {sorted(unbound)}")
+
+            # Marked in flight so the next check doesn't post it again
+            self.__tweet_queue.mark(tweet.id, STATUS_POSTING)
+            with tracer.trace("queue.tick", **{"queue.tweet_id": tweet.id}):
+                self.__post_content(
+                    content,
+                    scheduled=True,
+                    variables=tweet.variables,
+                    on_done=lambda posted, tweet_id=tweet.id: self.__tweet_queue.mark(
+                        tweet_id, STATUS_POSTED if posted else STATUS_FAILED
+                    ),
+                )
+
     def __load_tweet(self):
         filename, _ = QFileDialog.getOpenFileName(
             self, "Choose file to load", "", "All Files (*.*)"
@@ -741,6 +1708,8 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
                 settings.add_hours(self.__convert_val(self.__hours_line.text()))
             if self.__days_line.isEnabled():
                 settings.add_days(self.__convert_val(self.__days_line.text()))
+            if self.__cron_line.isEnabled():
+                settings.add_cron(self.__cron_line.text().strip())
             if self.__date_time.isEnabled():
                 settings.add_date_time(self.__date_time.dateTime())
         except InvalidSettingException as e:
@@ -749,116 +1718,225 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
 
         return settings
 
-    def __check_interval_tweet(self):
-        day, hour, min, sec = map(int, time.strftime("%d %H %M %S").split())
+    def __create_scheduler(self, settings):
+        next_fire = schedule_next_fire(
+            settings.seconds,
+            settings.minutes,
+            settings.hours,
+            settings.days,
+            cron=settings.cron,
+            date_time=settings.date_time.toPyDateTime() if settings.is_scheduled else None,
+        )
 
-        if self.__settings.seconds:
-            if sec % self.__settings.seconds != 0:
-                return
+        return Scheduler(next_fire, policy=self.__catch_up_box.currentData())
 
-        if self.__settings.minutes:
-            if min % self.__settings.minutes != 0:
-                return
+    def __check_schedule(self, run):
+        self.__unattended = True
+        try:
+            for fire_time, lateness in run.scheduler.poll():
+                with tracer.trace(
+                    "schedule.tick",
+                    **{
+                        "schedule.fire_time": fire_time.isoformat(),
+                        "schedule.lateness": lateness,
+                        "schedule.profile": run.profile,
+                    },
+                ):
+                    self.__post_scheduled_tweet(run, fire_time)
+        finally:
+            self.__unattended = False
+
+        if run.scheduler.is_finished():
+            log_inf(f"Schedule of profile {run.profile} finished, {run.scheduler.stats}")
+            self.__finish_schedule(run)
+            return
 
-        if self.__settings.hours:
-            if hour % self.__settings.hours != 0:
-                return
+        run.timer.start(run.scheduler.milliseconds_until_next())
+        self.__start_prerender_timer(run)
 
-        if self.__settings.days:
-            if day % self.__settings.days != 0:
+    def __post_scheduled_tweet(self, run, fire_time):
+        prerendered, run.prerendered = run.prerendered, None
+        if prerendered is None or prerendered[0] != fire_time:
+            # Rendering ahead is off or failed, fall back to rendering now
+            content = self.__gather__all_tweet_data(template=run.template, scripts=run.scripts)
+            if not content:
                 return
+            variables = self.__rendered_vars
+        else:
+            _, content, variables = prerendered
+            log_inf(f"Posting tweet rendered ahead for {fire_time}")
+
+        self.__post_content(
+            content,
+            True,
+            run.media_paths,
+            variables=variables,
+            account=run.account,
+            profile=run.profile,
+        )
 
-        self.__post_single_tweet()
+    def __start_prerender_timer(self, run):
+        lead = self.__prerender_box.value()
+        if not lead or run.scheduler.is_finished():
+            run.prerender_timer.stop()
+            return
 
-    def __check_scheduled_tweet(self):
-        current_date = QtCore.QDateTime.currentDateTime().date()
-        current_time = QtCore.QDateTime.currentDateTime().time()
-        scheduled_time = self.__settings.date_time
+        run.prerender_timer.start(run.scheduler.milliseconds_until_next(lead))
 
-        if (
-            current_date == scheduled_time.date()
-            and current_time.hour() == scheduled_time.time().hour()
-            and current_time.minute() == scheduled_time.time().minute()
-        ):
-            self.__post_single_tweet()
-            self.__timer.stop()
+    def __prerender(self, run):
+        fire_time = run.scheduler.next_fire_time()
+        if fire_time is None or (run.prerendered and run.prerendered[0] == fire_time):
+            return
+        # Timer delays are capped, wait until the lead time is really reached
+        if run.scheduler.milliseconds_until_next(self.__prerender_box.value()) > 0:
+            self.__start_prerender_timer(run)
+            return
+
+        self.__unattended = True
+        try:
+            with tracer.trace("schedule.prerender", **{"schedule.fire_time": fire_time.isoformat()}):
+                content = self.__gather__all_tweet_data(template=run.template, scripts=run.scripts)
+        finally:
+            self.__unattended = False
+
+        if content:
+            run.prerendered = (fire_time, content, self.__rendered_vars)
+            log_inf(f"Rendered tweet ahead for {fire_time}")
+        else:
+            log_wrn(f"Rendering ahead for {fire_time} failed, will render at fire time")
 
     def __start_timer(self):
-        self.__timer = QtCore.QTimer()
+        scheduler = self.__create_scheduler(self.__settings)
+        if scheduler.is_finished():
+            self.__show_error_dialog("Schedule never posts, check your settings!")
+            return
+
+        previous = self.__schedules.pop(self.__profile, None)
+        if previous:
+            previous.stop()
+
+        run = self.ScheduleRun(
+            self.__profile,
+            self.__account,
+            self.__tweet_text.toPlainText(),
+            self.__script_bindings(),
+            tuple(self.__media_paths),
+            self.__settings,
+            scheduler,
+        )
+        run.timer.timeout.connect(lambda: self.__check_schedule(run))
+        run.prerender_timer.timeout.connect(lambda: self.__prerender(run))
+        self.__schedules[run.profile] = run
 
         if self.__settings.is_scheduled:
             self.__show_info_dialog(f"Success! You Tweet is scheduled for:\n   Date: {self.__settings.date_time.date().toString('dd.MM.yyyy')}\n   Time: {self.__settings.date_time.time().toString('hh:mm:ss')}")
-            self.__timer.timeout.connect(self.__check_scheduled_tweet)
         elif self.__settings.is_interval:
             self.__show_info_dialog(f"Success! You Tweet is set for interval: {self.__settings.get_interval()}")
-            self.__timer.timeout.connect(self.__check_interval_tweet)
-        self.__timer.start(1000)
+        log_inf(f"Schedule of profile {run.profile} started for account {run.account}")
+        run.timer.start(scheduler.milliseconds_until_next())
+        self.__start_prerender_timer(run)
 
     def __stop_timer(self):
-        if self.__timer:
+        run = self.__schedules.get(self.__profile)
+        if run and run.timer.isActive():
             self.__show_info_dialog("Interval has been stopped!")
-            self.__timer.stop()
+            log_inf(f"Schedule of profile {run.profile} stopped, {run.scheduler.stats}")
+            self.__finish_schedule(run)
         else:
             self.__show_error_dialog("Interval is not started!")
 
+    def __finish_schedule(self, run):
+        run.stop()
+        if self.__schedules.get(run.profile) is run:
+            del self.__schedules[run.profile]
+        for path in run.script_paths():
+            if not self.__script_in_use(path):
+                self.__script_watcher.unwatch(path)
+                self.__resident_scripts.stop(path, wait=False)
+
+    def __script_in_use(self, path):
+        """Whether the current profile or a running schedule binds the script."""
+        return path in self.__paths_list or any(
+            path in run.script_paths() for run in self.__schedules.values()
+        )
+
     def __convert_val(self, val):
         try:
             return int(val)
         except ValueError as e:
             log_err(e)
 
+    def __toggle_watchdog(self, enabled):
+        if enabled:
+            self.__watchdog.start()
+            self.__watchdog_timer.start(WATCHDOG_INTERVAL_MS)
+        else:
+            self.__watchdog_timer.stop()
+            self.__watchdog.stop()
+
+        if not self.__loading_profile:
+            self.__profile_store.set_setting(WATCHDOG_KEY, "1" if enabled else "0")
+
     def __show_error_dialog(self, text):
-        error_dialog = QErrorMessage()
-        error_dialog.showMessage(text)
-        error_dialog.exec_()
+        # Nobody may be at the keyboard when the schedule fires
+        if self.__unattended:
+            self.__notify(text, ACTIVITY_ERROR)
+            return
+
+        # One dialog is reused, a new one per error is never freed
+        self.__error_dialog.showMessage(text)
+        self.__error_dialog.exec_()
 
     def __show_info_dialog(self, text):
         dialog = QMessageBox.information(self, "Info!", text)
 
-    def __convert_scripts(self):
-        scripts_val_dict = {}
-        i = 0
-        for i in range(0, len(self.__scripts_val_list)):
+    def __script_bindings(self):
+        return [
+            (self.__check_var_value(var_line), path)
+            for var_line, path in zip(self.__scripts_val_list, self.__paths_list)
+        ]
+
+    def __build_script_graph(self, scripts=None):
+        graph = ScriptGraph()
+        for var, script in self.__script_bindings() if scripts is None else scripts:
+            if not var or not script:
+                raise ScriptGraphException("Script or var areas are not filled!")
             try:
-                script = self.__paths_list[i]
-                var = self.__scripts_val_list[i]
-                run_script(script)
-                var_script_pair = self.__build_var_script_pair(var, script)
-                if var_script_pair:
-                    scripts_val_dict[var_script_pair[0]] = var_script_pair[1]
-            except:
-                self.__show_error_dialog(
-                    "Error: one of areas is not filled correctly, can't submit!"
-                )
-                return None
+                graph.add_script(var, script)
+            except (OSError, SyntaxError, ValueError) as e:
+                raise ScriptGraphException(f"Script {os.path.basename(script)} can't be read: {e}")
 
-        return scripts_val_dict
+        return graph
 
-    def __load_script_value_from_file(self, path):
-        filename = os.path.basename(path)[:-3]
-        filename = f"{SCRIPT_PATH_PREFIX}/{filename}.txt"
+    def __convert_scripts(self, content, resolved=None, scripts=None):
+        try:
+            graph = self.__build_script_graph(scripts)
+        except ScriptGraphException as e:
+            self.__show_error_dialog(str(e))
+            return None
 
-        with open(filename, "r") as file:
-            return file.read()
+        used, unused, unbound = split_variables(content, graph.variables())
+        self.__unused_vars = sorted(unused)
+        if unused:
+            log_wrn(f"Script variables not used in tweet, skipping: {self.__unused_vars}")
+        if unbound:
+            # Braces around text without a script, e.g. {sale}, are posted as they are
+            log_wrn(f"Tweet text in braces is not bound to any script, posting it as text: {sorted(unbound)}")
 
-    def __build_var_script_pair(self, text_area, script):
         try:
-            var = self.__check_var_value(text_area)
-            script_val = self.__load_script_value_from_file(script)
-
-            if len(var) > 0 and script_val:
-                return (var, script_val)
-            else:
-                self.__show_error_dialog(f"Script or var areas are not filled!")
-        except Exception as e:
-            self.__show_error_dialog(f"Failed to load var name or script, error: {e}")
+            with tracer.span("scripts.evaluate", **{"scripts.count": len(used)}):
+                values = graph.run(self.__evaluate_script, required=used, resolved=resolved)
+            return {var: values[var] for var in used}
+        except ScriptGraphException as e:
+            self.__show_error_dialog(str(e))
             return None
 
     def __check_var_value(self, text_area):
         return text_area.text() if not None else None
 
     def __handle_tweet_vals_replacement(self, content, var_script_dict):
-        replaced_content, missing_vals = parse_tweet(content, var_script_dict)
+        with tracer.span("template.render"):
+            replaced_content, missing_vals = parse_tweet(content, var_script_dict)
         if missing_vals:
             self.__show_error_dialog(
                 f"Atleast one of the script variables didn't match in tweet content: {missing_vals}"
@@ -872,7 +1950,29 @@ If there's enough time, Im planning on rewriting app on C++ with server intergra
 
         if content:
             self.__test_tweet_text.setPlainText(content)
-            self.__show_info_dialog("Successfully parsed scripts!")
+            if self.has_script and self.__unused_vars:
+                self.__show_info_dialog(
+                    f"Successfully parsed scripts!\nVariables not used in tweet: {self.__unused_vars}"
+                )
+            else:
+                self.__show_info_dialog("Successfully parsed scripts!")
+
+
+def precompile_and_run_script(path):
+    precompile_script(path)
+    return run_script(path)
+
+
+def read_trigger_value(source):
+    if source.endswith(".py"):
+        return evaluate_script(source, {})
+
+    with open(source, "r") as file:
+        return file.read().strip()
+
+
+def count_live_qobjects():
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, QtCore.QObject))
 
 
 main_window = None
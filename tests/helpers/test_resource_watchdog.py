@@ -0,0 +1,44 @@
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from helpers.resource_watchdog import OPEN_FDS, TRACED_BYTES, ResourceWatchdog
+
+
+def test_sample_reports_metrics_and_growth():
+    watchdog = ResourceWatchdog(probes={"live_objects": lambda: 3})
+    assert watchdog.sample() is None
+
+    watchdog.start()
+    try:
+        leak = [bytearray(1024) for _ in range(100)]
+        sample = watchdog.sample()
+    finally:
+        watchdog.stop()
+
+    assert sample.metrics["live_objects"] == 3
+    assert sample.metrics[TRACED_BYTES] > 0
+    assert any(stat.size_diff >= 100 * 1024 for stat in sample.growth)
+    assert not watchdog.is_running()
+    del leak
+
+
+def test_threshold_warning_once(monkeypatch):
+    warnings = []
+    monkeypatch.setattr("helpers.resource_watchdog.log_wrn", warnings.append)
+    fds = [10]
+    watchdog = ResourceWatchdog(probes={OPEN_FDS: lambda: fds[0]}, thresholds={OPEN_FDS: 5})
+
+    watchdog.start()
+    try:
+        watchdog.sample()
+        watchdog.sample()
+        fds[0] = 1
+        watchdog.sample()
+        fds[0] = 10
+        watchdog.sample()
+    finally:
+        watchdog.stop()
+
+    assert len([w for w in warnings if OPEN_FDS in w]) == 2
@@ -0,0 +1,54 @@
+import pathlib
+import sys
+import threading
+
+import pytest
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from helpers.startup import StartupException, StartupPlan
+
+
+def test_stages_run_concurrently_in_dependency_order():
+    main_thread = threading.current_thread()
+    barrier = threading.Barrier(2, timeout=5)
+    threads = {}
+    reports = []
+
+    def background(name):
+        def stage():
+            threads[name] = threading.current_thread()
+            # Both background stages must be running at once to pass
+            barrier.wait()
+            return name
+
+        return stage
+
+    plan = StartupPlan()
+    plan.add_stage("oauth", background("oauth"), background=True)
+    plan.add_stage("profile", background("profile"), background=True)
+    plan.add_stage("window", lambda profile: f"window with {profile}", depends=("profile",))
+    plan.add_stage("broken", lambda: 1 / 0, background=True, required=False)
+
+    results = plan.run(lambda done, total, name: reports.append((done, total, name)))
+
+    assert results["window"] == "window with profile"
+    assert results["broken"] is None
+    assert threads["oauth"] is not main_thread
+    assert [done for done, _, _ in reports] == [1, 2, 3, 4]
+    assert reports[-1][1] == 4
+    assert reports.index(next(r for r in reports if r[2] == "window")) > reports.index(
+        next(r for r in reports if r[2] == "profile")
+    )
+
+
+def test_required_failure_and_unknown_dependency():
+    plan = StartupPlan()
+    plan.add_stage("window", lambda: 1 / 0)
+    with pytest.raises(StartupException):
+        plan.run()
+
+    plan = StartupPlan()
+    plan.add_stage("window", lambda theme: None, depends=("theme",))
+    with pytest.raises(StartupException):
+        plan.run()
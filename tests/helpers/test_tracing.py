@@ -0,0 +1,93 @@
+import json
+import pathlib
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from helpers.logger import TRACE_ID
+from helpers.tracing import STATUS_ERROR, FileSpanExporter, Tracer, submit_in_context
+from twitter_management.posting_pool import PostingPool
+
+
+class MemoryExporter:
+    def __init__(self):
+        self.spans = []
+        self.__lock = threading.Lock()
+
+    def export(self, span):
+        with self.__lock:
+            self.spans.append(span)
+
+    def by_name(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+def test_spans_nest_across_threads():
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter)
+
+    with tracer.span("outside"):
+        pass
+    assert exporter.spans == []
+
+    def script(path):
+        with tracer.span("script.run", **{"script.path": path}) as span:
+            span.set_attribute("process.exit_code", 0)
+            return TRACE_ID.get()
+
+    with tracer.trace("schedule.tick") as tick:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            trace_ids = [submit_in_context(pool, script, p).result() for p in ("a.py", "b.py")]
+        try:
+            with tracer.span("http.request"):
+                raise OSError("offline")
+        except OSError:
+            pass
+
+    assert TRACE_ID.get() is None
+    assert trace_ids == [tick.trace_id] * 2
+    scripts = exporter.by_name("script.run")
+    assert {span.parent_span_id for span in scripts} == {tick.span_id}
+    otlp = scripts[0].to_otlp()
+    assert otlp["traceId"] == tick.trace_id
+    assert {"key": "process.exit_code", "value": {"intValue": "0"}} in otlp["attributes"]
+    assert exporter.by_name("http.request")[0].status == STATUS_ERROR
+    assert exporter.spans[-1] is tick
+
+
+def test_posting_pool_records_wait_in_submitter_trace(monkeypatch):
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter)
+    monkeypatch.setattr("twitter_management.posting_pool.tracer", tracer)
+    pool = PostingPool(lambda account, content: TRACE_ID.get(), max_workers=1)
+
+    with tracer.trace("queue.tick") as tick:
+        future = pool.submit("first", "hello")
+    assert future.result(timeout=5) == tick.trace_id
+    pool.shutdown()
+
+    waits = exporter.by_name("posting.rate_limit_wait")
+    assert waits[0].parent_span_id == tick.span_id
+
+
+def test_file_exporter_appends_lines(tmp_path):
+    path = tmp_path / "logs" / "traces.jsonl"
+    tracer = Tracer(FileSpanExporter(str(path)))
+
+    for name in ("first", "second"):
+        with tracer.trace(name):
+            pass
+    # Line buffered, spans are readable before the file is closed
+    names = [
+        json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"]
+        for line in path.read_text().splitlines()
+    ]
+    assert names == ["first", "second"]
+
+    tracer.close()
+    with tracer.trace("third"):
+        pass
+    tracer.close()
+    assert len(path.read_text().splitlines()) == 3
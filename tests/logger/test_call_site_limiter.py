@@ -0,0 +1,105 @@
+import logging
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}")
+
+from src.helpers.logger import CallSiteLimiter, parse_log_rate_limits
+
+SITE = ("window.py", 10)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeats_are_summarized():
+    limiter = CallSiteLimiter(clock=FakeClock())
+
+    assert limiter.check(SITE, "window", "tick", logging.INFO) == (True, [])
+    assert limiter.check(SITE, "window", "tick", logging.INFO) == (False, [])
+    assert limiter.check(SITE, "window", "tick", logging.INFO) == (False, [])
+    assert limiter.check(SITE, "window", "done", logging.INFO) == (
+        True,
+        [(logging.INFO, "last message repeated 2 times")],
+    )
+
+
+def test_summary_keeps_severity_of_suppressed_messages():
+    clock = FakeClock()
+    limiter = CallSiteLimiter(max_messages=1, window=10, clock=clock)
+
+    assert limiter.check(SITE, "window", "failed", logging.WARN)[0]
+    assert not limiter.check(SITE, "window", "failed", logging.WARN)[0]
+    assert limiter.check(SITE, "window", "recovered", logging.DEBUG) == (
+        False,
+        [(logging.WARN, "last message repeated 1 times")],
+    )
+
+    clock.now = 10
+    assert limiter.check(SITE, "window", "tick", logging.DEBUG) == (
+        True,
+        [(logging.DEBUG, "suppressed 1 messages")],
+    )
+
+
+def test_rate_limit_per_window():
+    clock = FakeClock()
+    limiter = CallSiteLimiter(max_messages=2, window=10, clock=clock)
+
+    allowed = [limiter.check(SITE, "window", f"tick {i}", logging.INFO)[0] for i in range(4)]
+    assert allowed == [True, True, False, False]
+
+    clock.now = 10
+    assert limiter.check(SITE, "window", "tick 4", logging.INFO) == (
+        True,
+        [(logging.INFO, "suppressed 2 messages")],
+    )
+
+
+def test_first_error_is_kept():
+    limiter = CallSiteLimiter(max_messages=1, window=10, clock=FakeClock())
+
+    assert limiter.check(SITE, "window", "tick", logging.INFO)[0]
+    assert limiter.check(SITE, "window", "failed: a", logging.ERROR)[0]
+    assert limiter.check(SITE, "window", "failed: b", logging.ERROR)[0]
+    assert not limiter.check(SITE, "window", "tick", logging.INFO)[0]
+    assert not limiter.check(SITE, "window", "failed: a", logging.ERROR)[0]
+
+
+def test_module_configuration():
+    limiter = CallSiteLimiter(max_messages=1, window=10, clock=FakeClock())
+    limiter.configure("splash_screen", None)
+
+    assert limiter.check(SITE, "splash_screen", "progress", logging.INFO)[0]
+    assert limiter.check(SITE, "splash_screen", "progress", logging.INFO)[0]
+
+
+def test_parse_log_rate_limits():
+    assert parse_log_rate_limits("splash_screen=off, window=5/30,post_tweet=3,bad=x") == [
+        ("splash_screen", None, 60.0),
+        ("window", 5, 30.0),
+        ("post_tweet", 3, 60.0),
+    ]
+
+
+def test_quiet_site_burst_is_flushed():
+    clock = FakeClock()
+    limiter = CallSiteLimiter(max_messages=1, window=10, clock=clock)
+
+    for i in range(3):
+        limiter.check(SITE, "window", f"tick {i}", logging.WARN)
+    for _ in range(2):
+        limiter.check(SITE, "window", "tick 2", logging.WARN)
+    assert limiter.flush() == []
+
+    clock.now = 10
+    assert limiter.flush() == [
+        (SITE, logging.WARN, "suppressed 2 messages"),
+        (SITE, logging.WARN, "last message repeated 2 times"),
+    ]
+    assert limiter.flush(force=True) == []
@@ -0,0 +1,29 @@
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}")
+
+from src.helpers.log_tail import LogTail
+
+
+def test_tail_reads_only_appended_complete_lines(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_bytes(b"T=0.1 INFO -window-: started\nT=0.2 ERROR -window-: \x1b[31mboom\x1b[0m\nT=0.3 INF")
+    tail = LogTail(str(log), max_lines=3)
+
+    assert tail.poll() == [
+        ("INFO", "T=0.1 INFO -window-: started"),
+        ("ERROR", "T=0.2 ERROR -window-: boom"),
+    ]
+    assert tail.poll() == []
+
+    with open(log, "ab") as file:
+        file.write(b"O -window-: tick\ncontinued\n")
+    assert tail.poll() == [
+        ("INFO", "T=0.3 INFO -window-: tick"),
+        ("INFO", "continued"),
+    ]
+    assert len(tail.lines) == 3
+
+    log.write_bytes(b"T=0.0 DEBUG -logger-: restarted\n")
+    assert tail.poll() == [("DEBUG", "T=0.0 DEBUG -logger-: restarted")]
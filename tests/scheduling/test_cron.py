@@ -0,0 +1,80 @@
+import datetime
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from scheduling.cron import CronExpression, InvalidCronException, parse_field
+
+# Friday
+START = datetime.datetime(2030, 1, 4, 9, 0, 0)
+
+
+def test_fields_compile_to_bitsets():
+    assert parse_field("*/15", 0, 59, {}) == (1 << 0) | (1 << 15) | (1 << 30) | (1 << 45)
+    assert parse_field("1-3,5", 0, 59, {}) == 0b101110
+    assert CronExpression("0 0 * * 7").weekdays == 1
+
+    with pytest.raises(InvalidCronException):
+        CronExpression("61 * * * *")
+    with pytest.raises(InvalidCronException):
+        CronExpression("* * *")
+
+
+def test_weekdays_twice_a_day():
+    cron = CronExpression("30 8,17 * * MON-FRI")
+
+    fires = []
+    moment = START
+    for _ in range(3):
+        moment = cron.next_fire(moment)
+        fires.append(moment)
+
+    assert fires == [
+        datetime.datetime(2030, 1, 4, 17, 30),
+        datetime.datetime(2030, 1, 7, 8, 30),
+        datetime.datetime(2030, 1, 7, 17, 30),
+    ]
+    assert cron.matches(fires[0])
+    assert not cron.matches(datetime.datetime(2030, 1, 5, 8, 30))
+
+
+def test_day_of_month_or_weekday():
+    cron = CronExpression("0 12 13 * FRI")
+
+    assert cron.next_fire(START) == datetime.datetime(2030, 1, 4, 12, 0)
+    assert cron.next_fire(datetime.datetime(2030, 1, 4, 12, 0)) == datetime.datetime(2030, 1, 11, 12, 0)
+    assert cron.next_fire(datetime.datetime(2030, 1, 11, 12, 0)) == datetime.datetime(2030, 1, 13, 12, 0)
+
+
+def test_starred_day_field_is_combined_with_and():
+    # Odd days which are also Mondays, 2030-01-07 is an odd Monday
+    cron = CronExpression("0 9 */2 * 1")
+
+    assert cron.next_fire(START) == datetime.datetime(2030, 1, 7, 9, 0)
+    assert cron.next_fire(datetime.datetime(2030, 1, 7, 9, 0)) == datetime.datetime(2030, 1, 21, 9, 0)
+
+
+def test_week_range_ending_on_sunday():
+    assert CronExpression("0 9 * * MON-SUN").weekdays == 0b1111111
+    assert CronExpression("0 9 * * 5-7").weekdays == 0b1100001
+
+
+def test_vectorized_preview_matches_next_fire():
+    pytest.importorskip("numpy")
+    from scheduling.fire_times import compute_cron_fire_times
+
+    cron = CronExpression("*/20 9-10 * JAN SAT,SUN")
+    fire_times = compute_cron_fire_times(START, datetime.timedelta(days=7), cron)
+
+    expected = []
+    moment = START
+    while True:
+        moment = cron.next_fire(moment)
+        if moment >= START + datetime.timedelta(days=7):
+            break
+        expected.append(moment)
+
+    assert [value.astype(datetime.datetime) for value in fire_times] == expected
@@ -0,0 +1,77 @@
+import datetime
+import pathlib
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from scheduling.fire_times import (
+    FireTimesSummary,
+    compute_fire_times,
+    day_windows,
+    summarize_interval,
+)
+
+START = datetime.datetime(2030, 1, 1, 0, 0, 0)
+
+
+def test_seconds_and_minutes_must_both_match():
+    fire_times = compute_fire_times(
+        START, datetime.timedelta(hours=1), seconds=30, minutes=20
+    )
+
+    assert len(fire_times) == 3 * 2
+    assert fire_times[0].astype(datetime.datetime) == START
+    assert fire_times[1].astype(datetime.datetime) == START.replace(second=30)
+
+
+def test_days_use_day_of_month():
+    fire_times = compute_fire_times(
+        START, datetime.timedelta(days=10), seconds=1, minutes=1, hours=1, days=4
+    )
+    fire_days = {value.astype(datetime.datetime).day for value in fire_times}
+
+    assert fire_days == {4, 8}
+
+
+def test_summary_warnings():
+    dense = FireTimesSummary(
+        compute_fire_times(START, datetime.timedelta(days=1), seconds=10)
+    )
+    assert dense.max_per_day == 8640
+    assert len(dense.warnings) == 2
+
+    empty = FireTimesSummary(np.array([], dtype="datetime64[s]"))
+    assert empty.total == 0 and empty.warnings
+
+
+def test_fire_times_match_every_second_check():
+    start = START.replace(day=3, hour=22, minute=59, second=17)
+    horizon = datetime.timedelta(days=2, hours=3)
+    fire_times = compute_fire_times(start, horizon, seconds=15, minutes=7, hours=5, days=2)
+
+    expected = [
+        moment
+        for moment in (start + datetime.timedelta(seconds=i) for i in range(int(horizon.total_seconds())))
+        if moment.second % 15 == 0
+        and moment.minute % 7 == 0
+        and moment.hour % 5 == 0
+        and moment.day % 2 == 0
+    ]
+    assert [value.astype(datetime.datetime) for value in fire_times] == expected
+
+
+def test_summary_of_day_chunks_matches_whole_horizon():
+    start = START.replace(hour=13, minute=30)
+    horizon = datetime.timedelta(days=3)
+    whole = FireTimesSummary(compute_fire_times(start, horizon, minutes=20, hours=6))
+    chunked = summarize_interval(minutes=20, hours=6, horizon_days=3, start=start)
+
+    assert len(list(day_windows(start, horizon))) == 4
+    assert chunked.total == whole.total
+    assert chunked.next_fires == whole.next_fires
+    assert chunked.posts_per_day == whole.posts_per_day
+    assert chunked.min_gap == whole.min_gap
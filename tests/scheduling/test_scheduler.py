@@ -0,0 +1,113 @@
+import datetime
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from scheduling.scheduler import (
+    FIRE_ALL,
+    FIRE_ONCE,
+    SKIP,
+    Scheduler,
+    next_date_fire,
+    next_interval_fire,
+)
+
+START = datetime.datetime(2030, 1, 1, 0, 0, 0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_scheduler(policy):
+    clock = FakeClock()
+    scheduler = Scheduler(
+        lambda after: next_interval_fire(after, seconds=10),
+        policy=policy,
+        wall_clock=lambda: START.timestamp(),
+        monotonic_clock=clock,
+    )
+    return scheduler, clock
+
+
+def test_next_interval_fire_jumps_to_matching_fields():
+    assert next_interval_fire(START, seconds=30, minutes=20) == START.replace(second=30)
+    assert next_interval_fire(START.replace(second=30), minutes=20, seconds=30) == START.replace(minute=20)
+    assert next_interval_fire(START, days=4) == datetime.datetime(2030, 1, 4)
+    assert next_interval_fire(START, days=40) is None
+
+
+def test_on_time_fire():
+    scheduler, clock = make_scheduler(FIRE_ONCE)
+    clock.now = 10.2
+
+    fires = scheduler.poll()
+
+    assert [fire for fire, _ in fires] == [START.replace(second=10)]
+    assert scheduler.stats.missed == 0
+    assert scheduler.poll() == []
+
+
+def test_delay_with_lead_time():
+    scheduler, clock = make_scheduler(FIRE_ONCE)
+    clock.now = 2
+
+    assert scheduler.milliseconds_until_next() == 8000
+    assert scheduler.milliseconds_until_next(lead=5) == 3000
+    assert scheduler.milliseconds_until_next(lead=30) == 0
+
+
+def test_catch_up_policies():
+    for policy, expected in ((FIRE_ONCE, 1), (FIRE_ALL, 3), (SKIP, 0)):
+        scheduler, clock = make_scheduler(policy)
+        clock.now = 35
+
+        assert len(scheduler.poll()) == expected
+        assert scheduler.stats.missed == 3
+        assert scheduler.next_fire_time() == START.replace(second=40)
+
+
+def test_date_fire_finishes():
+    clock = FakeClock()
+    scheduler = Scheduler(
+        next_date_fire(START.replace(minute=1)),
+        wall_clock=lambda: START.timestamp(),
+        monotonic_clock=clock,
+    )
+    clock.now = 60.5
+
+    assert len(scheduler.poll()) == 1
+    assert scheduler.is_finished()
+
+
+def test_suspend_is_caught_up():
+    monotonic = FakeClock()
+    wall = FakeClock()
+    wall.now = START.timestamp()
+    scheduler = Scheduler(
+        lambda after: next_interval_fire(after, seconds=10),
+        policy=FIRE_ALL,
+        wall_clock=wall,
+        monotonic_clock=monotonic,
+    )
+
+    # Suspended for a minute, the monotonic clock only moved 5 seconds
+    monotonic.now = 5
+    wall.now += 65
+
+    fires = scheduler.poll()
+
+    assert [fire for fire, _ in fires] == [START.replace(second=s) for s in (10, 20, 30, 40, 50)] + [
+        START.replace(minute=1)
+    ]
+    assert scheduler.stats.missed == 6
+    assert scheduler.next_fire_time() == START.replace(minute=1, second=10)
+
+    monotonic.now = 10.5
+    wall.now += 5.5
+    assert [fire for fire, _ in scheduler.poll()] == [START.replace(minute=1, second=10)]
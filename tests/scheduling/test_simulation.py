@@ -0,0 +1,52 @@
+import datetime
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from scheduling.cron import CronExpression
+from scheduling.scheduler import FIRE_ALL, next_date_fire, schedule_next_fire
+from scheduling.simulation import EVENT_POST, EVENT_RENDER, simulate
+
+START = datetime.datetime(2030, 1, 1, 0, 0, 0)
+
+
+def test_month_of_daily_posts():
+    timeline = simulate(
+        schedule_next_fire(cron=CronExpression("0 9 */2 * *")),
+        START,
+        datetime.timedelta(days=31),
+        lambda fire: f"Post for {fire:%d.%m}",
+    )
+
+    posts = timeline.posts()
+    assert len(posts) == 16
+    assert posts[0].content == "Post for 01.01"
+    assert posts[-1].content == "Post for 31.01"
+    assert [event.kind for event in timeline.events[:2]] == [EVENT_RENDER, EVENT_POST]
+    assert all(event.lateness == 0 for event in posts)
+
+
+def test_timer_delay_and_single_date():
+    timeline = simulate(
+        schedule_next_fire(cron=CronExpression("*/30 * * * *")),
+        START,
+        datetime.timedelta(hours=2),
+        lambda fire: "tick",
+        policy=FIRE_ALL,
+        timer_delay=5,
+    )
+    assert len(timeline.posts()) == 4
+    assert all(event.lateness == 5 for event in timeline.posts())
+
+    timeline = simulate(
+        schedule_next_fire(days=2), START, datetime.timedelta(days=2), lambda fire: "tick"
+    )
+    # Interval fields match like cron fields, every second of an even day
+    assert len(timeline.posts()) == 24 * 60 * 60
+
+    date_time = START + datetime.timedelta(days=3)
+    timeline = simulate(
+        next_date_fire(date_time), START, datetime.timedelta(days=30), lambda fire: "once"
+    )
+    assert [event.at for event in timeline.posts()] == [date_time]
@@ -0,0 +1,61 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from scheduling.triggers import (
+    TRIGGER_ABOVE,
+    TRIGGER_CHANGE,
+    TriggerException,
+    ValueTrigger,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def feed(trigger, clock, samples):
+    fired = []
+    for at, value in samples:
+        clock.now = at
+        fired.append(trigger.update(value))
+    return fired
+
+
+def test_change_with_debounce_and_cooldown():
+    clock = FakeClock()
+    trigger = ValueTrigger(TRIGGER_CHANGE, debounce=5, cooldown=60, clock=clock)
+
+    fired = feed(
+        trigger,
+        clock,
+        [(0, "a"), (1, "b"), (3, "c"), (9, "c"), (20, "d"), (30, "d"), (80, "d"), (90, "d")],
+    )
+
+    # b flickers, c holds for debounce, d waits for the cool-down
+    assert fired == [False, False, False, True, False, False, True, False]
+
+
+def test_threshold_fires_on_crossing_only():
+    clock = FakeClock()
+    trigger = ValueTrigger(TRIGGER_ABOVE, threshold=100, clock=clock)
+
+    fired = feed(
+        trigger,
+        clock,
+        [(0, "90"), (1, "120"), (2, "130"), (3, "80"), (4, "101"), (5, "oops")],
+    )
+
+    assert fired == [False, True, False, False, True, False]
+
+
+def test_threshold_is_required():
+    with pytest.raises(TriggerException):
+        ValueTrigger(TRIGGER_ABOVE)
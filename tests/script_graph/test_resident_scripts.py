@@ -0,0 +1,66 @@
+import pathlib
+import sys
+import time
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from resident_scripts import ResidentScript, ResidentScriptManager, is_resident_script
+
+
+def write_script(tmp_path, body):
+    path = tmp_path / "resident.py"
+    path.write_text(body)
+    return str(path)
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+def test_resident_flag_is_read_without_running(tmp_path):
+    assert is_resident_script(write_script(tmp_path, "RESIDENT = True\nraise SystemExit(1)\n"))
+    assert not is_resident_script(write_script(tmp_path, "RESIDENT = False\n"))
+    assert not is_resident_script(str(tmp_path / "missing.py"))
+
+
+def test_latest_value_is_kept_and_crashed_script_restarted(tmp_path):
+    path = write_script(
+        tmp_path,
+        "import json\n"
+        "print('starting', flush=True)\n"
+        "for value in range(3):\n"
+        "    print(json.dumps({'value': value}), flush=True)\n"
+        "raise SystemExit(1)\n",
+    )
+    script = ResidentScript(path, min_restart_delay=0.01, max_restart_delay=0.01)
+    script.start()
+    try:
+        assert wait_for(lambda: script.restarts >= 2)
+        assert script.value() == 2
+    finally:
+        script.stop()
+
+
+def test_stop_without_wait_returns_before_script_exits(tmp_path):
+    path = write_script(
+        tmp_path,
+        "import json, signal, time\n"
+        "signal.signal(signal.SIGTERM, lambda *_: time.sleep(0.5) or exit(0))\n"
+        "print(json.dumps({'value': 'up'}), flush=True)\n"
+        "time.sleep(30)\n",
+    )
+    manager = ResidentScriptManager()
+    manager.start(path)
+    assert wait_for(lambda: manager.latest(path) == "up")
+
+    started = time.monotonic()
+    stopper = manager.stop(path, wait=False)
+    assert time.monotonic() - started < 0.3
+    assert not manager.is_running(path)
+    stopper.join(10)
+    assert not stopper.is_alive()
@@ -0,0 +1,93 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from script_graph import ScriptGraph, ScriptGraphException, read_consumed_variables
+
+
+def test_levels_follow_dependencies():
+    graph = ScriptGraph()
+    graph.add_script("summary", "summary.py", ["temp", "wind"])
+    graph.add_script("temp", "temp.py", [])
+    graph.add_script("wind", "wind.py", ["city"])
+    graph.add_script("city", "city.py", [])
+
+    assert graph.levels() == [["city", "temp"], ["wind"], ["summary"]]
+
+
+def test_cycle_is_detected():
+    graph = ScriptGraph()
+    graph.add_script("a", "a.py", ["b"])
+    graph.add_script("b", "b.py", ["a"])
+
+    with pytest.raises(ScriptGraphException):
+        graph.levels()
+
+
+def test_run_passes_upstream_values_and_runs_each_script_once():
+    calls = []
+
+    def run_fn(path, inputs):
+        calls.append(path)
+        return path[:-3] + "".join(inputs[key] for key in sorted(inputs))
+
+    graph = ScriptGraph()
+    graph.add_script("first", "a.py", [])
+    graph.add_script("second", "b.py", ["first"])
+    graph.add_script("third", "c.py", ["first", "second"])
+
+    values = graph.run(run_fn)
+
+    assert values == {"first": "a", "second": "ba", "third": "caba"}
+    assert sorted(calls) == ["a.py", "b.py", "c.py"]
+
+
+def test_read_consumed_variables(tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text('CONSUMES = ["temp", "wind"]\n\ndef perform_script(inputs):\n    return ""\n')
+
+    assert read_consumed_variables(str(script)) == ["temp", "wind"]
+
+    for invalid in ('"abc"', "[1, 2]", "len"):
+        script.write_text(f"CONSUMES = {invalid}\n")
+        with pytest.raises(ScriptGraphException):
+            read_consumed_variables(str(script))
+
+
+def test_run_only_required_variables_and_their_dependencies():
+    calls = []
+
+    def run_fn(path, inputs):
+        calls.append(path)
+        return path[:-3]
+
+    graph = ScriptGraph()
+    graph.add_script("city", "city.py", [])
+    graph.add_script("weather", "weather.py", ["city"])
+    graph.add_script("unused", "unused.py", [])
+
+    values = graph.run(run_fn, required={"weather"})
+
+    assert values == {"city": "city", "weather": "weather"}
+    assert "unused.py" not in calls
+
+
+def test_resolved_variables_are_not_run_again():
+    calls = []
+
+    def run_fn(path, inputs):
+        calls.append(path)
+        return path[:-3] + "".join(inputs[key] for key in sorted(inputs))
+
+    graph = ScriptGraph()
+    graph.add_script("city", "city.py", [])
+    graph.add_script("temp", "temp.py", ["city"])
+    graph.add_script("summary", "summary.py", ["temp"])
+
+    values = graph.run(run_fn, required=["summary"], resolved={"temp": "21"})
+
+    assert values == {"temp": "21", "summary": "summary21"}
+    assert calls == ["summary.py"]
@@ -0,0 +1,61 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from script_interpreter import (
+    default_interpreter,
+    precompile_script,
+    read_script_setting,
+    resolve_interpreter,
+    script_command,
+    script_interpreter,
+)
+
+
+def make_venv(directory):
+    executable = directory / "bin" / "python3"
+    executable.parent.mkdir(parents=True)
+    executable.write_text("")
+    return str(executable)
+
+
+def test_settings_are_read_without_running(tmp_path):
+    path = tmp_path / "script.py"
+    path.write_text('INTERPRETER = "venv"\nRESIDENT = True\nraise SystemExit(1)\n')
+
+    assert read_script_setting(str(path), "INTERPRETER") == "venv"
+    assert read_script_setting(str(path), "RESIDENT") is True
+    assert read_script_setting(str(path), "MISSING", []) == []
+
+
+def test_virtualenv_next_to_script_is_resolved(tmp_path):
+    executable = make_venv(tmp_path / "venv")
+    path = tmp_path / "script.py"
+    path.write_text('INTERPRETER = "venv"\n')
+
+    assert resolve_interpreter("venv", str(tmp_path)) == executable
+    assert script_interpreter(str(path)) == executable
+    assert resolve_interpreter("") == default_interpreter()
+    assert resolve_interpreter(str(tmp_path / "missing")) == default_interpreter()
+
+
+def test_precompiled_script_runs_with_its_source_name(tmp_path):
+    path = tmp_path / "script.py"
+    path.write_text("import os\nprint(os.path.basename(__file__), __name__)\n")
+
+    assert script_command(str(path)) == [default_interpreter(), str(path)]
+    assert precompile_script(str(path))
+
+    command = script_command(str(path))
+    assert command[1] == "-c"
+    result = subprocess.run(command, capture_output=True, text=True)
+    assert result.stdout.strip() == "script.py __main__"
+
+    # A changed script runs from source until it is compiled again
+    mtime = path.stat().st_mtime
+    path.write_text("print('changed')\n")
+    os.utime(path, (mtime + 10, mtime + 10))
+    assert script_command(str(path)) == [default_interpreter(), str(path)]
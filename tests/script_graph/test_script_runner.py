@@ -0,0 +1,36 @@
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from script_runner import evaluate_script
+
+SCRIPT = """import json, os
+inputs = json.loads(os.environ["SCRIPT_INPUTS"])
+os.makedirs(os.path.dirname(os.environ["SCRIPT_OUTPUT"]), exist_ok=True)
+with open(os.environ["SCRIPT_OUTPUT"] + ".txt", "w") as file:
+    file.write({value!r} + inputs.get("suffix", ""))
+"""
+
+
+def test_scripts_with_same_name_keep_their_own_output(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    first = tmp_path / "first" / "weather.py"
+    second = tmp_path / "second" / "weather.py"
+    for path, value in ((first, "sunny"), (second, "rainy")):
+        path.parent.mkdir()
+        path.write_text(SCRIPT.format(value=value))
+
+    assert evaluate_script(str(first), {"suffix": "!"}) == "sunny!"
+    assert evaluate_script(str(second), {}) == "rainy"
+    assert evaluate_script(str(first), {}) == "sunny"
+
+
+def test_failed_run_does_not_return_previous_value(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "weather.py"
+    script.write_text(SCRIPT.format(value="sunny"))
+    assert evaluate_script(str(script), {}) == "sunny"
+
+    script.write_text("raise SystemExit(1)\n")
+    assert evaluate_script(str(script), {}) is None
@@ -0,0 +1,41 @@
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+
+from script_runner import output_paths
+from script_watcher import ScriptWatcher
+
+
+def test_changed_script_is_reloaded_and_its_value_invalidated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    script = tmp_path / "temp.py"
+    # Scripts with inputs are not pre-warmed, so the cached value stays removed
+    script.write_text('CONSUMES = ["city"]\n')
+    cached = pathlib.Path(output_paths(str(script))[0])
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    cached.write_text("21")
+
+    reloaded = []
+    watcher = ScriptWatcher(debounce_ms=10, executor=ThreadPoolExecutor(max_workers=1))
+    watcher.scriptReloaded.connect(reloaded.append)
+    watcher.watch(str(script))
+
+    script.write_text('CONSUMES = ["city"]\nVALUE = 1\n')
+    os.utime(script)
+    deadline = time.monotonic() + 5
+    while not reloaded and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+
+    assert reloaded == [str(script)]
+    assert not cached.exists()
@@ -0,0 +1,47 @@
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from storage.duplicate_index import DuplicateIndex
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_duplicates_are_per_account_and_expire(tmp_path):
+    clock = FakeClock()
+    index = DuplicateIndex(str(tmp_path / "posts.db"), max_age=60, clock=clock)
+    index.record("first", "Hello  world!")
+
+    assert index.is_duplicate("first", "Hello world!")
+    assert not index.is_duplicate("second", "Hello world!")
+    assert index.vary("first", "Hello world!") == "Hello world! (2)"
+
+    long_content = "a" * 278 + " b"
+    index.record("first", long_content)
+    varied = index.vary("first", long_content)
+    assert varied == "a" * 276 + " (2)" and len(varied) == 280
+
+    clock.now += 61
+    assert not index.is_duplicate("first", "Hello world!")
+
+
+def test_index_is_bounded_and_persisted(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "posts.db")
+    index = DuplicateIndex(path, max_entries=2, clock=clock)
+    for number in range(3):
+        clock.now += 1
+        index.record("first", f"post {number}")
+    index.close()
+
+    index = DuplicateIndex(path, max_entries=2, clock=clock)
+    assert not index.is_duplicate("first", "post 0")
+    assert index.is_duplicate("first", "post 1")
+    assert index.is_duplicate("first", "post 2")
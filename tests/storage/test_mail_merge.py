@@ -0,0 +1,66 @@
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from storage.mail_merge import merge_file_into_queue, merge_into_queue
+from storage.tweet_queue import TweetQueue
+from twitter_management.tweet_parsers import compile_template, render_many
+
+
+def test_compiled_template_renders_and_reports_missing():
+    template = compile_template("{city}: {stats.temp:.1f}C {unknown}")
+
+    assert template.variables == {"city", "stats", "unknown"}
+    assert template.render({"city": "Wroclaw", "stats": {"temp": 3.14159}}) == (
+        "Wroclaw: 3.1C {unknown}",
+        ["unknown"],
+    )
+
+    rendered = list(render_many("Hi {name}", [{"name": "a"}, {}, {"name": "x" * 300}]))
+    assert [r.is_valid() for r in rendered] == [True, False, False]
+    assert rendered[2].too_long
+
+
+def test_merge_queues_valid_rows_spaced(tmp_path):
+    queue = TweetQueue(str(tmp_path / "queue.db"))
+    rows = ({"city": f"City {i}"} for i in range(5))
+
+    result = merge_into_queue("Hello {city}!", rows, queue, "default", start=100, spacing=60, batch_size=2)
+
+    assert result.queued == 5
+    assert [(t.text, t.scheduled_at) for t in queue.due("default", 220)] == [
+        ("Hello City 0!", 100),
+        ("Hello City 1!", 160),
+        ("Hello City 2!", 220),
+    ]
+
+
+def test_merge_file_flags_bad_rows(tmp_path):
+    source = tmp_path / "cities.csv"
+    source.write_text("city,temp\nWroclaw,3\nKrakow,\n")
+    queue = TweetQueue(str(tmp_path / "queue.db"))
+    result = merge_file_into_queue(str(source), "{city} {temp:>3}", queue, "default")
+
+    assert result.queued == 2
+    assert queue.count("default") == 2
+
+    result = merge_file_into_queue(str(source), "{city} {wind}", queue, "default")
+    assert result.queued == 0
+    assert result.missing == 2
+    assert result.errors[0] == (1, "Missing variables: ['wind']")
+
+
+def test_merge_rejects_rows_which_are_not_objects(tmp_path):
+    source = tmp_path / "cities.jsonl"
+    source.write_text('{"city": "Wroclaw"}\nnull\n["Krakow"]\n{"city": \n"Gdansk"\n{"city": "Poznan"}\n')
+    queue = TweetQueue(str(tmp_path / "queue.db"))
+
+    result = merge_file_into_queue(str(source), "Hello {city}!", queue, "default")
+
+    assert result.queued == 2
+    assert result.rejected == 4
+    assert [row for row, _ in result.errors] == [2, 3, 4, 5]
+    assert result.errors[0] == (2, "Row must be an object")
+    assert result.errors[2][1].startswith("Invalid JSON")
+    assert [t.text for t in queue.due("default", float("inf"))] == ["Hello Wroclaw!", "Hello Poznan!"]
@@ -0,0 +1,46 @@
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from storage.post_history import HISTORY_FAILED, HISTORY_POSTED, PostHistory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+def test_history_pages_newest_first(tmp_path):
+    history = PostHistory(str(tmp_path / "history.db"), clock=FakeClock())
+    for i in range(5):
+        history.record(
+            "first" if i % 2 else "second",
+            HISTORY_POSTED if i != 3 else HISTORY_FAILED,
+            f"tweet {i}",
+            variables={"n": i},
+            tweet_id=str(100 + i),
+            latency=0.5,
+        )
+
+    first_page = history.fetch(limit=2)
+    second_page = history.fetch(before=first_page[-1], limit=2)
+    last_page = history.fetch(before=second_page[-1], limit=2)
+
+    assert [e.content for e in first_page + second_page + last_page] == [
+        f"tweet {i}" for i in reversed(range(5))
+    ]
+    assert first_page[0].variables == {"n": 4}
+    assert first_page[0].tweet_id == "104"
+    assert history.count() == 5
+    assert history.count(account="first") == 2
+    assert [e.content for e in history.fetch(status=HISTORY_FAILED)] == ["tweet 3"]
+    assert [e.content for e in history.fetch(account="second", status=HISTORY_POSTED)] == [
+        "tweet 4",
+        "tweet 2",
+        "tweet 0",
+    ]
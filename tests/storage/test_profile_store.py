@@ -0,0 +1,108 @@
+import os
+import pathlib
+import sys
+import threading
+
+import pytest
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from storage.profile_store import ProfileStore, ProfileStoreException
+
+INI_CONTENT = """[Default]
+window_name = Twitter bot
+
+[Dimensions]
+window_width = 1000
+window_height = 500
+
+[Parameters]
+seconds = 20
+minutes = 0
+hours = 0
+days = 4
+date = 2030,1,2,3,4,5
+
+[Twitter area]
+content = Hello world!
+"""
+
+
+def test_profile_incremental_saves(tmp_path):
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    store.create_profile("weather", "Temp: {temp}")
+    store.save_schedule("weather", seconds=30, days=2)
+    store.save_scripts("weather", [("temp", "temp.py"), ("wind", "wind.py")])
+
+    profile = store.load_profile("weather")
+
+    assert profile.template == "Temp: {temp}"
+    assert profile.seconds == 30 and profile.days == 2 and profile.minutes is None
+    assert profile.scripts == [("temp", "temp.py"), ("wind", "wind.py")]
+
+    with pytest.raises(ProfileStoreException):
+        store.create_profile("weather")
+
+
+def test_migration_from_ini_runs_once(tmp_path):
+    ini = tmp_path / "window.ini"
+    ini.write_text(INI_CONTENT)
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+
+    assert store.migrate_from_ini(str(ini))
+    assert not store.migrate_from_ini(str(ini))
+
+    profile = store.load_profile(store.get_active_profile())
+    assert profile.template == "Hello world!"
+    assert profile.seconds == 20 and profile.days == 4 and profile.minutes is None
+    assert profile.date == "2030-01-02T03:04:05"
+    assert store.get_setting("window_width") == "1000"
+
+
+def test_migration_skips_invalid_numbers(tmp_path):
+    ini = tmp_path / "window.ini"
+    ini.write_text(
+        INI_CONTENT.replace("seconds = 20", "seconds =")
+        .replace("hours = 0", "hours = two")
+        .replace("date = 2030,1,2,3,4,5", "date = soon")
+    )
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+
+    assert store.migrate_from_ini(str(ini))
+
+    profile = store.load_profile(store.get_active_profile())
+    assert profile.seconds is None and profile.hours is None and profile.days == 4
+    assert profile.date is None
+    assert profile.template == "Hello world!"
+
+
+def test_account_tokens_survive_reopen(tmp_path):
+    path = str(tmp_path / "profiles.db")
+    store = ProfileStore(path)
+    store.save_account_tokens("work", "token", "secret")
+    store.save_account_tokens("work", "new token", "new secret")
+    store.save_account_tokens("bot", "bot token", "bot secret")
+    store.close()
+
+    store = ProfileStore(path)
+    assert store.load_account_tokens() == [
+        ("bot", "bot token", "bot secret"),
+        ("work", "new token", "new secret"),
+    ]
+    store.delete_account_tokens("bot")
+    assert [name for name, _, _ in store.load_account_tokens()] == ["work"]
+    if os.name == "posix":
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_store_opened_on_another_thread(tmp_path):
+    opened = []
+    opener = threading.Thread(
+        target=lambda: opened.append(ProfileStore(str(tmp_path / "profiles.db"), check_same_thread=False))
+    )
+    opener.start()
+    opener.join()
+
+    store = opened[0]
+    store.create_profile("weather")
+    assert store.list_profiles() == ["weather"]
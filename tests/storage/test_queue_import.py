@@ -0,0 +1,51 @@
+import datetime
+import json
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from storage.queue_import import import_queue
+from storage.tweet_queue import STATUS_POSTED, TweetQueue
+
+
+def test_csv_import_with_variables_and_validation(tmp_path):
+    source = tmp_path / "calendar.csv"
+    source.write_text(
+        "text,scheduled_at,city\n"
+        "Hello {city}!,2030-01-01T10:00:00,Wroclaw\n"
+        ",2030-01-01T11:00:00,Krakow\n"
+        '"Multi\nline",,\n'
+        "Bad date,yesterday,\n"
+    )
+    queue = TweetQueue(str(tmp_path / "queue.db"))
+
+    result = import_queue(str(source), queue, "default", batch_size=1)
+
+    assert result.imported == 2
+    assert result.rejected == 2
+    due = queue.due("default", datetime.datetime(2030, 1, 1, 10).timestamp())
+    assert [tweet.text for tweet in due] == ["Multi\nline", "Hello {city}!"]
+    assert due[1].variables == {"city": "Wroclaw"}
+
+
+def test_jsonl_import_reports_progress_and_marks(tmp_path):
+    source = tmp_path / "calendar.jsonl"
+    with open(source, "w") as file:
+        for number in range(2500):
+            file.write(json.dumps({"text": f"Post {number}"}) + "\n")
+        file.write("{broken\n")
+    queue = TweetQueue(str(tmp_path / "queue.db"))
+    reports = []
+
+    result = import_queue(
+        str(source), queue, "default", lambda *args: reports.append(args)
+    )
+
+    assert result.imported == 2500 and result.rejected == 1
+    assert [report[0] for report in reports] == [1000, 2000, 2500]
+    assert reports[-1][1] == reports[-1][2]
+
+    first = queue.due("default", 0, limit=1)[0]
+    queue.mark(first.id, STATUS_POSTED)
+    assert queue.count("default") == 2499
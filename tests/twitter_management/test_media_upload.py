@@ -0,0 +1,93 @@
+import email.parser
+import email.policy
+import json
+import pathlib
+import sys
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from twitter_management.media_upload import MediaUploader
+
+
+class FakeUploadHandler(BaseHTTPRequestHandler):
+    media = {}
+    commands = []
+    lock = threading.Lock()
+
+    def do_POST(self):
+        content_type = self.headers["Content-Type"]
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if content_type.startswith("multipart/form-data"):
+            message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+                f"Content-Type: {content_type}\r\n\r\n".encode() + body
+            )
+            fields = {
+                part.get_param("name", header="content-disposition"): part.get_payload(decode=True)
+                for part in message.iter_parts()
+            }
+            fields = {
+                key: value if key == "media" else value.decode()
+                for key, value in fields.items()
+            }
+        else:
+            fields = dict(urllib.parse.parse_qsl(body.decode()))
+
+        command = fields["command"]
+        with self.lock:
+            self.commands.append(command)
+            if command == "INIT":
+                media_id = str(len(self.media) + 1)
+                self.media[media_id] = {}
+                self.respond(202, {"media_id_string": media_id})
+            elif command == "APPEND":
+                segment = int(fields["segment_index"])
+                self.media[fields["media_id"]][segment] = fields["media"]
+                self.respond(204, None)
+            else:
+                self.respond(201, {"media_id_string": fields["media_id"], "expires_after_secs": 3600})
+
+    def respond(self, status, payload):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def upload_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeUploadHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/upload"
+    server.shutdown()
+
+
+def test_chunked_upload_and_cache(tmp_path, upload_url):
+    content = bytes(range(256)) * 40
+    media = tmp_path / "image.png"
+    media.write_bytes(content)
+
+    uploader = MediaUploader(
+        lambda account: requests.Session(), upload_url=upload_url, chunk_size=1000
+    )
+    media_id = uploader.upload(str(media), "default")
+
+    segments = FakeUploadHandler.media[media_id]
+    assert len(segments) == 11
+    assert b"".join(segments[index] for index in sorted(segments)) == content
+
+    commands = len(FakeUploadHandler.commands)
+    assert uploader.upload(str(media), "default") == media_id
+    assert len(FakeUploadHandler.commands) == commands
+    uploader.shutdown()
@@ -0,0 +1,119 @@
+import pathlib
+import sys
+import threading
+from concurrent.futures import wait
+
+import pytest
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from storage.tweet_queue import (
+    TweetQueue,
+    STATUS_PENDING,
+    STATUS_POSTING,
+    STATUS_POSTED,
+    STATUS_FAILED,
+)
+from twitter_management.posting_pool import PostingPool, RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limiter_refills_over_time():
+    clock = FakeClock()
+    limiter = RateLimiter(capacity=2, period=10, clock=clock)
+
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == 5
+
+    clock.now = 5
+    assert limiter.try_acquire() == 0
+
+
+def test_accounts_are_served_round_robin():
+    order = []
+    gate = threading.Event()
+
+    def post_fn(account, content):
+        gate.wait()
+        order.append(account)
+        return content
+
+    pool = PostingPool(post_fn, max_workers=1)
+    futures = [pool.submit("busy", i) for i in range(3)]
+    futures.append(pool.submit("quiet", 0))
+    gate.set()
+
+    assert [future.result(timeout=5) for future in futures] == [0, 1, 2, 0]
+    assert order.index("quiet") < 3
+    pool.shutdown()
+
+
+def test_shutdown_cancels_queued_posts():
+    started = threading.Event()
+    gate = threading.Event()
+
+    def post_fn(account, content):
+        started.set()
+        gate.wait(5)
+        return content
+
+    pool = PostingPool(post_fn, max_workers=1)
+    running = pool.submit("busy", 0)
+    started.wait(5)
+    queued = pool.submit("busy", 1)
+
+    stopper = threading.Thread(target=pool.shutdown)
+    stopper.start()
+    # Resolved while the running post still holds shutdown
+    assert wait([queued], timeout=5).done == {queued}
+    gate.set()
+    stopper.join(5)
+
+    assert running.result(timeout=5) == 0
+    assert queued.cancelled()
+
+
+def test_failed_post_leaves_queued_tweet_in_terminal_state(tmp_path):
+    pytest.importorskip("requests_oauthlib")
+    from twitter_management.post_tweet import read_post_result
+
+    def post_fn(account, content):
+        # e.g. a media upload answered with something other than JSON
+        raise ValueError("Expecting value: line 1 column 1 (char 0)")
+
+    queue = TweetQueue(str(tmp_path / "queue.db"))
+    queue.add_many("default", [("text", None, None)])
+    tweet = queue.due("default", 0)[0]
+    queue.mark(tweet.id, STATUS_POSTING)
+
+    pool = PostingPool(post_fn, max_workers=1)
+    future = pool.submit("account", {"text": tweet.text})
+    future.exception(timeout=5)
+    pool.shutdown()
+
+    tweet_id, error = read_post_result(future)
+    assert tweet_id is None
+    assert isinstance(error, ValueError)
+    queue.mark(tweet.id, STATUS_POSTED if error is None else STATUS_FAILED)
+    assert queue.count("default", STATUS_FAILED) == 1
+    assert queue.count("default", STATUS_POSTING) == 0
+
+
+def test_tweets_in_flight_are_pending_again_after_reopen(tmp_path):
+    path = str(tmp_path / "queue.db")
+    queue = TweetQueue(path)
+    queue.add_many("default", [("first", None, None), ("second", None, None)])
+    queue.mark(queue.due("default", 0)[0].id, STATUS_POSTING)
+    queue.close()
+
+    queue = TweetQueue(path)
+    assert queue.count("default", STATUS_POSTING) == 0
+    assert queue.count("default", STATUS_PENDING) == 2
@@ -0,0 +1,52 @@
+import pathlib
+import sys
+
+sys.path.append(f"{pathlib.Path().absolute()}/src")
+
+from twitter_management.tweet_parsers import parse_tweet, split_variables
+
+
+def test_split_variables():
+    used, unused, unbound = split_variables(
+        "It's {temp} in {city}, {missing}!", ["temp", "city", "weather"]
+    )
+
+    assert used == {"temp", "city"}
+    assert unused == {"weather"}
+    assert unbound == {"missing"}
+
+
+def test_parse_tweet_reports_not_found():
+    content, not_found = parse_tweet("It's {temp}", {"temp": "20C", "wind": "5"})
+
+    assert content == "It's 20C"
+    assert not_found == ["wind"]
+
+
+def test_structured_values_fill_many_placeholders():
+    values = {"weather": {"temp": 21.456, "wind": 3, "tags": ["sun", "warm"]}}
+
+    content, not_found = parse_tweet(
+        "{weather.temp:.1f}C, wind {weather.wind}, #{weather.tags.0} {weather.pressure}",
+        values,
+    )
+
+    assert content == "21.5C, wind 3, #sun {weather.pressure}"
+    assert not_found == ["weather.pressure"]
+    assert split_variables("{weather.temp:.1f}", ["weather"])[0] == {"weather"}
+
+
+def test_variable_names_with_spaces_and_dots_are_filled():
+    assert parse_tweet("{my var} ok", {"my var": "v"}) == ("v ok", [])
+    assert parse_tweet("{v1.2} {a:b}", {"v1.2": "x", "a:b": "y"}) == ("x y", [])
+
+    used, unused, unbound = split_variables("{my var} ok", ["my var"])
+    assert used == {"my var"} and not unused and not unbound
+
+
+def test_literal_braces_are_kept_as_text():
+    content = "Big {sale} today {} {temp}"
+
+    assert parse_tweet(content, {"temp": "20C"}) == ("Big {sale} today {} 20C", [])
+    used, unused, unbound = split_variables(content, ["temp"])
+    assert used == {"temp"} and not unused and unbound == {"sale"}